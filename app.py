@@ -1,8 +1,9 @@
 ﻿import streamlit as st
 # Import modul lokal
-from config import LABEL_MAP, LABEL_EMOJI
-from model_utils import load_assets, SentimentAnalyzer
+from config import LABEL_MAP, LABEL_EMOJI, MICRO_BATCH_ENABLED, REPLICA_POOL_SIZE, EXPLAIN_ENABLED
+from model_utils import load_assets, load_shadow, SentimentAnalyzer
 from preprocessing import TextPreprocessor
+from scheduler import MicroBatchScheduler
 from data_storage import get_data_manager
 from ui_components import (
     apply_custom_css,
@@ -24,7 +25,7 @@ def get_analyzer():
     Memuat dan menyimpan analyzer dalam cache untuk performa optimal
     
     Returns:
-        Tuple (SentimentAnalyzer atau None, error_message atau None)
+        Tuple (SentimentAnalyzer/MicroBatchScheduler atau None, error_message atau None)
     """
     model, tokenizer, error = load_assets()
     
@@ -32,7 +33,16 @@ def get_analyzer():
         return None, error
     
     preprocessor = TextPreprocessor()
-    analyzer = SentimentAnalyzer(model=model, tokenizer=tokenizer, preprocessor=preprocessor)
+    # Shadow model (jika SHADOW_MODEL_PATH diisi) dievaluasi di background,
+    # statistiknya disimpan melalui data layer
+    shadow = load_shadow(sink=get_data_manager().save_shadow_stats)
+    analyzer = SentimentAnalyzer(
+        model=model, tokenizer=tokenizer, preprocessor=preprocessor, shadow=shadow
+    )
+    
+    # Gabungkan request dari banyak sesi menjadi satu forward pass
+    if MICRO_BATCH_ENABLED:
+        analyzer = MicroBatchScheduler(analyzer, num_workers=REPLICA_POOL_SIZE)
     
     return analyzer, None
 
@@ -80,8 +90,12 @@ def main():
             st.warning("⚠️ Mohon masukkan komentar terlebih dahulu!")
         else:
             with st.spinner("🔄 Menganalisis sentimen..."):
-                # Prediksi menggunakan analyzer
-                result = analyzer.predict(input_text)
+                # Prediksi menggunakan analyzer (dengan trace untuk detail preprocessing),
+                # beserta kontribusi setiap kata jika EXPLAIN_ENABLED
+                if EXPLAIN_ENABLED:
+                    result = analyzer.explain(input_text, trace=True)
+                else:
+                    result = analyzer.predict(input_text, trace=True)
                 
                 # Simpan ke storage
                 data_manager.save_prediction(
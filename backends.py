@@ -0,0 +1,317 @@
+"""
+Backend inferensi untuk SentimentAnalyzer
+
+Setiap backend menerima matriks id int32 (N, MAX_LEN) dan mengembalikan
+matriks probabilitas (N, NUM_CLASSES). Tersedia backend Keras (TensorFlow),
+NumPy (numpy_backend) dan TFLite (termasuk varian kuantisasi float16/INT8).
+
+Penggunaan:
+    python backends.py export-tflite [--model models/Best_Oversampled_Model.keras]
+                                     [--output-dir models] [--batch-size 1]
+"""
+import os
+import argparse
+import threading
+import weakref
+from typing import Optional, Dict
+
+import numpy as np
+
+from config import (
+    MAX_LEN,
+    MODEL_PATH,
+    USE_GRAPH_INFERENCE,
+    TFLITE_MODEL_PATH,
+    TFLITE_NUM_THREADS
+)
+from numpy_backend import NumpyBiGRUModel
+
+# Varian kuantisasi yang didukung export_tflite
+TFLITE_VARIANTS = ("float32", "float16", "int8")
+
+
+# ==================== GRAPH INFERENCE (KERAS) ====================
+# Cache fungsi inferensi per objek model agar tracing hanya dilakukan sekali
+_inference_fn_cache = weakref.WeakKeyDictionary()
+
+
+def get_inference_fn(model):
+    """
+    Membungkus model dalam tf.function dengan input signature tetap
+    (None, MAX_LEN) int32, sehingga prediksi tidak melewati data adapter
+    dan step loop model.predict pada setiap panggilan
+
+    Args:
+        model: Model Keras
+
+    Returns:
+        Callable: padded_sequences (N, MAX_LEN) -> tf.Tensor probabilitas (N, NUM_CLASSES)
+    """
+    import tensorflow as tf
+
+    inference_fn = _inference_fn_cache.get(model)
+    if inference_fn is None:
+        # Weakref agar cache tidak menahan model tetap hidup
+        model_ref = weakref.ref(model)
+
+        @tf.function(input_signature=[tf.TensorSpec(shape=(None, MAX_LEN), dtype=tf.int32)])
+        def inference_fn(padded_sequences):
+            return model_ref()(padded_sequences, training=False)
+
+        _inference_fn_cache[model] = inference_fn
+    return inference_fn
+
+
+def warmup_inference_fn(model):
+    """
+    Melakukan tracing fungsi inferensi dengan input dummy agar
+    prediksi pertama tidak menanggung biaya tracing
+
+    Args:
+        model: Model Keras
+    """
+    get_inference_fn(model)(np.zeros((1, MAX_LEN), dtype=np.int32))
+
+
+# ==================== BACKEND INTERFACE ====================
+class InferenceBackend:
+    """
+    Antarmuka backend inferensi
+    """
+
+    name = "base"
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Menjalankan model pada matriks sequence yang sudah dipadding
+
+        Args:
+            padded_sequences: Numpy array int32 (N, MAX_LEN)
+            batch_size: Jumlah baris per forward pass (None: default backend)
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES)
+        """
+        raise NotImplementedError
+
+    def warmup(self):
+        """Menjalankan satu prediksi dummy agar inisialisasi tidak terjadi saat request pertama"""
+        self.predict(np.zeros((1, MAX_LEN), dtype=np.int32))
+
+
+class KerasBackend(InferenceBackend):
+    """
+    Backend Keras/TensorFlow (model .keras)
+    """
+
+    name = "keras"
+
+    def __init__(self, model, use_graph_inference: bool = USE_GRAPH_INFERENCE):
+        """
+        Args:
+            model: Model Keras
+            use_graph_inference: Gunakan tf.function alih-alih model.predict
+        """
+        self.model = model
+        self.use_graph_inference = use_graph_inference
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        if not self.use_graph_inference:
+            if batch_size is None:
+                return self.model.predict(padded_sequences, verbose=0)
+            return self.model.predict(padded_sequences, batch_size=batch_size, verbose=0)
+
+        inference_fn = get_inference_fn(self.model)
+        n = len(padded_sequences)
+        if batch_size is None or n <= batch_size:
+            return inference_fn(padded_sequences).numpy()
+
+        return np.concatenate([
+            inference_fn(padded_sequences[start:start + batch_size]).numpy()
+            for start in range(0, n, batch_size)
+        ])
+
+    def warmup(self):
+        if self.use_graph_inference:
+            warmup_inference_fn(self.model)
+
+
+class NumpyBackend(InferenceBackend):
+    """
+    Backend NumPy murni (NumpyBiGRUModel, tanpa TensorFlow)
+    """
+
+    name = "numpy"
+
+    def __init__(self, model: NumpyBiGRUModel):
+        """
+        Args:
+            model: Instance NumpyBiGRUModel
+        """
+        self.model = model
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        return self.model.predict(padded_sequences, batch_size=batch_size)
+
+
+def _load_tflite_interpreter(model_path: str, num_threads: Optional[int]):
+    """
+    Membuat TFLite interpreter dari runtime yang tersedia
+    (ai_edge_litert > tflite_runtime > tensorflow.lite)
+    """
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+
+    return Interpreter(model_path=model_path, num_threads=num_threads)
+
+
+class TFLiteBackend(InferenceBackend):
+    """
+    Backend TFLite untuk model hasil export_tflite (float32/float16/INT8)
+
+    Model diekspor dengan ukuran batch tetap, sehingga input dipecah per
+    batch tersebut dan chunk terakhir dipadding dengan baris nol.
+    """
+
+    name = "tflite"
+
+    def __init__(self, model_path: str = TFLITE_MODEL_PATH, num_threads: Optional[int] = TFLITE_NUM_THREADS):
+        """
+        Args:
+            model_path: Path file .tflite
+            num_threads: Jumlah thread interpreter (None: default runtime)
+        """
+        self.model_path = model_path
+        self.interpreter = _load_tflite_interpreter(model_path, num_threads)
+        self.interpreter.allocate_tensors()
+
+        input_details = self.interpreter.get_input_details()[0]
+        self._input_index = input_details['index']
+        self._output_index = self.interpreter.get_output_details()[0]['index']
+        self.batch_size = int(input_details['shape'][0])
+
+        # Interpreter TFLite tidak thread-safe
+        self._lock = threading.Lock()
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        padded_sequences = np.asarray(padded_sequences, dtype=np.int32)
+        n = len(padded_sequences)
+        step = self.batch_size
+        outputs = []
+
+        with self._lock:
+            for start in range(0, n, step):
+                chunk = padded_sequences[start:start + step]
+                rows = len(chunk)
+                if rows < step:
+                    chunk = np.vstack([chunk, np.zeros((step - rows, chunk.shape[1]), dtype=np.int32)])
+                self.interpreter.set_tensor(self._input_index, chunk)
+                self.interpreter.invoke()
+                outputs.append(self.interpreter.get_tensor(self._output_index)[:rows].copy())
+
+        return np.concatenate(outputs) if outputs else np.zeros((0, 0), dtype=np.float32)
+
+
+def create_backend(model, use_graph_inference: bool = USE_GRAPH_INFERENCE) -> InferenceBackend:
+    """
+    Membungkus model yang sudah diload ke backend yang sesuai
+
+    Args:
+        model: InferenceBackend, NumpyBiGRUModel, atau model Keras
+        use_graph_inference: Untuk model Keras, gunakan tf.function
+
+    Returns:
+        Instance InferenceBackend
+    """
+    if isinstance(model, InferenceBackend):
+        return model
+    if isinstance(model, NumpyBiGRUModel):
+        return NumpyBackend(model)
+    return KerasBackend(model, use_graph_inference)
+
+
+# ==================== EKSPOR TFLITE ====================
+def export_tflite(
+    model_path: str = MODEL_PATH,
+    output_dir: str = "models",
+    batch_size: int = 1,
+    variants: tuple = TFLITE_VARIANTS
+) -> Dict[str, str]:
+    """
+    Mengonversi model .keras ke TFLite dengan post-training quantization
+
+    - float32: tanpa kuantisasi (baseline)
+    - float16: bobot float16 (termasuk tabel embedding)
+    - int8: dynamic-range quantization, bobot INT8 dan aktivasi float
+
+    Args:
+        model_path: Path file .keras
+        output_dir: Direktori output (file model_<varian>.tflite)
+        batch_size: Ukuran batch tetap model TFLite
+        variants: Varian yang diekspor
+
+    Returns:
+        Dictionary varian -> path file .tflite
+    """
+    import tempfile
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(model_path)
+
+    # Shape statis diperlukan agar loop GRU bisa diturunkan ke op builtin TFLite
+    archive = tf.keras.export.ExportArchive()
+    archive.track(model)
+    archive.add_endpoint(
+        "serve",
+        lambda x: model(x, training=False),
+        input_signature=[tf.TensorSpec(shape=(batch_size, MAX_LEN), dtype=tf.int32)]
+    )
+
+    paths = {}
+    with tempfile.TemporaryDirectory() as saved_model_dir:
+        archive.write_out(saved_model_dir, verbose=False)
+
+        for variant in variants:
+            if variant not in TFLITE_VARIANTS:
+                raise ValueError(f"Varian TFLite tidak dikenal: {variant}")
+
+            converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir)
+            if variant in ("float16", "int8"):
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            if variant == "float16":
+                converter.target_spec.supported_types = [tf.float16]
+
+            path = os.path.join(output_dir, f"model_{variant}.tflite")
+            with open(path, "wb") as f:
+                f.write(converter.convert())
+            paths[variant] = path
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend inferensi Analisis Sentimen MBG")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_export = subparsers.add_parser("export-tflite", help="Ekspor model ke TFLite (float32/float16/int8)")
+    p_export.add_argument("--model", default=MODEL_PATH)
+    p_export.add_argument("--output-dir", default="models")
+    p_export.add_argument("--batch-size", type=int, default=1)
+    p_export.add_argument("--variants", nargs="+", default=list(TFLITE_VARIANTS), choices=TFLITE_VARIANTS)
+
+    args = parser.parse_args()
+
+    if args.command == "export-tflite":
+        paths = export_tflite(args.model, args.output_dir, args.batch_size, tuple(args.variants))
+        for variant, path in paths.items():
+            print(f"{variant:8s}: {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
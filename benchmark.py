@@ -0,0 +1,1462 @@
+"""
+Benchmark sederhana untuk komponen aplikasi Analisis Sentimen MBG
+
+Penggunaan:
+    python benchmark.py preprocess [--n 20000] [--repeat 5]
+    python benchmark.py tokenize [--n 20000] [--repeat 5]
+    python benchmark.py predict [--n 2000] [--batch-size 256]
+    python benchmark.py scheduler [--n 500] [--threads 16]
+    python benchmark.py latency [--n 300]
+    python benchmark.py numpy-backend [--n 2000] [--tolerance 1e-4]
+    python benchmark.py backends --csv data/heldout.csv [--text-column text] [--label-column label]
+    python benchmark.py startup [--module app] [--top 15]
+    python benchmark.py cache [--n 5000] [--unique 500]
+    python benchmark.py memory [--workers 1 4 8] [--modes keras numpy numpy-mmap]
+    python benchmark.py vocab [--n 20000]
+    python benchmark.py async [--n 20000] [--chunk-size 256]
+    python benchmark.py replicas [--backend keras] [--replicas 1 2 4] [--threads 1 2 4] [--clients 16]
+    python benchmark.py bucketing [--n 20000] [--csv data/heldout.csv] [--batch-size 256]
+    python benchmark.py explain [--n 200]
+    python benchmark.py shadow [--model models/candidate.keras] [--n 500] [--sample-rate 1.0]
+    python benchmark.py storage [--n 2000]
+    python benchmark.py sheets [--n 1000] [--latency 0.02] [--batch-sizes 1 10 100]
+    python benchmark.py history [--rows 200000] [--limit 100]
+    python benchmark.py feedback-stats [--rows 200000]
+    python benchmark.py sqlite [--rows 200000] [--writers 4] [--writes 500]
+    python benchmark.py cascade --csv data/heldout.csv [--label-column label] [--thresholds 0.8 0.9 0.95]
+"""
+import argparse
+import random
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from config import EXAMPLE_COMMENTS
+from labeled_data import read_labeled_csv
+
+
+# ==================== UTILITY FUNCTIONS ====================
+def make_corpus(n: int, seed: int = 42) -> List[str]:
+    """
+    Membuat korpus komentar sintetis yang menyerupai komentar media sosial
+    (URL, mention, hashtag, angka, singkatan)
+
+    Args:
+        n: Jumlah komentar
+        seed: Seed random agar hasil dapat direproduksi
+
+    Returns:
+        List komentar
+    """
+    rng = random.Random(seed)
+    noise = [
+        "https://t.co/abc123", "www.detik.com/mbg", "@prabowo", "#MBG", "#makanbergizigratis",
+        "yg", "gak", "gpp", "bgt", "mbg", "udh", "krn", "2025", "!!!", "??", "...", "😊", "👍"
+    ]
+    corpus = []
+    for _ in range(n):
+        words = rng.choice(EXAMPLE_COMMENTS).split()
+        for _ in range(rng.randint(0, 6)):
+            words.insert(rng.randint(0, len(words)), rng.choice(noise))
+        if rng.random() < 0.5:
+            words = [w.upper() if rng.random() < 0.1 else w for w in words]
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def time_it(func: Callable[[], object], repeat: int) -> float:
+    """
+    Menjalankan fungsi beberapa kali dan mengembalikan waktu terbaik (detik)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ==================== BENCHMARKS ====================
+def bench_preprocess(n: int, repeat: int):
+    """Membandingkan pipeline bertahap dengan TextPreprocessor.preprocess"""
+    from preprocessing import TextPreprocessor
+
+    preprocessor = TextPreprocessor()
+    corpus = make_corpus(n)
+
+    # Pastikan hasilnya identik sebelum mengukur kecepatan
+    for text in corpus:
+        expected = preprocessor.get_preprocessing_steps(text)['final']
+        if preprocessor.preprocess(text) != expected:
+            raise AssertionError(f"Hasil preprocessing berbeda untuk: {text!r}")
+
+    stepwise = time_it(
+        lambda: [preprocessor.get_preprocessing_steps(t)['final'] for t in corpus], repeat
+    )
+    fused = time_it(lambda: [preprocessor.preprocess(t) for t in corpus], repeat)
+
+    print(f"Preprocessing {n} komentar (best of {repeat}):")
+    print(f"  bertahap : {stepwise * 1000:8.1f} ms  ({stepwise / n * 1e6:6.2f} us/komentar)")
+    print(f"  fused    : {fused * 1000:8.1f} ms  ({fused / n * 1e6:6.2f} us/komentar)")
+    print(f"  speedup  : {stepwise / fused:.2f}x")
+
+
+def load_tokenizer():
+    """Memuat tokenizer pickle dari path default (dengan fallback)"""
+    import pickle
+    from config import TOKENIZER_PATH, TOKENIZER_PATH_FALLBACK
+
+    try:
+        with open(TOKENIZER_PATH, 'rb') as handle:
+            return pickle.load(handle)
+    except FileNotFoundError:
+        with open(TOKENIZER_PATH_FALLBACK, 'rb') as handle:
+            return pickle.load(handle)
+
+
+def bench_tokenize(n: int, repeat: int):
+    """
+    Membandingkan Keras texts_to_sequences + pad_sequences dengan VocabularyEncoder,
+    serta preprocess + encode dengan CompiledLexicon (teks mentah -> id)
+    """
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+    from config import MAX_LEN
+    from preprocessing import CompiledLexicon, default_preprocessor, get_encoder
+
+    tokenizer = load_tokenizer()
+    encoder = get_encoder(tokenizer)
+    lexicon = CompiledLexicon.load_or_build(default_preprocessor, tokenizer, cache_path=None)
+    raw_corpus = make_corpus(n)
+    corpus = [default_preprocessor.preprocess(t) for t in raw_corpus]
+
+    def keras_path():
+        return pad_sequences(
+            tokenizer.texts_to_sequences(corpus), maxlen=MAX_LEN, padding='post', truncating='post'
+        )
+
+    if not (encoder.encode_batch(corpus) == keras_path()).all():
+        raise AssertionError("Hasil VocabularyEncoder berbeda dengan Keras")
+
+    if not (lexicon.process_batch(raw_corpus)[1] == keras_path()).all():
+        raise AssertionError("Hasil CompiledLexicon berbeda dengan Keras")
+
+    keras_time = time_it(keras_path, repeat)
+    numpy_time = time_it(lambda: encoder.encode_batch(corpus), repeat)
+
+    def separate_path():
+        return encoder.encode_batch([default_preprocessor.preprocess(t) for t in raw_corpus])
+
+    separate_time = time_it(separate_path, repeat)
+    lexicon_time = time_it(lambda: lexicon.process_batch(raw_corpus), repeat)
+
+    print(f"Tokenize + pad {n} komentar (best of {repeat}):")
+    print(f"  keras    : {keras_time * 1000:8.1f} ms")
+    print(f"  numpy    : {numpy_time * 1000:8.1f} ms")
+    print(f"  speedup  : {keras_time / numpy_time:.2f}x")
+    print(f"Teks mentah -> id {n} komentar (best of {repeat}):")
+    print(f"  preprocess + encode : {separate_time * 1000:8.1f} ms")
+    print(f"  lexicon             : {lexicon_time * 1000:8.1f} ms")
+    print(f"  speedup             : {separate_time / lexicon_time:.2f}x")
+
+
+def load_analyzer(prediction_cache: bool = False):
+    """
+    Memuat SentimentAnalyzer dengan model dan tokenizer default
+
+    Args:
+        prediction_cache: Pertahankan cache prediksi dan cascade (default
+            dimatikan agar benchmark mengukur forward pass model)
+
+    Shadow model (SHADOW_MODEL_PATH) selalu dimatikan.
+    """
+    from model_utils import create_analyzer
+
+    analyzer, error = create_analyzer()
+    if error:
+        raise SystemExit(f"Gagal memuat model/tokenizer: {error}")
+    if analyzer.shadow is not None:
+        analyzer.shadow.close()
+        analyzer.shadow = None
+    if not prediction_cache:
+        analyzer.prediction_cache = None
+        analyzer.cascade = None
+    return analyzer
+
+
+def bench_predict(n: int, batch_size: int):
+    """Membandingkan predict per teks dengan predict_batch"""
+    analyzer = load_analyzer()
+    corpus = make_corpus(n)
+
+    # Warm-up agar inisialisasi model tidak ikut terukur
+    analyzer.predict(corpus[0])
+    analyzer.predict_batch(corpus[:batch_size], batch_size=batch_size)
+
+    start = time.perf_counter()
+    single = [analyzer.predict(text) for text in corpus]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = analyzer.predict_batch(corpus, batch_size=batch_size)
+    batch_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(single, batched) if a['label'] != b['label'])
+    max_diff = max(
+        abs(a['probabilities'][k] - b['probabilities'][k])
+        for a, b in zip(single, batched) for k in a['probabilities']
+    )
+
+    print(f"Prediksi {n} komentar (batch_size={batch_size}):")
+    print(f"  predict loop  : {single_time:8.2f} s  ({n / single_time:8.1f} komentar/s)")
+    print(f"  predict_batch : {batch_time:8.2f} s  ({n / batch_time:8.1f} komentar/s)")
+    print(f"  speedup       : {single_time / batch_time:.1f}x")
+    print(f"  label berbeda : {mismatches}, selisih probabilitas maks: {max_diff:.4f}%")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Persentil sederhana (nearest-rank) dari list nilai"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_concurrent(predict: Callable[[str], object], corpus: List[str], threads: int) -> tuple:
+    """
+    Menjalankan predict secara paralel dari beberapa thread
+
+    Returns:
+        Tuple (total waktu detik, list latency per request dalam detik)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def timed(text):
+        start = time.perf_counter()
+        predict(text)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(timed, corpus))
+    return time.perf_counter() - start, latencies
+
+
+def bench_scheduler(n: int, threads: int, max_batch_size: int, max_wait_ms: float):
+    """Membandingkan predict langsung dengan MicroBatchScheduler di bawah beban paralel"""
+    from scheduler import MicroBatchScheduler
+
+    analyzer = load_analyzer()
+    corpus = make_corpus(n)
+    analyzer.predict(corpus[0])
+
+    scheduler = MicroBatchScheduler(analyzer, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    scheduler.predict(corpus[0])
+
+    print(f"Prediksi {n} komentar dari {threads} thread:")
+    for name, predict in (("langsung", analyzer.predict), ("micro-batch", scheduler.predict)):
+        total, latencies = run_concurrent(predict, corpus, threads)
+        print(
+            f"  {name:12s}: {n / total:8.1f} komentar/s  "
+            f"p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+            f"p99 {percentile(latencies, 99) * 1000:7.1f} ms"
+        )
+
+    stats = scheduler.get_stats()
+    scheduler.close()
+    print(f"  max queue depth   : {stats['max_queue_depth']}")
+    print(f"  rata-rata batch   : {stats['avg_batch_size']}")
+    print(f"  histogram batch   : {stats['batch_size_histogram']}")
+
+
+def bench_latency(n: int):
+    """Latency per panggilan satu baris: model.predict vs fungsi graph (tf.function)"""
+    from backends import get_inference_fn, warmup_inference_fn
+    from preprocessing import tokenize_and_pad_batch
+
+    analyzer = load_analyzer()
+    padded = tokenize_and_pad_batch(
+        [analyzer.preprocessor.preprocess(t) for t in make_corpus(n)], analyzer.tokenizer
+    )
+    model = analyzer.model
+    warmup_inference_fn(model)
+    inference_fn = get_inference_fn(model)
+
+    paths = (
+        ("model.predict", lambda row: model.predict(row, verbose=0)),
+        ("tf.function", lambda row: inference_fn(row).numpy()),
+    )
+
+    print(f"Latency prediksi satu baris ({n} panggilan):")
+    for name, predict in paths:
+        predict(padded[:1])
+        latencies = []
+        for i in range(n):
+            row = padded[i:i + 1]
+            start = time.perf_counter()
+            predict(row)
+            latencies.append(time.perf_counter() - start)
+        print(
+            f"  {name:14s}: p50 {percentile(latencies, 50) * 1000:7.2f} ms  "
+            f"p99 {percentile(latencies, 99) * 1000:7.2f} ms"
+        )
+
+
+def bench_numpy_backend(n: int, batch_size: int, tolerance: float):
+    """Paritas dan kecepatan backend NumPy dibanding model Keras"""
+    import tempfile
+    import os
+    from config import MODEL_PATH
+    from numpy_backend import export_keras_to_npz, NumpyBiGRUModel
+    from preprocessing import tokenize_and_pad_batch
+
+    analyzer = load_analyzer()
+    padded = tokenize_and_pad_batch(
+        [analyzer.preprocessor.preprocess(t) for t in make_corpus(n)], analyzer.tokenizer
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        npz_path = export_keras_to_npz(MODEL_PATH, os.path.join(tmp_dir, "weights.npz"))
+        numpy_model = NumpyBiGRUModel.load(npz_path)
+
+    keras_probs = analyzer.model.predict(padded, batch_size=batch_size, verbose=0)
+    numpy_probs = numpy_model.predict(padded, batch_size=batch_size)
+    max_diff = float(abs(keras_probs - numpy_probs).max())
+    label_agreement = float((keras_probs.argmax(axis=1) == numpy_probs.argmax(axis=1)).mean())
+
+    keras_time = time_it(lambda: analyzer.model.predict(padded, batch_size=batch_size, verbose=0), 3)
+    numpy_time = time_it(lambda: numpy_model.predict(padded, batch_size=batch_size), 3)
+
+    print(f"Backend NumPy vs Keras ({n} komentar, batch_size={batch_size}):")
+    print(f"  selisih probabilitas maks : {max_diff:.2e} (toleransi {tolerance:.0e})")
+    print(f"  kesamaan label            : {label_agreement * 100:.2f}%")
+    print(f"  keras                     : {n / keras_time:8.1f} komentar/s")
+    print(f"  numpy                     : {n / numpy_time:8.1f} komentar/s")
+
+    if max_diff > tolerance:
+        raise AssertionError(f"Output backend NumPy melebihi toleransi: {max_diff:.2e}")
+
+
+def bench_backends(csv_path: str, text_column: str, label_column: Optional[str],
+                   tflite_dir: str, batch_size: int, latency_samples: int):
+    """
+    Laporan akurasi dan latency setiap backend inferensi pada CSV held-out,
+    dibandingkan dengan model Keras sebagai referensi
+    """
+    import os
+    import tempfile
+    from config import MODEL_PATH
+    from backends import KerasBackend, NumpyBackend, TFLiteBackend, TFLITE_VARIANTS
+    from numpy_backend import export_keras_to_npz, NumpyBiGRUModel
+
+    analyzer = load_analyzer()
+    texts, labels = read_labeled_csv(csv_path, text_column, label_column)
+    _, padded = analyzer.get_lexicon().process_batch(texts)
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    npz_path = export_keras_to_npz(MODEL_PATH, os.path.join(tmp_dir.name, "weights.npz"))
+
+    backends = [
+        ("keras", KerasBackend(analyzer.model), MODEL_PATH),
+        ("numpy", NumpyBackend(NumpyBiGRUModel.load(npz_path)), npz_path),
+    ]
+    for variant in TFLITE_VARIANTS:
+        path = os.path.join(tflite_dir, f"model_{variant}.tflite")
+        if os.path.exists(path):
+            backends.append((f"tflite-{variant}", TFLiteBackend(path), path))
+
+    reference = None
+    reference_accuracy = None
+    print(f"Laporan backend pada {csv_path} ({len(texts)} baris):")
+    print(f"  {'backend':16s} {'ukuran':>9s} {'akurasi':>8s} {'delta':>7s} {'setuju':>7s} "
+          f"{'p50 ms':>7s} {'p99 ms':>7s} {'baris/s':>9s}")
+
+    for name, backend, path in backends:
+        backend.warmup()
+        start = time.perf_counter()
+        probs = backend.predict(padded, batch_size)
+        throughput = len(padded) / (time.perf_counter() - start)
+        predicted = probs.argmax(axis=1)
+
+        latencies = []
+        for i in range(min(latency_samples, len(padded))):
+            start = time.perf_counter()
+            backend.predict(padded[i:i + 1])
+            latencies.append(time.perf_counter() - start)
+
+        if reference is None:
+            reference = predicted
+        agreement = (predicted == reference).mean() * 100
+
+        if labels is not None:
+            accuracy = (predicted == labels).mean() * 100
+            if reference_accuracy is None:
+                reference_accuracy = accuracy
+            accuracy_text = f"{accuracy:7.2f}%"
+            delta_text = f"{accuracy - reference_accuracy:+7.2f}"
+        else:
+            accuracy_text, delta_text = f"{'-':>8s}", f"{'-':>7s}"
+
+        print(
+            f"  {name:16s} {os.path.getsize(path) / 1024:7.0f}KB {accuracy_text} {delta_text} "
+            f"{agreement:6.2f}% {percentile(latencies, 50) * 1000:7.2f} "
+            f"{percentile(latencies, 99) * 1000:7.2f} {throughput:9.0f}"
+        )
+
+    tmp_dir.cleanup()
+
+
+def bench_cache(n: int, unique: int, seed: int = 42):
+    """
+    Prediksi satu per satu pada aliran komentar berulang (viral/copy-paste),
+    dengan dan tanpa cache prediksi
+    """
+    from prediction_cache import PredictionCache
+
+    analyzer = load_analyzer()
+    pool = make_corpus(unique, seed)
+    rng = random.Random(seed)
+    # Distribusi miring: sebagian kecil komentar muncul sangat sering
+    weights = [1 / (rank + 1) for rank in range(unique)]
+    stream = rng.choices(pool, weights=weights, k=n)
+    analyzer.predict(stream[0])
+
+    start = time.perf_counter()
+    uncached = [analyzer.predict(text) for text in stream]
+    uncached_time = time.perf_counter() - start
+
+    analyzer.prediction_cache = PredictionCache()
+    start = time.perf_counter()
+    cached = [analyzer.predict(text) for text in stream]
+    cached_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(uncached, cached) if a != b)
+    stats = analyzer.prediction_cache.get_stats()
+
+    print(f"Prediksi {n} komentar ({unique} teks mentah unik):")
+    print(f"  tanpa cache : {n / uncached_time:8.1f} komentar/s")
+    print(f"  dengan cache: {n / cached_time:8.1f} komentar/s")
+    print(f"  speedup     : {uncached_time / cached_time:.1f}x")
+    print(f"  hit rate    : {stats['hit_rate']}% ({stats['hits']} hit, {stats['misses']} miss, "
+          f"{stats['size']} entri)")
+    print(f"  hasil berbeda: {mismatches}")
+
+    if mismatches:
+        raise AssertionError("Hasil prediksi dengan cache berbeda dari tanpa cache")
+
+
+# Skrip yang dijalankan di proses baru untuk mengukur time-to-first-prediction
+_FIRST_PREDICTION_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from model_utils import create_analyzer
+imported = time.perf_counter()
+analyzer, error = create_analyzer()
+loaded = time.perf_counter()
+if error:
+    raise SystemExit(error)
+analyzer.predict("Program MBG sangat membantu anak sekolah")
+predicted = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "load_assets": loaded - imported,
+    "first_predict": predicted - loaded,
+}))
+"""
+
+
+def bench_startup(module: str, top: int):
+    """
+    Profil cold start: waktu import per modul (python -X importtime) dan
+    time-to-first-prediction, masing-masing di proses Python yang baru
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    local_modules = {name[:-3] for name in os.listdir(repo_dir) if name.endswith(".py")}
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=repo_dir, capture_output=True, text=True
+    )
+    import_wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+
+    # Format baris: "import time: self [us] | cumulative | imported package"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    top_level = sorted(
+        (t for t in timings if "." not in t[0] and not t[0].startswith("_")),
+        key=lambda t: t[2], reverse=True
+    )
+
+    print(f"Import '{module}' di proses baru: {import_wall * 1000:.0f} ms (wall)")
+    print("  Modul lokal (kumulatif):")
+    for name, _, cumulative_us in top_level:
+        if name in local_modules:
+            print(f"    {name:24s} {cumulative_us / 1000:8.1f} ms")
+    print(f"  Paket terberat (top {top}, kumulatif):")
+    for name, _, cumulative_us in [t for t in top_level if t[0] not in local_modules][:top]:
+        print(f"    {name:24s} {cumulative_us / 1000:8.1f} ms")
+    heavy = [name for name in ("tensorflow", "keras", "pandas", "plotly", "matplotlib") if any(t[0] == name for t in timings)]
+    print(f"  Dependensi berat yang ikut ter-import: {', '.join(heavy) if heavy else '-'}")
+
+    result = subprocess.run(
+        [sys.executable, "-c", _FIRST_PREDICTION_SCRIPT],
+        cwd=repo_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+
+    print("Time-to-first-prediction (proses baru):")
+    for phase, seconds in phases.items():
+        print(f"  {phase:14s}: {seconds * 1000:8.1f} ms")
+    print(f"  {'total':14s}: {sum(phases.values()) * 1000:8.1f} ms")
+
+
+def bench_async(n: int, chunk_size: int):
+    """
+    Aliran batch: predict_batch berurutan vs predict_many_async, di mana
+    preprocessing chunk berikutnya berjalan bersamaan dengan forward pass
+    """
+    analyzer = load_analyzer()
+    corpus = make_corpus(n)
+    chunks = [corpus[start:start + chunk_size] for start in range(0, n, chunk_size)]
+    analyzer.predict_many_async(chunks[0]).result()
+
+    start = time.perf_counter()
+    blocking = [result for chunk in chunks for result in analyzer.predict_batch(chunk)]
+    blocking_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    futures = [analyzer.predict_many_async(chunk) for chunk in chunks]
+    pipelined = [result for future in futures for result in future.result()]
+    async_time = time.perf_counter() - start
+    analyzer.close()
+
+    if [r['label'] for r in blocking] != [r['label'] for r in pipelined]:
+        raise AssertionError("Hasil predict_many_async berbeda dari predict_batch")
+
+    print(f"Prediksi {n} komentar dalam chunk {chunk_size}:")
+    print(f"  predict_batch berurutan : {n / blocking_time:8.1f} komentar/s")
+    print(f"  predict_many_async      : {n / async_time:8.1f} komentar/s")
+    print(f"  speedup                 : {blocking_time / async_time:.2f}x")
+
+
+def bench_explain(n: int, tolerance: float = 1e-5):
+    """
+    Penjelasan leave-one-token-out: satu forward pass batch (explain) vs
+    satu predict per varian, sekaligus memeriksa kontribusinya sama
+    """
+    from model_utils import occlusion_batch
+
+    analyzer = load_analyzer()
+    corpus = make_corpus(n)
+    lexicon = analyzer.get_lexicon()
+    analyzer.explain(corpus[0])
+
+    start = time.perf_counter()
+    explained = [analyzer.explain(text) for text in corpus]
+    batched_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    separate = []
+    for text in corpus:
+        batch = occlusion_batch(lexicon.process(text)[1])
+        separate.append(np.vstack([analyzer.backend.predict(row[None, :], None) for row in batch]))
+    separate_time = time.perf_counter() - start
+
+    forward_passes = sum(len(rows) for rows in separate)
+    max_diff = 0.0
+    for result, probabilities in zip(explained, separate):
+        expected = (probabilities[0] - probabilities[1:]) * 100
+        actual = [item['contributions'] for item in result['explanation'] if item['contributions']]
+        for row, contributions in zip(expected, actual):
+            max_diff = max(max_diff, float(np.max(np.abs(row - list(contributions.values())))))
+    if max_diff > tolerance * 100:
+        raise AssertionError(f"Kontribusi batch berbeda dari predict terpisah (selisih {max_diff:.2e} poin)")
+
+    print(f"Penjelasan {n} komentar ({forward_passes / n:.1f} varian/komentar):")
+    print(f"  satu predict per varian : {separate_time / n * 1000:8.2f} ms/komentar")
+    print(f"  explain (satu batch)    : {batched_time / n * 1000:8.2f} ms/komentar")
+    print(f"  speedup                 : {separate_time / batched_time:.2f}x")
+    print(f"  selisih maks            : {max_diff:.2e} poin persen")
+
+
+def bench_shadow(model_path: Optional[str], n: int, sample_rate: float, queue_size: int):
+    """
+    Latency request produksi tanpa dan dengan shadow model di background,
+    beserta statistik agreement/confusion dari shadow model
+    """
+    from config import MODEL_PATH
+    from backends import create_backend
+    from model_utils import load_model_file
+    from shadow import ShadowEvaluator
+
+    analyzer = load_analyzer()
+    corpus = make_corpus(n)
+    for text in corpus[:10]:
+        analyzer.predict(text)
+
+    def measure():
+        latencies = []
+        for text in corpus:
+            start = time.perf_counter()
+            analyzer.predict(text)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    baseline = measure()
+
+    model_path = model_path or MODEL_PATH
+    backend = create_backend(load_model_file(model_path))
+    backend.warmup()
+    shadow = ShadowEvaluator(backend, model_path, sample_rate=sample_rate, queue_size=queue_size)
+    analyzer.shadow = shadow
+    shadowed = measure()
+    shadow.close()
+    stats = shadow.get_stats()
+
+    print(f"Latency predict ({n} request, shadow {stats['shadow_model']}, sample rate {sample_rate}):")
+    for name, latencies in (("tanpa shadow", baseline), ("dengan shadow", shadowed)):
+        print(
+            f"  {name:13s}: p50 {percentile(latencies, 50) * 1000:7.2f} ms  "
+            f"p99 {percentile(latencies, 99) * 1000:7.2f} ms"
+        )
+    print(f"  disampel {stats['sampled']}, dibuang (antrian penuh) {stats['dropped']}, gagal {stats['failed']}")
+    print(f"  agreement       : {stats['agreement_rate']:.2f}% dari {stats['evaluated']} baris")
+    print(f"  latency produksi: {stats['primary_latency']}")
+    print(f"  latency shadow  : {stats['shadow_latency']}")
+    print("  confusion (baris produksi, kolom shadow):")
+    for label, row in stats['confusion'].items():
+        print(f"    {label:8s} " + "  ".join(f"{count:6d}" for count in row.values()))
+
+
+def bench_storage(n: int):
+    """
+    Latency DataManager.save_prediction: tulis langsung vs write-behind,
+    di direktori sementara (file data/ proyek tidak disentuh)
+    """
+    import os
+    import tempfile
+    from data_storage import DataManager, LOCAL_CSV_FILE
+
+    result = {
+        'label': 'Positif', 'confidence': 91.5,
+        'probabilities': {'Negatif': 3.0, 'Netral': 5.5, 'Positif': 91.5}
+    }
+    corpus = make_corpus(n)
+    original_dir = os.getcwd()
+
+    print(f"save_prediction {n} baris (Local CSV):")
+    try:
+        for write_behind in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                os.chdir(tmp)
+                manager = DataManager(write_behind=write_behind)
+                latencies = []
+                for text in corpus:
+                    start = time.perf_counter()
+                    manager.save_prediction(text, text.lower(), result)
+                    latencies.append(time.perf_counter() - start)
+                manager.flush()
+                with open(LOCAL_CSV_FILE, encoding='utf-8') as f:
+                    rows = sum(1 for _ in f) - 1
+                stats = manager.get_writer_stats()
+                if manager.writer is not None:
+                    manager.writer.close()
+                os.chdir(original_dir)
+
+            name = "write-behind" if write_behind else "langsung"
+            print(
+                f"  {name:12s}: p50 {percentile(latencies, 50) * 1e6:8.1f} us  "
+                f"p99 {percentile(latencies, 99) * 1e6:8.1f} us  total {sum(latencies) * 1000:8.1f} ms  "
+                f"({rows} baris tertulis{', ' + str(stats) if stats else ''})"
+            )
+            if rows != n:
+                raise AssertionError(f"Jumlah baris tertulis {rows} != {n}")
+    finally:
+        os.chdir(original_dir)
+
+
+def bench_sheets(n: int, latency: float, batch_sizes: List[int]):
+    """
+    Throughput GoogleSheetsStorage terhadap tests/fake_gspread.py (offline): baris/s
+    per ukuran batch append_rows, lalu skenario kuota 429 dengan backoff
+    """
+    from data_storage import GoogleSheetsStorage, prediction_row
+    from tests.fake_gspread import FakeSpreadsheet
+
+    result = {
+        'label': 'Netral', 'confidence': 60.0,
+        'probabilities': {'Negatif': 20.0, 'Netral': 60.0, 'Positif': 20.0}
+    }
+    rows = [prediction_row(text, text.lower(), result) for text in make_corpus(n)]
+
+    print(f"append {n} baris ke fake Google Sheets (latency {latency * 1000:.0f} ms/request):")
+    for batch_size in batch_sizes:
+        sheet = FakeSpreadsheet(latency=latency)
+        storage = GoogleSheetsStorage(sheet=sheet)
+        start = time.perf_counter()
+        for offset in range(0, n, batch_size):
+            storage.append_rows("predictions", rows[offset:offset + batch_size])
+        elapsed = time.perf_counter() - start
+        written = len(sheet.values("predictions"))
+        if written != n:
+            raise AssertionError(f"{written} baris tertulis, seharusnya {n}")
+        print(f"  batch {batch_size:5d}: {n / elapsed:9.1f} baris/s  {sheet.calls}")
+
+    # Kuota 10 request per 0.5 detik dengan batch kecil: request 429 dicoba ulang
+    sheet = FakeSpreadsheet(quota=10, quota_window=0.5)
+    storage = GoogleSheetsStorage(sheet=sheet, backoff_base=0.05, backoff_max=0.5, max_retries=8)
+    start = time.perf_counter()
+    ok = all(storage.append_rows("predictions", rows[offset:offset + 10]) for offset in range(0, min(n, 300), 10))
+    elapsed = time.perf_counter() - start
+    written = len(sheet.values("predictions"))
+    print(f"kuota 10 request/0.5 s, batch 10: {'OK' if ok else 'GAGAL'}, {written} baris dalam {elapsed:.2f} s, "
+          f"{sheet.throttled} request ditolak (429), {storage.get_stats()}")
+    if not ok or written != min(n, 300):
+        raise AssertionError("Retry/backoff tidak menulis semua baris")
+
+
+def bench_history(rows: int, limit: int, repeat: int = 5):
+    """
+    get_history: baca seluruh CSV (csv.DictReader) vs baca dari akhir file,
+    pada file sementara berisi komentar multi-baris ber-quote
+    """
+    import csv
+    import os
+    import tempfile
+    from data_storage import HISTORY_HEADERS, read_csv_tail
+
+    corpus = make_corpus(1000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sentiment_history.csv")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HISTORY_HEADERS)
+            for i in range(rows):
+                text = corpus[i % len(corpus)]
+                if i % 7 == 0:
+                    text = f'{text}\n"dikutip", baris kedua'
+                writer.writerow(["2025-01-01 00:00:00", text, text.lower(), "Positif", "90.00", "5.00", "5.00", "90.00"])
+        size_mb = os.path.getsize(path) / 1e6
+
+        def full_scan(offset):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                history = list(csv.DictReader(f))
+            return history[::-1][offset:offset + limit]
+
+        print(f"get_history(limit={limit}) pada {rows} baris ({size_mb:.1f} MB):")
+        for offset in (0, 10 * limit):
+            if read_csv_tail(path, limit, offset) != full_scan(offset):
+                raise AssertionError(f"Hasil baca dari akhir berbeda (offset {offset})")
+            full_time = time_it(lambda: full_scan(offset), repeat)
+            tail_time = time_it(lambda: read_csv_tail(path, limit, offset), repeat)
+            print(
+                f"  offset {offset:6d}: baca penuh {full_time * 1000:9.2f} ms  "
+                f"dari akhir {tail_time * 1000:7.2f} ms  speedup {full_time / tail_time:7.1f}x"
+            )
+
+
+def bench_feedback_stats(rows: int, repeat: int = 5):
+    """
+    get_feedback_stats: hitung ulang seluruh CSV vs counter inkremental
+    (FeedbackStats), termasuk append eksternal, record setengah tertulis,
+    sidecar yang dibaca proses baru dan file yang ditimpa
+    """
+    import csv
+    import os
+    import tempfile
+    from config import LABEL_MAP
+    from data_storage import FEEDBACK_HEADERS, FeedbackStats, feedback_row
+
+    labels = list(LABEL_MAP.values())
+    corpus = make_corpus(1000)
+    rng = random.Random(42)
+
+    def random_row(i):
+        text = corpus[i % len(corpus)]
+        if i % 7 == 0:
+            text = f'{text}\n"dikutip", baris kedua'
+        predicted = rng.choice(labels)
+        is_correct = rng.random() < 0.7
+        correct_label = None if is_correct else rng.choice([l for l in labels if l != predicted] + [None])
+        return feedback_row(text, predicted, is_correct, correct_label, "")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "user_feedback.csv")
+        sidecar = os.path.join(tmp, "user_feedback_stats.json")
+
+        def write(row_count, mode='w'):
+            with open(path, mode, newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if mode == 'w':
+                    writer.writerow(FEEDBACK_HEADERS)
+                writer.writerows(random_row(i) for i in range(row_count))
+
+        def full_scan():
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                feedbacks = list(csv.DictReader(f))
+            confusion = {p: {a: 0 for a in labels} for p in labels}
+            for row in feedbacks:
+                actual = row['predicted_label'] if row['is_correct'] == 'Ya' else row['correct_label']
+                if actual != '-':
+                    confusion[row['predicted_label']][actual] += 1
+            correct = sum(1 for row in feedbacks if row['is_correct'] == 'Ya')
+            return len(feedbacks), correct, confusion
+
+        def check(stats, step):
+            total, correct, confusion = full_scan()
+            if (stats["total"], stats["correct"], stats["confusion"]) != (total, correct, confusion):
+                raise AssertionError(f"Statistik inkremental berbeda dari hitung ulang ({step})")
+            if sum(stats["by_correct_label"].values()) != sum(sum(r.values()) for r in confusion.values()):
+                raise AssertionError(f"by_correct_label tidak konsisten ({step})")
+
+        write(rows)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"get_feedback_stats pada {rows} baris ({size_mb:.1f} MB):")
+
+        full_time = time_it(full_scan, repeat)
+        print(f"  hitung ulang penuh         {full_time * 1000:9.2f} ms")
+
+        stats = FeedbackStats(path, sidecar)
+        start = time.perf_counter()
+        result = stats.get()
+        print(f"  build awal (sekali)        {(time.perf_counter() - start) * 1000:9.2f} ms")
+        check(result, "build awal")
+
+        warm_time = time_it(stats.get, repeat)
+        print(f"  polling tanpa perubahan    {warm_time * 1000:9.3f} ms  speedup {full_time / warm_time:9.1f}x")
+
+        def append_and_get():
+            write(1, mode='a')
+            return stats.get()
+        append_time = time_it(append_and_get, repeat)
+        check(stats.get(), "append")
+        print(f"  append 1 baris + polling   {append_time * 1000:9.3f} ms  speedup {full_time / append_time:9.1f}x")
+
+        # Record setengah tertulis (writer lain belum selesai) tidak dihitung dulu
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            f.write('2025-01-01 00:00:00,"komentar\nbelum selesai')
+        partial = stats.get()
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            f.write('",Positif,Ya,-,\r\n')
+        check(stats.get(), "record setengah tertulis")
+        if stats.get()["total"] != partial["total"] + 1:
+            raise AssertionError("Record setengah tertulis salah dihitung")
+
+        # Proses baru: counter dibaca dari sidecar tanpa membaca CSV
+        fresh = FeedbackStats(path, sidecar)
+        start = time.perf_counter()
+        result = fresh.get()
+        print(f"  proses baru (sidecar)      {(time.perf_counter() - start) * 1000:9.3f} ms")
+        check(result, "sidecar")
+
+        # File ditimpa dengan isi lain (lebih panjang): counter dibangun ulang
+        write(rows + 10)
+        check(stats.get(), "file ditimpa")
+        write(rows // 2)
+        check(stats.get(), "file dipotong")
+        print("  append, record parsial, sidecar, file ditimpa/dipotong: identik dengan hitung ulang")
+
+
+def _sqlite_writer(db_path: str, worker: int, writes: int):
+    """Proses penulis untuk bench_sqlite: satu append_rows per prediksi"""
+    from data_storage import SQLiteStorage
+
+    storage = SQLiteStorage(db_path)
+    result = {'label': "Netral", 'confidence': 50.0, 'probabilities': {'Negatif': 25.0, 'Netral': 50.0, 'Positif': 25.0}}
+    for i in range(writes):
+        if not storage.save_prediction(f"worker {worker} baris {i}", "", result):
+            raise RuntimeError(f"Penulis {worker} gagal pada baris {i}")
+    storage.close()
+
+
+def bench_sqlite(rows: int, writers: int, writes: int, repeat: int = 5):
+    """
+    SQLiteStorage: impor CSV sekali, query terfilter (index) vs scan CSV penuh,
+    dan beberapa proses penulis bersamaan pada satu database WAL
+    """
+    import csv
+    import multiprocessing
+    import os
+    import tempfile
+    from datetime import datetime, timedelta
+    from config import LABEL_MAP
+    from data_storage import HISTORY_HEADERS, SQLiteStorage
+
+    labels = list(LABEL_MAP.values())
+    corpus = make_corpus(1000)
+    base = datetime(2025, 1, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "sentiment_history.csv")
+        db_path = os.path.join(tmp, "sentiment.db")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HISTORY_HEADERS)
+            for i in range(rows):
+                text = f"{corpus[i % len(corpus)]} #{i}"
+                if i % 7 == 0:
+                    text = f'{text}\n"dikutip", baris kedua'
+                timestamp = (base + timedelta(seconds=30 * i)).strftime("%Y-%m-%d %H:%M:%S")
+                confidence = f"{40 + (i * 37) % 60:.2f}"
+                writer.writerow([timestamp, text, text.lower(), labels[i % 3], confidence, "10.00", "10.00", "80.00"])
+        size_mb = os.path.getsize(csv_path) / 1e6
+
+        storage = SQLiteStorage(db_path)
+        start = time.perf_counter()
+        imported = storage.import_csv("predictions", csv_path)
+        import_time = time.perf_counter() - start
+        if imported != rows or storage.import_csv("predictions", csv_path) != 0:
+            raise AssertionError("Impor CSV tidak tepat satu kali")
+        print(f"Impor {rows} baris CSV ({size_mb:.1f} MB): {import_time:.2f} s ({rows / import_time:,.0f} baris/s)")
+
+        def scan(predicate, limit=100):
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                matches = [row for row in csv.DictReader(f) if predicate(row)]
+            matches.sort(key=lambda row: row['timestamp'], reverse=True)
+            return [row['original_text'] for row in matches[:limit]]
+
+        target = f"{corpus[1234 % len(corpus)]} #1234"
+        day_start = (base + timedelta(days=10)).strftime("%Y-%m-%d")
+        day_end = (base + timedelta(days=11)).strftime("%Y-%m-%d")
+        queries = [
+            ("100 terbaru", {}, lambda row: True),
+            ("label Negatif", {'label': "Negatif"}, lambda row: row['predicted_label'] == "Negatif"),
+            ("rentang 1 hari", {'start': day_start, 'end': day_end},
+             lambda row: day_start <= row['timestamp'] < day_end),
+            ("teks sama", {'text': target}, lambda row: row['original_text'] == target),
+            ("label + confidence >= 90", {'label': "Positif", 'min_confidence': 90},
+             lambda row: row['predicted_label'] == "Positif" and float(row['confidence']) >= 90)
+        ]
+        print("Query history (limit 100):")
+        for name, filters, predicate in queries:
+            expected = scan(predicate)
+            if [row['original_text'] for row in storage.query_history(**filters)] != expected:
+                raise AssertionError(f"Hasil query SQLite berbeda dari scan CSV ({name})")
+            scan_time = time_it(lambda: scan(predicate), 1)
+            query_time = time_it(lambda: storage.query_history(**filters), repeat)
+            print(
+                f"  {name:26s} scan CSV {scan_time * 1000:8.1f} ms  SQLite {query_time * 1000:7.3f} ms  "
+                f"speedup {scan_time / query_time:8.1f}x"
+            )
+
+        # Penulis bersamaan: semua baris harus tersimpan utuh
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=_sqlite_writer, args=(db_path, w, writes)) for w in range(writers)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+        if any(process.exitcode != 0 for process in processes):
+            raise AssertionError("Ada proses penulis yang gagal")
+        for w in range(writers):
+            written = storage.query_history(text=f"worker {w} baris {writes - 1}", limit=1)
+            count = storage._connection().execute(
+                "SELECT COUNT(*) FROM predictions WHERE original_text LIKE ?", (f"worker {w} baris %",)
+            ).fetchone()[0]
+            if count != writes or not written:
+                raise AssertionError(f"Baris penulis {w} hilang ({count}/{writes})")
+        print(
+            f"{writers} proses x {writes} save_prediction bersamaan: {writers * writes} baris utuh "
+            f"dalam {elapsed:.2f} s (termasuk start proses)"
+        )
+        storage.close()
+
+
+def make_mixed_length_corpus(n: int, seed: int = 42) -> List[str]:
+    """
+    Korpus dengan distribusi panjang berekor panjang: sebagian besar komentar
+    pendek, sebagian kecil gabungan beberapa komentar (mendekati MAX_LEN)
+    """
+    rng = random.Random(seed)
+    pool = make_corpus(n, seed)
+    corpus = []
+    for text in pool:
+        parts = [text]
+        while rng.random() < 0.35 and len(parts) < 8:
+            parts.append(rng.choice(pool))
+        corpus.append(" ".join(parts))
+    return corpus
+
+
+def bench_bucketing(n: int, csv_path: Optional[str], text_column: str, batch_size: int):
+    """
+    Backend NumPy: forward pass lebar penuh (MAX_LEN) vs bucketing panjang,
+    untuk model apa adanya dan varian mask_zero dengan bobot yang sama
+    """
+    import os
+    import tempfile
+    from config import MODEL_PATH
+    from numpy_backend import export_keras_to_npz, NumpyBiGRUModel, sequence_lengths
+    from preprocessing import CompiledLexicon, default_preprocessor, load_vocabulary
+
+    if csv_path:
+        texts, _ = read_labeled_csv(csv_path, text_column, None)
+    else:
+        texts = make_mixed_length_corpus(n)
+    lexicon = CompiledLexicon.load_or_build(default_preprocessor, load_vocabulary())
+    _, padded = lexicon.process_batch(texts)
+    lengths = sequence_lengths(padded)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        npz_path = export_keras_to_npz(MODEL_PATH, os.path.join(tmp_dir, "weights.npz"))
+        model = NumpyBiGRUModel.load(npz_path, mmap=False)
+
+    masked_spec = [dict(layer) for layer in model.spec]
+    embedding = next(layer for layer in masked_spec if layer["type"] == "Embedding")
+    models = [(f"mask_zero={embedding['mask_zero']}", model)]
+    if not embedding["mask_zero"]:
+        embedding["mask_zero"] = True
+        models.append(("mask_zero=True", NumpyBiGRUModel(masked_spec, model.weights)))
+
+    p50, p90, p99 = (int(np.percentile(lengths, q)) for q in (50, 90, 99))
+    print(f"Bucketing panjang ({len(texts)} teks, batch_size={batch_size}, MAX_LEN={padded.shape[1]}):")
+    print(f"  panjang token p50 {p50}, p90 {p90}, p99 {p99}, maks {lengths.max()}")
+    for name, numpy_model in models:
+        full = numpy_model.predict(padded, batch_size, bucketing=False)
+        bucketed = numpy_model.predict(padded, batch_size, bucketing=True)
+        max_diff = float(np.abs(full - bucketed).max())
+        full_time = time_it(lambda: numpy_model.predict(padded, batch_size, bucketing=False), 3)
+        bucketed_time = time_it(lambda: numpy_model.predict(padded, batch_size, bucketing=True), 3)
+        print(
+            f"  {name:15s}: lebar penuh {len(texts) / full_time:8.0f} teks/s, "
+            f"bucketing {len(texts) / bucketed_time:8.0f} teks/s ({full_time / bucketed_time:.2f}x), "
+            f"selisih maks {max_diff:.1e}"
+        )
+        if max_diff > 1e-5:
+            raise AssertionError(f"Hasil bucketing berbeda dari lebar penuh ({name})")
+
+
+def bench_cascade(csv_path: str, text_column: str, label_column: Optional[str],
+                  model_path: str, thresholds: List[float], batch_size: int):
+    """
+    Cascade klasifier linear + Bi-GRU pada CSV validasi: persentase baris per
+    tahap, kesesuaian dengan model penuh, akurasi (jika ada label) dan throughput
+    """
+    from cascade import CascadeClassifier, HashedLinearClassifier
+
+    analyzer = load_analyzer()
+    texts, labels = read_labeled_csv(csv_path, text_column, label_column)
+    _, padded = analyzer.get_lexicon().process_batch(texts)
+    first_stage = HashedLinearClassifier.load(model_path)
+
+    full = analyzer.predict_proba(padded, batch_size)
+    full_labels = full.argmax(axis=1)
+    full_time = time_it(lambda: analyzer.predict_proba(padded, batch_size), 3)
+
+    print(f"Cascade pada {csv_path} ({len(texts)} baris), model penuh {len(texts) / full_time:.0f} baris/s"
+          + (f", akurasi {(full_labels == labels).mean() * 100:.2f}%" if labels is not None else ""))
+    print(f"  {'threshold':>9s} {'tahap 1':>8s} {'Bi-GRU':>7s} {'setuju':>7s} {'akurasi':>8s} "
+          f"{'baris/s':>9s} {'speedup':>8s}")
+
+    for threshold in thresholds:
+        cascade = CascadeClassifier(first_stage, threshold)
+        predicted = cascade.predict(padded, analyzer.predict_proba, batch_size).argmax(axis=1)
+        stats = cascade.get_stats()
+        cascade_time = time_it(lambda: cascade.predict(padded, analyzer.predict_proba, batch_size), 3)
+
+        accuracy = f"{(predicted == labels).mean() * 100:7.2f}%" if labels is not None else f"{'-':>8s}"
+        print(
+            f"  {threshold:9.3g} {stats['first_stage_pct']:7.2f}% {100 - stats['first_stage_pct']:6.2f}% "
+            f"{(predicted == full_labels).mean() * 100:6.2f}% {accuracy} "
+            f"{len(texts) / cascade_time:9.0f} {full_time / cascade_time:7.2f}x"
+        )
+
+
+# Satu konfigurasi sweep replika, dijalankan di proses baru karena thread
+# pool TensorFlow hanya bisa diatur sebelum inisialisasi
+_REPLICA_SWEEP_SCRIPT = """
+import json, sys, time
+backend, size, threads, clients, n, request_size = sys.argv[1], *map(int, sys.argv[2:7])
+from benchmark import make_corpus, run_concurrent, percentile
+from model_utils import SentimentAnalyzer
+from preprocessing import load_vocabulary
+from replica_pool import create_replica_pool
+pool = create_replica_pool(size, threads, backend)
+pool.warmup()
+analyzer = SentimentAnalyzer(model=pool, tokenizer=load_vocabulary())
+analyzer.prediction_cache = None
+corpus = make_corpus(n * request_size)
+requests = [corpus[i:i + request_size] for i in range(0, len(corpus), request_size)]
+predict = analyzer.predict_batch if request_size > 1 else (lambda texts: analyzer.predict(texts[0]))
+run_concurrent(predict, requests[:clients * 2], clients)
+total, latencies = run_concurrent(predict, requests, clients)
+print(json.dumps({
+    "throughput": len(corpus) / total,
+    "p50": percentile(latencies, 50),
+    "p99": percentile(latencies, 99),
+    "waits": pool.get_stats()["waits"],
+}))
+"""
+
+
+def bench_replicas(backend: str, replica_counts: List[int], thread_counts: List[int],
+                   clients: int, n: int, request_size: int):
+    """
+    Sweep jumlah replika x thread per replika di bawah beban paralel,
+    masing-masing konfigurasi di proses baru
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    print(f"Sweep replika backend {backend} ({os.cpu_count()} core, {clients} client, "
+          f"{n} request x {request_size} teks):")
+    print(f"  {'replika':>7s} {'thread':>6s} {'teks/s':>9s} {'p50 ms':>8s} {'p99 ms':>8s} {'tunggu':>7s}")
+
+    for size in replica_counts:
+        for threads in thread_counts:
+            result = subprocess.run(
+                [sys.executable, "-c", _REPLICA_SWEEP_SCRIPT, backend,
+                 str(size), str(threads), str(clients), str(n), str(request_size)],
+                cwd=repo_dir, capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                raise SystemExit(result.stderr.strip().splitlines()[-1])
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            print(
+                f"  {size:7d} {threads:6d} {stats['throughput']:9.1f} {stats['p50'] * 1000:8.1f} "
+                f"{stats['p99'] * 1000:8.1f} {stats['waits']:7d}"
+            )
+
+
+# Worker untuk harness memori: memuat model, prediksi, lalu menunggu diukur
+_MEMORY_WORKER_SCRIPT = """
+import sys
+mode, npz_path = sys.argv[1], sys.argv[2]
+from model_utils import SentimentAnalyzer
+analyzer = SentimentAnalyzer()
+analyzer.load_tokenizer()
+if mode == "keras":
+    analyzer.load_model()
+else:
+    from numpy_backend import NumpyBiGRUModel
+    analyzer.model = NumpyBiGRUModel.load(npz_path, mmap=(mode == "numpy-mmap"))
+analyzer.predict_batch(["Program MBG sangat membantu anak sekolah"] * 256)
+print("ready", flush=True)
+sys.stdin.readline()
+"""
+
+
+def read_memory_kb(pid: int) -> dict:
+    """
+    RSS, PSS (shared dibagi rata antar proses) dan shared memory sebuah proses
+    dari /proc/<pid>/smaps_rollup (Linux)
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
+
+
+def bench_memory(worker_counts: List[int], modes: List[str]):
+    """
+    Memori per proses dan total untuk N proses worker yang masing-masing
+    memuat model. RSS menghitung halaman bersama di setiap proses, PSS
+    membaginya rata sehingga total PSS mendekati pemakaian memori sebenarnya.
+    """
+    import os
+    import subprocess
+    import sys
+    import tempfile
+    from config import MODEL_PATH
+    from numpy_backend import export_keras_to_npz
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        raise SystemExit("Harness memori membutuhkan /proc/<pid>/smaps_rollup (Linux)")
+
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    tmp_dir = tempfile.TemporaryDirectory()
+    npz_path = export_keras_to_npz(MODEL_PATH, os.path.join(tmp_dir.name, "weights.npz"))
+
+    print(f"Memori worker (bobot .npz {os.path.getsize(npz_path) / 1024:.0f} KB):")
+    print(f"  {'mode':11s} {'worker':>6s} {'RSS/proses':>11s} {'PSS/proses':>11s} "
+          f"{'shared':>9s} {'total RSS':>10s} {'total PSS':>10s}")
+
+    for mode in modes:
+        for count in worker_counts:
+            workers = [
+                subprocess.Popen(
+                    [sys.executable, "-c", _MEMORY_WORKER_SCRIPT, mode, npz_path],
+                    cwd=repo_dir, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL, text=True
+                )
+                for _ in range(count)
+            ]
+            try:
+                for worker in workers:
+                    if worker.stdout.readline().strip() != "ready":
+                        raise SystemExit(f"Worker mode '{mode}' gagal memuat model")
+                usage = [read_memory_kb(worker.pid) for worker in workers]
+            finally:
+                for worker in workers:
+                    worker.communicate("\n")
+
+            total_rss = sum(u["rss"] for u in usage) / 1024
+            total_pss = sum(u["pss"] for u in usage) / 1024
+            print(
+                f"  {mode:11s} {count:6d} {total_rss / count:9.1f}MB {total_pss / count:9.1f}MB "
+                f"{sum(u['shared'] for u in usage) / count / 1024:7.1f}MB "
+                f"{total_rss:8.1f}MB {total_pss:8.1f}MB"
+            )
+
+    tmp_dir.cleanup()
+
+
+# Worker untuk benchmark vocab: waktu load dan kenaikan RSS di proses baru
+_VOCAB_LOAD_SCRIPT = """
+import json, sys, time
+def rss_kb():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+kind, path = sys.argv[1], sys.argv[2]
+import numpy, preprocessing
+before = rss_kb()
+start = time.perf_counter()
+if kind == "pickle":
+    import pickle
+    with open(path, "rb") as handle:
+        tokenizer = pickle.load(handle)
+    encoder = preprocessing.get_encoder(tokenizer)
+else:
+    encoder = preprocessing.VocabularyEncoder.load(path)
+elapsed = time.perf_counter() - start
+print(json.dumps({"load": elapsed, "rss_kb": rss_kb() - before}))
+"""
+
+
+def bench_vocab(n: int):
+    """
+    Tokenizer.pickle vs vocabulary JSON: ukuran file, waktu load dan kenaikan
+    RSS di proses baru, serta paritas hasil encode
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+    import tempfile
+    from preprocessing import VocabularyEncoder, default_preprocessor, get_encoder
+
+    tokenizer = load_tokenizer()
+    pickle_encoder = get_encoder(tokenizer)
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    vocab_path = pickle_encoder.save(os.path.join(tmp_dir.name, "tokenizer_vocab.json"))
+    vocab_encoder = VocabularyEncoder.load(vocab_path)
+
+    corpus = [default_preprocessor.preprocess(t) for t in make_corpus(n)]
+    # Tambahkan kata di luar VOCAB_SIZE agar pemetaan OOV ikut diuji
+    corpus += [" ".join(w for w, i in tokenizer.word_index.items() if i >= pickle_encoder.num_words)]
+    if not (pickle_encoder.encode_batch(corpus) == vocab_encoder.encode_batch(corpus)).all():
+        raise AssertionError("Hasil encode vocabulary JSON berbeda dari tokenizer.pickle")
+
+    from config import TOKENIZER_PATH
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    print(f"Tokenizer: paritas encode {len(corpus)} teks OK")
+    print(f"  {'format':8s} {'ukuran':>9s} {'load':>10s} {'RSS +':>9s}")
+    for kind, path in (("pickle", TOKENIZER_PATH), ("json", vocab_path)):
+        result = subprocess.run(
+            [sys.executable, "-c", _VOCAB_LOAD_SCRIPT, kind, os.path.abspath(path)],
+            cwd=repo_dir, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise SystemExit(result.stderr.strip().splitlines()[-1])
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        print(
+            f"  {kind:8s} {os.path.getsize(path) / 1024:7.1f}KB {stats['load'] * 1000:8.1f}ms "
+            f"{stats['rss_kb'] / 1024:7.1f}MB"
+        )
+
+    tmp_dir.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Analisis Sentimen MBG")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_pre = subparsers.add_parser("preprocess", help="Pipeline preprocessing teks")
+    p_pre.add_argument("--n", type=int, default=20000)
+    p_pre.add_argument("--repeat", type=int, default=5)
+
+    p_tok = subparsers.add_parser("tokenize", help="Tokenisasi dan padding")
+    p_tok.add_argument("--n", type=int, default=20000)
+    p_tok.add_argument("--repeat", type=int, default=5)
+
+    p_pred = subparsers.add_parser("predict", help="Prediksi per teks vs batch")
+    p_pred.add_argument("--n", type=int, default=2000)
+    p_pred.add_argument("--batch-size", type=int, default=256)
+
+    p_sched = subparsers.add_parser("scheduler", help="Micro-batching request paralel")
+    p_sched.add_argument("--n", type=int, default=500)
+    p_sched.add_argument("--threads", type=int, default=16)
+    p_sched.add_argument("--max-batch-size", type=int, default=32)
+    p_sched.add_argument("--max-wait-ms", type=float, default=5)
+
+    p_lat = subparsers.add_parser("latency", help="Latency prediksi satu baris")
+    p_lat.add_argument("--n", type=int, default=300)
+
+    p_np = subparsers.add_parser("numpy-backend", help="Paritas dan kecepatan backend NumPy")
+    p_np.add_argument("--n", type=int, default=2000)
+    p_np.add_argument("--batch-size", type=int, default=256)
+    p_np.add_argument("--tolerance", type=float, default=1e-4)
+
+    p_back = subparsers.add_parser("backends", help="Akurasi dan latency setiap backend pada CSV held-out")
+    p_back.add_argument("--csv", required=True)
+    p_back.add_argument("--text-column", default="text")
+    p_back.add_argument("--label-column", default="label")
+    p_back.add_argument("--tflite-dir", default="models")
+    p_back.add_argument("--batch-size", type=int, default=256)
+    p_back.add_argument("--latency-samples", type=int, default=200)
+
+    p_start = subparsers.add_parser("startup", help="Profil cold start (import & prediksi pertama)")
+    p_start.add_argument("--module", default="app")
+    p_start.add_argument("--top", type=int, default=15)
+
+    p_cache = subparsers.add_parser("cache", help="Cache prediksi pada komentar berulang")
+    p_cache.add_argument("--n", type=int, default=5000)
+    p_cache.add_argument("--unique", type=int, default=500)
+
+    p_mem = subparsers.add_parser("memory", help="RSS/PSS per proses untuk beberapa worker")
+    p_mem.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    p_mem.add_argument("--modes", nargs="+", default=["keras", "numpy", "numpy-mmap"],
+                       choices=["keras", "numpy", "numpy-mmap"])
+
+    p_vocab = subparsers.add_parser("vocab", help="Tokenizer.pickle vs vocabulary JSON")
+    p_vocab.add_argument("--n", type=int, default=20000)
+
+    p_async = subparsers.add_parser("async", help="predict_batch berurutan vs predict_many_async")
+    p_async.add_argument("--n", type=int, default=20000)
+    p_async.add_argument("--chunk-size", type=int, default=256)
+
+    p_rep = subparsers.add_parser("replicas", help="Sweep jumlah replika x thread per replika")
+    p_rep.add_argument("--backend", default="keras", choices=["keras", "numpy", "tflite"])
+    p_rep.add_argument("--replicas", type=int, nargs="+", default=[1, 2, 4])
+    p_rep.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    p_rep.add_argument("--clients", type=int, default=16)
+    p_rep.add_argument("--n", type=int, default=800)
+    p_rep.add_argument("--request-size", type=int, default=1)
+
+    p_bucket = subparsers.add_parser("bucketing", help="Bucketing panjang sequence (backend NumPy)")
+    p_bucket.add_argument("--n", type=int, default=20000)
+    p_bucket.add_argument("--csv", default=None)
+    p_bucket.add_argument("--text-column", default="text")
+    p_bucket.add_argument("--batch-size", type=int, default=256)
+
+    p_explain = subparsers.add_parser("explain", help="Penjelasan leave-one-token-out batch vs per varian")
+    p_explain.add_argument("--n", type=int, default=200)
+
+    p_shadow = subparsers.add_parser("shadow", help="Overhead latency dan agreement shadow model")
+    p_shadow.add_argument("--model", default=None, help="Default: MODEL_PATH (model produksi sendiri)")
+    p_shadow.add_argument("--n", type=int, default=500)
+    p_shadow.add_argument("--sample-rate", type=float, default=1.0)
+    p_shadow.add_argument("--queue-size", type=int, default=256)
+
+    p_storage = subparsers.add_parser("storage", help="save_prediction langsung vs write-behind")
+    p_storage.add_argument("--n", type=int, default=2000)
+
+    p_sheets = subparsers.add_parser("sheets", help="Batching dan backoff Google Sheets (fake gspread, offline)")
+    p_sheets.add_argument("--n", type=int, default=1000)
+    p_sheets.add_argument("--latency", type=float, default=0.02)
+    p_sheets.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100])
+
+    p_hist = subparsers.add_parser("history", help="get_history: baca penuh vs baca dari akhir file")
+    p_hist.add_argument("--rows", type=int, default=200000)
+    p_hist.add_argument("--limit", type=int, default=100)
+
+    p_fstats = subparsers.add_parser("feedback-stats", help="get_feedback_stats: hitung ulang vs counter inkremental")
+    p_fstats.add_argument("--rows", type=int, default=200000)
+
+    p_sqlite = subparsers.add_parser("sqlite", help="SQLiteStorage: impor CSV, query terindeks, penulis bersamaan")
+    p_sqlite.add_argument("--rows", type=int, default=200000)
+    p_sqlite.add_argument("--writers", type=int, default=4)
+    p_sqlite.add_argument("--writes", type=int, default=500)
+
+    p_casc = subparsers.add_parser("cascade", help="Cascade klasifier linear + Bi-GRU pada CSV validasi")
+    p_casc.add_argument("--csv", required=True)
+    p_casc.add_argument("--text-column", default="text")
+    p_casc.add_argument("--label-column", default="label")
+    p_casc.add_argument("--model", default=None, help="Default: CASCADE_MODEL_PATH")
+    p_casc.add_argument("--thresholds", type=float, nargs="+", default=[0.7, 0.8, 0.9, 0.95])
+    p_casc.add_argument("--batch-size", type=int, default=256)
+
+    args = parser.parse_args()
+
+    if args.command == "preprocess":
+        bench_preprocess(args.n, args.repeat)
+    elif args.command == "tokenize":
+        bench_tokenize(args.n, args.repeat)
+    elif args.command == "predict":
+        bench_predict(args.n, args.batch_size)
+    elif args.command == "scheduler":
+        bench_scheduler(args.n, args.threads, args.max_batch_size, args.max_wait_ms)
+    elif args.command == "latency":
+        bench_latency(args.n)
+    elif args.command == "numpy-backend":
+        bench_numpy_backend(args.n, args.batch_size, args.tolerance)
+    elif args.command == "backends":
+        bench_backends(
+            args.csv, args.text_column, args.label_column or None,
+            args.tflite_dir, args.batch_size, args.latency_samples
+        )
+    elif args.command == "startup":
+        bench_startup(args.module, args.top)
+    elif args.command == "cache":
+        bench_cache(args.n, args.unique)
+    elif args.command == "memory":
+        bench_memory(args.workers, args.modes)
+    elif args.command == "vocab":
+        bench_vocab(args.n)
+    elif args.command == "async":
+        bench_async(args.n, args.chunk_size)
+    elif args.command == "replicas":
+        bench_replicas(args.backend, args.replicas, args.threads, args.clients, args.n, args.request_size)
+    elif args.command == "bucketing":
+        bench_bucketing(args.n, args.csv, args.text_column, args.batch_size)
+    elif args.command == "explain":
+        bench_explain(args.n)
+    elif args.command == "shadow":
+        bench_shadow(args.model, args.n, args.sample_rate, args.queue_size)
+    elif args.command == "storage":
+        bench_storage(args.n)
+    elif args.command == "sheets":
+        bench_sheets(args.n, args.latency, args.batch_sizes)
+    elif args.command == "history":
+        bench_history(args.rows, args.limit)
+    elif args.command == "feedback-stats":
+        bench_feedback_stats(args.rows)
+    elif args.command == "sqlite":
+        bench_sqlite(args.rows, args.writers, args.writes)
+    elif args.command == "cascade":
+        from config import CASCADE_MODEL_PATH
+        bench_cascade(
+            args.csv, args.text_column, args.label_column or None,
+            args.model or CASCADE_MODEL_PATH, args.thresholds, args.batch_size
+        )
+
+
+if __name__ == "__main__":
+    main()
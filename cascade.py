@@ -0,0 +1,362 @@
+"""
+Cascade dua tahap: klasifier linear bag-of-words (hashing) sebagai tahap
+pertama, model Bi-GRU sebagai fallback
+
+Tahap pertama bekerja langsung pada sequence id hasil tokenisasi: fitur
+unigram adalah id kata, fitur bigram di-hash ke HASH_BUCKETS bucket. Jika
+probabilitas tertinggi tahap pertama >= threshold, hasilnya langsung dipakai;
+selain itu baris diteruskan ke model neural.
+
+Penggunaan:
+    python cascade.py train --csv data/sentiment_history.csv [--text-column original_text]
+                            [--label-column LABEL] [--feedback data/user_feedback.csv]
+                            [--output models/cascade_linear.npz]
+
+Tanpa --label-column, target diambil dari probabilitas model Bi-GRU (distilasi).
+"""
+import os
+import csv
+import argparse
+import threading
+from typing import Optional, Callable, Dict, Any
+
+import numpy as np
+
+from config import (
+    VOCAB_SIZE,
+    NUM_CLASSES,
+    LABEL_MAP,
+    CASCADE_ENABLED,
+    CASCADE_MODEL_PATH,
+    CASCADE_THRESHOLD
+)
+
+# Jumlah bucket hashing untuk bigram id kata
+HASH_BUCKETS = 2 ** 16
+# Konstanta hashing bigram (bilangan prima)
+_BIGRAM_PRIME = 1000003
+
+
+class HashedLinearClassifier:
+    """
+    Regresi logistik multinomial atas fitur bag-of-words (unigram id +
+    bigram ter-hash) dari matriks sequence (N, MAX_LEN)
+    """
+
+    def __init__(
+        self,
+        weights: Optional[np.ndarray] = None,
+        bias: Optional[np.ndarray] = None,
+        vocab_size: int = VOCAB_SIZE,
+        hash_buckets: int = HASH_BUCKETS
+    ):
+        """
+        Args:
+            weights: Matriks bobot (vocab_size + hash_buckets + 1, NUM_CLASSES);
+                baris terakhir adalah fitur kosong (selalu nol)
+            bias: Vektor bias (NUM_CLASSES,)
+            vocab_size: Jumlah id unigram
+            hash_buckets: Jumlah bucket bigram
+        """
+        self.vocab_size = vocab_size
+        self.hash_buckets = hash_buckets
+        self.num_features = vocab_size + hash_buckets
+        self.weights = (
+            weights if weights is not None
+            else np.zeros((self.num_features + 1, NUM_CLASSES), dtype=np.float32)
+        )
+        self.bias = bias if bias is not None else np.zeros(NUM_CLASSES, dtype=np.float32)
+
+    def features(self, padded_sequences: np.ndarray) -> np.ndarray:
+        """
+        Indeks fitur per baris; posisi tanpa fitur berisi indeks fitur kosong
+
+        Args:
+            padded_sequences: Array int (N, MAX_LEN)
+
+        Returns:
+            Array int64 (N, 2 * MAX_LEN - 1)
+        """
+        ids = np.asarray(padded_sequences, dtype=np.int64)
+        empty = self.num_features
+
+        unigrams = np.where((ids > 0) & (ids < self.vocab_size), ids, empty)
+
+        left, right = ids[:, :-1], ids[:, 1:]
+        bigram_hash = (left * _BIGRAM_PRIME + right) % self.hash_buckets + self.vocab_size
+        bigrams = np.where((left > 0) & (right > 0), bigram_hash, empty)
+
+        return np.concatenate([unigrams, bigrams], axis=1)
+
+    def _logits(self, features: np.ndarray) -> np.ndarray:
+        return self.weights[features].sum(axis=1) + self.bias
+
+    def predict_proba(self, padded_sequences: np.ndarray) -> np.ndarray:
+        """
+        Probabilitas setiap kelas
+
+        Args:
+            padded_sequences: Array int (N, MAX_LEN)
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES) float32
+        """
+        return _softmax(self._logits(self.features(padded_sequences))).astype(np.float32)
+
+    def fit(
+        self,
+        padded_sequences: np.ndarray,
+        targets: np.ndarray,
+        epochs: int = 10,
+        learning_rate: float = 0.05,
+        batch_size: int = 256,
+        l2: float = 1e-6,
+        seed: int = 42
+    ) -> "HashedLinearClassifier":
+        """
+        Melatih klasifier dengan mini-batch Adagrad (cross-entropy)
+
+        Args:
+            padded_sequences: Array int (N, MAX_LEN)
+            targets: Label kelas (N,) atau probabilitas target (N, NUM_CLASSES)
+                untuk distilasi dari model Bi-GRU
+            epochs: Jumlah epoch
+            learning_rate: Learning rate Adagrad
+            batch_size: Jumlah baris per update
+            l2: Regularisasi L2
+            seed: Seed pengacakan urutan data
+
+        Returns:
+            self
+        """
+        targets = np.asarray(targets)
+        if targets.ndim == 1:
+            targets = np.eye(NUM_CLASSES, dtype=np.float32)[targets]
+        targets = targets.astype(np.float32)
+
+        features = self.features(padded_sequences)
+        rng = np.random.default_rng(seed)
+        weight_sq = np.full_like(self.weights, 1e-8)
+        bias_sq = np.full_like(self.bias, 1e-8)
+
+        for _ in range(epochs):
+            order = rng.permutation(len(features))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                batch_features = features[batch]
+                error = (_softmax(self._logits(batch_features)) - targets[batch]) / len(batch)
+
+                grad = np.zeros_like(self.weights)
+                np.add.at(grad, batch_features, error[:, None, :])
+                grad[-1] = 0.0
+                touched = np.unique(batch_features)
+                grad[touched] += l2 * self.weights[touched]
+                bias_grad = error.sum(axis=0)
+
+                weight_sq[touched] += grad[touched] ** 2
+                self.weights[touched] -= learning_rate * grad[touched] / np.sqrt(weight_sq[touched])
+                bias_sq += bias_grad ** 2
+                self.bias -= learning_rate * bias_grad / np.sqrt(bias_sq)
+
+        return self
+
+    def save(self, path: str = CASCADE_MODEL_PATH) -> str:
+        """
+        Menyimpan bobot ke file .npz
+
+        Args:
+            path: Path file tujuan
+
+        Returns:
+            Path file yang ditulis
+        """
+        np.savez(
+            path, weights=self.weights, bias=self.bias,
+            vocab_size=self.vocab_size, hash_buckets=self.hash_buckets
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str = CASCADE_MODEL_PATH) -> "HashedLinearClassifier":
+        """
+        Memuat klasifier dari file .npz
+
+        Args:
+            path: Path file .npz
+
+        Returns:
+            Instance HashedLinearClassifier
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                weights=data["weights"], bias=data["bias"],
+                vocab_size=int(data["vocab_size"]), hash_buckets=int(data["hash_buckets"])
+            )
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    """Softmax yang stabil secara numerik pada axis terakhir"""
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+class CascadeClassifier:
+    """
+    Cascade: tahap pertama menjawab baris dengan confidence >= threshold,
+    sisanya diteruskan ke fungsi prediksi neural
+    """
+
+    def __init__(self, first_stage: HashedLinearClassifier, threshold: float = CASCADE_THRESHOLD):
+        """
+        Args:
+            first_stage: Klasifier tahap pertama
+            threshold: Confidence minimal (0-1) agar hasil tahap pertama dipakai
+        """
+        self.first_stage = first_stage
+        self.threshold = threshold
+
+        self._stats_lock = threading.Lock()
+        self._first_stage_rows = 0
+        self._neural_rows = 0
+
+    def predict(
+        self,
+        padded_sequences: np.ndarray,
+        neural_predict: Callable[[np.ndarray, Optional[int]], np.ndarray],
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Prediksi probabilitas dengan cascade
+
+        Args:
+            padded_sequences: Numpy array int32 (N, MAX_LEN)
+            neural_predict: Callable (padded_sequences, batch_size) -> probabilitas
+            batch_size: Diteruskan ke neural_predict
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES)
+        """
+        probabilities = self.first_stage.predict_proba(padded_sequences)
+        fallback = np.flatnonzero(probabilities.max(axis=1) < self.threshold)
+        if len(fallback):
+            probabilities[fallback] = neural_predict(padded_sequences[fallback], batch_size)
+
+        with self._stats_lock:
+            self._first_stage_rows += len(padded_sequences) - len(fallback)
+            self._neural_rows += len(fallback)
+        return probabilities
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik cascade
+
+        Returns:
+            Dictionary berisi jumlah dan persentase baris per tahap
+        """
+        with self._stats_lock:
+            total = self._first_stage_rows + self._neural_rows
+            return {
+                "threshold": self.threshold,
+                "first_stage": self._first_stage_rows,
+                "neural": self._neural_rows,
+                "first_stage_pct": round(self._first_stage_rows / total * 100, 2) if total else 0
+            }
+
+
+def load_cascade(path: str = CASCADE_MODEL_PATH, threshold: float = CASCADE_THRESHOLD) -> Optional[CascadeClassifier]:
+    """
+    Memuat cascade jika CASCADE_ENABLED dan file model tahap pertama ada
+
+    Returns:
+        Instance CascadeClassifier atau None
+    """
+    if not CASCADE_ENABLED or not os.path.exists(path):
+        return None
+    return CascadeClassifier(HashedLinearClassifier.load(path), threshold)
+
+
+# ==================== TRAINING ====================
+def read_feedback_labels(path: str) -> tuple:
+    """
+    Label benar dari CSV feedback user (prediksi jika benar, koreksi jika salah)
+
+    Returns:
+        Tuple (list teks, array label)
+    """
+    label_index = {name: index for index, name in LABEL_MAP.items()}
+    texts, labels = [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            label = row['predicted_label'] if row.get('is_correct') == 'Ya' else row.get('correct_label')
+            if label in label_index:
+                texts.append(row['original_text'])
+                labels.append(label_index[label])
+    return texts, np.asarray(labels, dtype=np.int64)
+
+
+def teacher_targets(padded_sequences: np.ndarray) -> np.ndarray:
+    """
+    Probabilitas model Bi-GRU (tanpa cascade) sebagai target latih
+
+    Raises:
+        RuntimeError: Model/tokenizer gagal dimuat
+    """
+    from model_utils import create_analyzer
+
+    analyzer, error = create_analyzer()
+    if error:
+        raise RuntimeError(f"Gagal memuat model/tokenizer: {error}")
+    analyzer.cascade = None
+    return analyzer.predict_proba(padded_sequences)
+
+
+def main():
+    from labeled_data import read_labeled_csv
+    from preprocessing import CompiledLexicon, default_preprocessor, load_vocabulary
+
+    parser = argparse.ArgumentParser(description="Cascade klasifier linear + Bi-GRU")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_train = subparsers.add_parser("train", help="Latih klasifier tahap pertama")
+    p_train.add_argument("--csv", required=True)
+    p_train.add_argument("--text-column", default="original_text")
+    p_train.add_argument("--label-column", default=None,
+                         help="Kolom label; tanpa opsi ini target diambil dari model Bi-GRU")
+    p_train.add_argument("--feedback", default=None, help="CSV feedback user sebagai data berlabel tambahan")
+    p_train.add_argument("--output", default=CASCADE_MODEL_PATH)
+    p_train.add_argument("--epochs", type=int, default=10)
+    p_train.add_argument("--learning-rate", type=float, default=0.05)
+
+    args = parser.parse_args()
+
+    if args.command == "train":
+        texts, labels = read_labeled_csv(args.csv, args.text_column, args.label_column)
+        lexicon = CompiledLexicon.load_or_build(default_preprocessor, load_vocabulary())
+        _, padded = lexicon.process_batch(texts)
+
+        if labels is None:
+            try:
+                targets = teacher_targets(padded)
+            except RuntimeError as e:
+                raise SystemExit(str(e)) from None
+        else:
+            targets = np.eye(NUM_CLASSES, dtype=np.float32)[labels]
+
+        if args.feedback:
+            feedback_texts, feedback_labels = read_feedback_labels(args.feedback)
+            if feedback_texts:
+                _, feedback_padded = lexicon.process_batch(feedback_texts)
+                padded = np.vstack([padded, feedback_padded])
+                targets = np.vstack([targets, np.eye(NUM_CLASSES, dtype=np.float32)[feedback_labels]])
+
+        classifier = HashedLinearClassifier().fit(
+            padded, targets, epochs=args.epochs, learning_rate=args.learning_rate
+        )
+        agreement = (classifier.predict_proba(padded).argmax(axis=1) == targets.argmax(axis=1)).mean()
+        path = classifier.save(args.output)
+        print(f"Klasifier tahap pertama disimpan ke {path} ({os.path.getsize(path) / 1024:.0f} KB), "
+              f"{len(padded)} baris, kesesuaian data latih {agreement * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,134 @@ VOCAB_SIZE = 15000
 MAX_LEN = 60
 NUM_CLASSES = 3
 
+# Jumlah baris per forward pass pada SentimentAnalyzer.predict_batch
+PREDICT_BATCH_SIZE = 256
+
+# Backend NumPy: kelompokkan baris berdasarkan panjang token (bucket) dan lewati
+# timestep padding, agar forward pass tidak menghitung MAX_LEN timestep untuk
+# komentar pendek. Hasil sama dengan forward pass lebar penuh.
+LENGTH_BUCKETING = True
+
+# Backend inferensi: 'keras' (TensorFlow), 'numpy' (NUMPY_MODEL_PATH, tanpa TensorFlow)
+# atau 'tflite' (TFLITE_MODEL_PATH, hasil `python backends.py export-tflite`)
+INFERENCE_BACKEND = 'keras'
+
+# Gunakan tf.function dengan input signature tetap (None, MAX_LEN) int32
+# alih-alih model.predict (lebih cepat untuk request satu baris)
+USE_GRAPH_INFERENCE = True
+
+# Jumlah worker thread inferensi untuk predict_async / predict_many_async
+ASYNC_INFERENCE_WORKERS = 1
+
+# Tampilkan kontribusi setiap kata (leave-one-token-out) di halaman hasil.
+# Label tetap dari jalur predict biasa (micro-batch, cascade); semua varian
+# dihitung dalam satu forward pass batch langsung ke model Bi-GRU
+# (SentimentAnalyzer.explain_words), tanpa mengisi cache prediksi.
+EXPLAIN_ENABLED = True
+
+# ==================== CASCADE ====================
+# Tahap pertama klasifier linear bag-of-words (python cascade.py train); hasilnya
+# dipakai jika confidence >= CASCADE_THRESHOLD, selain itu diteruskan ke Bi-GRU
+CASCADE_ENABLED = False
+CASCADE_MODEL_PATH = 'models/cascade_linear.npz'
+CASCADE_THRESHOLD = 0.9
+
+# ==================== REPLICA POOL ====================
+# Jumlah replika model (1: tanpa pool). Request paralel dan worker micro-batch
+# masing-masing meminjam satu replika. REPLICA_THREADS: thread CPU per replika
+# (None: jumlah core dibagi rata ke setiap replika). Hanya benar-benar per
+# replika untuk backend 'tflite' (num_threads per interpreter). Pada 'keras'
+# thread pool TensorFlow global per proses dan hanya bisa diatur sebelum
+# TensorFlow diinisialisasi (jika terlambat: log warning, tidak diterapkan).
+# Pada 'numpy' jumlah thread BLAS diatur lewat environment (OMP_NUM_THREADS).
+REPLICA_POOL_SIZE = 1
+REPLICA_THREADS = None
+
+# ==================== SHADOW MODEL ====================
+# Model kandidat (.keras/.npz/.tflite) yang dievaluasi pada salinan traffic
+# produksi di background, None untuk menonaktifkan. Path dicari di folder models/
+# lalu di direktori utama seperti MODEL_PATH. Statistik dikirim ke data layer
+# setiap SHADOW_LOG_INTERVAL detik.
+SHADOW_MODEL_PATH = None
+SHADOW_SAMPLE_RATE = 0.1
+SHADOW_QUEUE_SIZE = 256
+SHADOW_LOG_INTERVAL = 60
+
+# ==================== DISTILASI ====================
+# Student hasil `python distill.py` (input/output sama dengan model Bi-GRU).
+# Arahkan MODEL_PATH (atau SHADOW_MODEL_PATH untuk evaluasi dulu) ke file ini
+# untuk memakainya. Arsitektur: 'cnn', 'gru' atau 'mlp'
+STUDENT_MODEL_PATH = 'models/student_model.keras'
+STUDENT_ARCHITECTURE = 'cnn'
+
+# ==================== MICRO-BATCHING (REQUEST INTERAKTIF) ====================
+# Request tunggal dari banyak sesi digabung menjadi satu forward pass
+MICRO_BATCH_ENABLED = True
+MICRO_BATCH_MAX_SIZE = 32
+MICRO_BATCH_WAIT_MS = 5
+
+# ==================== CACHE PREDIKSI ====================
+# Cache LRU probabilitas dengan key hash sequence id (N, MAX_LEN) hasil tokenisasi.
+# File model/tokenizer tidak dipantau: model baru dipakai (dan cache mulai
+# kosong) setelah aplikasi di-restart.
+PREDICTION_CACHE_ENABLED = True
+PREDICTION_CACHE_SIZE = 10000
+PREDICTION_CACHE_TTL = 3600  # detik, None untuk tanpa batas
+
+# ==================== PENYIMPANAN DATA ====================
+# Tulis history prediksi di background (write-behind) alih-alih di dalam request.
+# Baris ditulis per batch (STORAGE_BATCH_SIZE baris atau STORAGE_FLUSH_INTERVAL
+# detik); jika antrian penuh (STORAGE_QUEUE_SIZE baris) baris baru dibuang.
+STORAGE_WRITE_BEHIND = True
+STORAGE_QUEUE_SIZE = 10000
+STORAGE_BATCH_SIZE = 100
+STORAGE_FLUSH_INTERVAL = 2.0
+
+# Backend penyimpanan lokal: 'csv' (file CSV di data/) atau 'sqlite' (SQLITE_DB_PATH).
+# SQLite memakai mode WAL (aman untuk beberapa worker yang menulis bersamaan) dan
+# index timestamp/label/hash teks. CSV lama diimpor manual (sekali, per chunk)
+# dengan `python data_storage.py import-csv`.
+LOCAL_STORAGE_BACKEND = 'csv'
+SQLITE_DB_PATH = 'data/sentiment.db'
+SQLITE_BUSY_TIMEOUT = 30.0  # detik menunggu lock tulis penulis lain
+
+# Google Sheets: error kuota (429) dicoba ulang dengan exponential backoff
+# SHEETS_BACKOFF_BASE * 2^n detik (maks SHEETS_BACKOFF_MAX). Error server (5xx)
+# hanya dicoba ulang untuk request baca; append_rows tidak idempoten (baris bisa
+# sudah tertulis walau responsnya 5xx) sehingga hanya 429 yang dicoba ulang.
+# Penulisan sinkron dari request Streamlit (save_prediction/save_feedback)
+# berhenti retry setelah total jeda SHEETS_INTERACTIVE_MAX_WAIT detik.
+SHEETS_MAX_RETRIES = 5
+SHEETS_BACKOFF_BASE = 1.0
+SHEETS_BACKOFF_MAX = 32.0
+SHEETS_MAX_ROWS_PER_REQUEST = 500
+SHEETS_INTERACTIVE_MAX_WAIT = 5.0
+
 # ==================== PATH MODEL & TOKENIZER ====================
 MODEL_PATH = 'models/Best_Oversampled_Model.keras'
 TOKENIZER_PATH = 'models/tokenizer.pickle'
 
+# Vocabulary ringkas tanpa pickle (top VOCAB_SIZE id), dikonversi otomatis dari TOKENIZER_PATH
+TOKENIZER_VOCAB_PATH = 'models/tokenizer_vocab.json'
+
+# Bobot model untuk backend NumPy (diekstrak dari MODEL_PATH)
+NUMPY_MODEL_PATH = 'models/model_weights.npz'
+
+# Memory-map bobot .npz alih-alih menyalinnya: beberapa proses worker
+# berbagi satu salinan bobot di page cache OS
+NUMPY_MMAP_WEIGHTS = True
+
+# Model TFLite terkuantisasi untuk INFERENCE_BACKEND = 'tflite'
+TFLITE_MODEL_PATH = 'models/model_int8.tflite'
+TFLITE_NUM_THREADS = None
+
 # Fallback paths (jika tidak ada di folder models/)
 MODEL_PATH_FALLBACK = 'Best_Oversampled_Model.keras'
 TOKENIZER_PATH_FALLBACK = 'tokenizer.pickle'
+TOKENIZER_VOCAB_PATH_FALLBACK = 'tokenizer_vocab.json'
+
+# Cache lexicon hasil kompilasi (token mentah -> id), dibangun ulang otomatis
+LEXICON_CACHE_PATH = 'models/lexicon_cache.json'
 
 # ==================== LABEL MAPPING ====================
 LABEL_MAP = {0: "Negatif", 1: "Netral", 2: "Positif"}
@@ -1,14 +1,46 @@
+import io
 import os
+import re
 import csv
 import json
+import sqlite3
+import hashlib
+import queue
+import atexit
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 import streamlit as st
 
+from config import (
+    LABEL_MAP,
+    LOCAL_STORAGE_BACKEND,
+    SQLITE_DB_PATH,
+    SQLITE_BUSY_TIMEOUT,
+    STORAGE_WRITE_BEHIND,
+    STORAGE_QUEUE_SIZE,
+    STORAGE_BATCH_SIZE,
+    STORAGE_FLUSH_INTERVAL,
+    SHEETS_MAX_RETRIES,
+    SHEETS_BACKOFF_BASE,
+    SHEETS_BACKOFF_MAX,
+    SHEETS_MAX_ROWS_PER_REQUEST,
+    SHEETS_INTERACTIVE_MAX_WAIT
+)
+
+logger = logging.getLogger(__name__)
+
 # ==================== KONFIGURASI ====================
 DATA_DIR = "data"
 LOCAL_CSV_FILE = os.path.join(DATA_DIR, "sentiment_history.csv")
 FEEDBACK_CSV_FILE = os.path.join(DATA_DIR, "user_feedback.csv")
+SHADOW_CSV_FILE = os.path.join(DATA_DIR, "shadow_evaluation.csv")
+# Sidecar berisi counter statistik feedback dan checkpoint byte offset CSV
+FEEDBACK_STATS_FILE = os.path.join(DATA_DIR, "user_feedback_stats.json")
 
 # CSV Headers
 HISTORY_HEADERS = [
@@ -21,6 +53,19 @@ FEEDBACK_HEADERS = [
     "correct_label", "feedback_comment"
 ]
 
+SHADOW_HEADERS = [
+    "timestamp", "shadow_model", "evaluated", "sampled", "dropped", "failed",
+    "agreement_rate", "primary_latency_ms", "shadow_latency_ms",
+    "primary_p95_ms", "shadow_p95_ms", "confusion"
+]
+
+# Tabel penyimpanan: nama worksheet Google Sheets -> (file CSV lokal, header)
+STORAGE_TABLES = {
+    "predictions": (LOCAL_CSV_FILE, HISTORY_HEADERS),
+    "feedback": (FEEDBACK_CSV_FILE, FEEDBACK_HEADERS),
+    "shadow": (SHADOW_CSV_FILE, SHADOW_HEADERS)
+}
+
 
 # ==================== UTILITY FUNCTIONS ====================
 def ensure_data_directory():
@@ -34,6 +79,345 @@ def get_timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def prediction_row(original_text: str, cleaned_text: str, result: Dict[str, Any]) -> list:
+    """
+    Mengubah hasil prediksi menjadi satu baris HISTORY_HEADERS
+    
+    Args:
+        original_text: Teks asli dari user
+        cleaned_text: Teks setelah preprocessing
+        result: Hasil prediksi dari model
+        
+    Returns:
+        List nilai sesuai urutan HISTORY_HEADERS
+    """
+    return [
+        get_timestamp(),
+        original_text,
+        cleaned_text,
+        result['label'],
+        f"{result['confidence']:.2f}",
+        f"{result['probabilities']['Negatif']:.2f}",
+        f"{result['probabilities']['Netral']:.2f}",
+        f"{result['probabilities']['Positif']:.2f}"
+    ]
+
+
+def feedback_row(
+    original_text: str,
+    predicted_label: str,
+    is_correct: bool,
+    correct_label: Optional[str] = None,
+    feedback_comment: str = ""
+) -> list:
+    """
+    Mengubah feedback user menjadi satu baris FEEDBACK_HEADERS
+    
+    Returns:
+        List nilai sesuai urutan FEEDBACK_HEADERS
+    """
+    return [
+        get_timestamp(),
+        original_text,
+        predicted_label,
+        "Ya" if is_correct else "Tidak",
+        correct_label or "-",
+        feedback_comment
+    ]
+
+
+def shadow_stats_row(stats: Dict[str, Any]) -> list:
+    """
+    Mengubah statistik ShadowEvaluator menjadi satu baris SHADOW_HEADERS
+    
+    Args:
+        stats: Hasil ShadowEvaluator.get_stats()
+        
+    Returns:
+        List nilai sesuai urutan SHADOW_HEADERS
+    """
+    return [
+        get_timestamp(),
+        stats['shadow_model'],
+        stats['evaluated'],
+        stats['sampled'],
+        stats['dropped'],
+        stats['failed'],
+        f"{stats['agreement_rate']:.2f}",
+        f"{stats['primary_latency']['mean_ms']:.3f}",
+        f"{stats['shadow_latency']['mean_ms']:.3f}",
+        f"{stats['primary_latency']['p95_ms']:.3f}",
+        f"{stats['shadow_latency']['p95_ms']:.3f}",
+        json.dumps(stats['confusion'])
+    ]
+
+
+# Karakter yang menentukan batas record CSV saat membaca dari belakang
+_QUOTE_OR_NEWLINE = re.compile(rb'["\n]')
+
+
+def read_csv_tail(path: str, limit: int, offset: int = 0, block_size: int = 65536) -> List[Dict[str, str]]:
+    """
+    Membaca `limit` record terakhir CSV (setelah melewati `offset` record
+    terbaru) dengan membaca file dari belakang per blok
+    
+    Newline adalah batas record hanya jika berada di luar field ber-quote.
+    File yang ditulis csv.writer selalu memiliki jumlah karakter '"' genap,
+    sehingga newline berada di luar quote jika jumlah '"' sesudahnya (sampai
+    akhir file) genap. Biaya baca sebanding dengan offset + limit record,
+    bukan ukuran file.
+    
+    Args:
+        path: Path file CSV dengan header di baris pertama
+        limit: Jumlah record yang diambil
+        offset: Jumlah record terbaru yang dilewati (paging)
+        block_size: Ukuran blok baca (byte)
+        
+    Returns:
+        List dictionary (header -> nilai), record terbaru di urutan pertama
+    """
+    if limit <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        header = next(csv.reader([f.readline().decode('utf-8')]), None)
+        header_end = f.tell()
+        if not header:
+            return []
+        
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        
+        # Offset newline batas record, dari belakang; batas pertama adalah akhir file
+        wanted = offset + limit
+        boundaries = [end]
+        quotes_after = 0
+        position = end
+        while position > header_end and len(boundaries) <= wanted:
+            start = max(header_end, position - block_size)
+            f.seek(start)
+            block = f.read(position - start)
+            for match in reversed(list(_QUOTE_OR_NEWLINE.finditer(block))):
+                if match.group() == b'"':
+                    quotes_after += 1
+                elif quotes_after % 2 == 0 and start + match.start() != end - 1:
+                    boundaries.append(start + match.start() + 1)
+                    if len(boundaries) > wanted:
+                        break
+            position = start
+        if len(boundaries) <= wanted:
+            boundaries.append(header_end)
+        
+        # Hanya rentang record yang dibutuhkan yang dibaca ulang dan diparse
+        first = boundaries[-1]
+        f.seek(first)
+        data = f.read(end - first)
+    
+    records = []
+    for record_end, record_start in zip(boundaries[offset:], boundaries[offset + 1:]):
+        text = data[record_start - first:record_end - first].decode('utf-8').rstrip('\r\n')
+        if not text:
+            continue
+        row = next(csv.reader(io.StringIO(text)))
+        records.append(dict(zip(header, row)))
+    return records
+
+
+def _complete_records_length(data: bytes) -> int:
+    """Panjang prefix data yang berisi record CSV lengkap (diakhiri newline di luar quote)"""
+    end = len(data)
+    while True:
+        newline = data.rfind(b'\n', 0, end)
+        if newline < 0:
+            return 0
+        if data.count(b'"', 0, newline) % 2 == 0:
+            return newline + 1
+        end = newline
+
+
+# ==================== FEEDBACK STATISTICS ====================
+class FeedbackStats:
+    """
+    Statistik feedback inkremental
+    
+    Counter (total, benar, per label prediksi, per label sebenarnya dan
+    confusion matrix) disimpan di file sidecar bersama checkpoint byte offset
+    CSV yang sudah dihitung. Jika ukuran/mtime CSV berubah, hanya byte setelah
+    checkpoint yang diparse; jika isi sebelum checkpoint berubah (file ditimpa
+    atau dipotong), counter dibangun ulang dari awal.
+    """
+    
+    # Jumlah byte sebelum checkpoint yang dicocokkan untuk mendeteksi file ditimpa
+    _SIGNATURE_BYTES = 64
+    
+    def __init__(self, csv_path: str = FEEDBACK_CSV_FILE, sidecar_path: str = FEEDBACK_STATS_FILE):
+        """
+        Args:
+            csv_path: Path CSV feedback
+            sidecar_path: Path file JSON counter
+        """
+        self.csv_path = csv_path
+        self.sidecar_path = sidecar_path
+        self._lock = threading.Lock()
+        self._state = None
+    
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        """Counter kosong dengan checkpoint di awal file"""
+        labels = list(LABEL_MAP.values())
+        return {
+            "offset": 0,
+            "size": 0,
+            "mtime_ns": 0,
+            "signature": "",
+            "total": 0,
+            "correct": 0,
+            "predicted": {label: {"total": 0, "correct": 0} for label in labels},
+            "actual": {label: 0 for label in labels},
+            "confusion": {predicted: {actual: 0 for actual in labels} for predicted in labels}
+        }
+    
+    @staticmethod
+    def _apply(state: Dict[str, Any], row: Dict[str, str], count: int = 1):
+        """Menambahkan baris feedback (sebanyak `count` baris identik) ke counter"""
+        is_correct = row.get('is_correct') == 'Ya'
+        predicted = row.get('predicted_label') or '-'
+        actual = predicted if is_correct else row.get('correct_label')
+        
+        state["total"] += count
+        state["correct"] += count * is_correct
+        per_label = state["predicted"].setdefault(predicted, {"total": 0, "correct": 0})
+        per_label["total"] += count
+        per_label["correct"] += count * is_correct
+        
+        # Label sebenarnya tidak diketahui jika prediksi salah tanpa correct_label
+        if actual and actual != '-':
+            state["actual"][actual] = state["actual"].get(actual, 0) + count
+            row_counts = state["confusion"].setdefault(predicted, {})
+            row_counts[actual] = row_counts.get(actual, 0) + count
+    
+    def _load_sidecar(self) -> Optional[Dict[str, Any]]:
+        """Membaca counter dari sidecar (None jika tidak ada/rusak)"""
+        try:
+            with open(self.sidecar_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) and "offset" in state else None
+        except (OSError, ValueError):
+            return None
+    
+    def _save_sidecar(self, state: Dict[str, Any]):
+        """Menulis counter ke sidecar secara atomik (file sementara + rename)"""
+        temp_path = f"{self.sidecar_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.sidecar_path)
+        except OSError:
+            pass  # Sidecar bersifat opsional, counter dibangun ulang jika hilang
+    
+    def _signature(self, f, offset: int) -> str:
+        """Hex byte terakhir sebelum offset (penanda isi file yang sudah dihitung)"""
+        start = max(0, offset - self._SIGNATURE_BYTES)
+        f.seek(start)
+        return f.read(offset - start).hex()
+    
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Memperbarui counter dari byte CSV setelah checkpoint
+        
+        Returns:
+            State counter terbaru
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.csv_path)
+            except FileNotFoundError:
+                self._state = self._empty_state()
+                return self._state
+            
+            def unchanged(state: Optional[Dict[str, Any]]) -> bool:
+                return state is not None and state["size"] == stat.st_size and state["mtime_ns"] == stat.st_mtime_ns
+
+            if unchanged(self._state):
+                return self._state
+
+            # Counter di memori tertinggal, mungkin proses lain sudah memperbarui sidecar
+            state = self._load_sidecar()
+            if unchanged(state):
+                self._state = state
+                return state
+            if self._state is not None and (state is None or state["offset"] < self._state["offset"]):
+                state = self._state
+
+            with open(self.csv_path, 'rb') as f:
+                if (
+                    state is None
+                    or stat.st_size < state["offset"]
+                    or self._signature(f, state["offset"]) != state["signature"]
+                ):
+                    state = self._empty_state()
+                
+                f.seek(0)
+                header_line = f.readline()
+                header = next(csv.reader([header_line.decode('utf-8')]), None) or FEEDBACK_HEADERS
+                start = max(state["offset"], len(header_line))
+                
+                f.seek(start)
+                data = f.read(stat.st_size - start)
+                complete = _complete_records_length(data)
+                
+                rows = csv.DictReader(io.StringIO(data[:complete].decode('utf-8'), newline=''), fieldnames=header)
+                for row in rows:
+                    self._apply(state, row)
+                
+                state["offset"] = start + complete
+                state["signature"] = self._signature(f, state["offset"])
+            
+            state["size"] = stat.st_size
+            state["mtime_ns"] = stat.st_mtime_ns
+            self._save_sidecar(state)
+            self._state = state
+            return state
+    
+    def get(self) -> Dict[str, Any]:
+        """Mengambil statistik feedback (O(1) jika CSV tidak berubah)"""
+        return self.summary(self.refresh())
+    
+    @staticmethod
+    def summary(state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mengubah counter menjadi statistik feedback
+        
+        Returns:
+            Dictionary berisi total, correct, incorrect, accuracy, serta
+            by_predicted_label, by_correct_label dan confusion
+            {label prediksi: {label sebenarnya: jumlah}}
+        """
+        def accuracy(correct: int, total: int) -> float:
+            return round(correct / total * 100, 2) if total > 0 else 0
+        
+        return {
+            "total": state["total"],
+            "correct": state["correct"],
+            "incorrect": state["total"] - state["correct"],
+            "accuracy": accuracy(state["correct"], state["total"]),
+            "by_predicted_label": {
+                label: {
+                    "total": counts["total"],
+                    "correct": counts["correct"],
+                    "incorrect": counts["total"] - counts["correct"],
+                    "accuracy": accuracy(counts["correct"], counts["total"])
+                }
+                for label, counts in state["predicted"].items()
+            },
+            "by_correct_label": dict(state["actual"]),
+            "confusion": {label: dict(counts) for label, counts in state["confusion"].items()}
+        }
+
+
+_feedback_stats = FeedbackStats()
+
+
 # ==================== LOCAL CSV STORAGE ====================
 class LocalCSVStorage:
     """
@@ -58,35 +442,9 @@ class LocalCSVStorage:
         Returns:
             True jika berhasil, False jika gagal
         """
-        try:
-            ensure_data_directory()
-            
-            # Cek apakah file sudah ada
-            file_exists = os.path.exists(LOCAL_CSV_FILE)
-            
-            with open(LOCAL_CSV_FILE, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # Tulis header jika file baru
-                if not file_exists:
-                    writer.writerow(HISTORY_HEADERS)
-                
-                # Tulis data
-                writer.writerow([
-                    get_timestamp(),
-                    original_text,
-                    cleaned_text,
-                    result['label'],
-                    f"{result['confidence']:.2f}",
-                    f"{result['probabilities']['Negatif']:.2f}",
-                    f"{result['probabilities']['Netral']:.2f}",
-                    f"{result['probabilities']['Positif']:.2f}"
-                ])
-            
-            return True
-        except Exception as e:
-            st.warning(f"Gagal menyimpan ke CSV: {e}")
-            return False
+        return LocalCSVStorage.append_rows(
+            "predictions", [prediction_row(original_text, cleaned_text, result)]
+        )
     
     @staticmethod
     def save_feedback(
@@ -109,52 +467,85 @@ class LocalCSVStorage:
         Returns:
             True jika berhasil, False jika gagal
         """
+        saved = LocalCSVStorage.append_rows("feedback", [feedback_row(
+            original_text, predicted_label, is_correct, correct_label, feedback_comment
+        )])
+        
+        # Counter diperbarui dari byte setelah checkpoint (hanya baris baru)
+        if saved:
+            try:
+                _feedback_stats.refresh()
+            except Exception:
+                pass  # Dibangun ulang saat get_feedback_stats
+        return saved
+    
+    @staticmethod
+    def save_shadow_stats(stats: Dict[str, Any]) -> bool:
+        """
+        Menyimpan snapshot statistik shadow model ke CSV
+        
+        Args:
+            stats: Hasil ShadowEvaluator.get_stats()
+            
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        return LocalCSVStorage.append_rows("shadow", [shadow_stats_row(stats)])
+    
+    @staticmethod
+    def append_rows(table: str, rows: List[list]) -> bool:
+        """
+        Menulis beberapa baris sekaligus ke CSV tabel (satu kali buka file)
+        
+        Args:
+            table: Nama tabel di STORAGE_TABLES ('predictions', 'feedback', 'shadow')
+            rows: List baris sesuai header tabel
+            
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        csv_file, headers = STORAGE_TABLES[table]
         try:
             ensure_data_directory()
             
-            file_exists = os.path.exists(FEEDBACK_CSV_FILE)
+            # Cek apakah file sudah ada
+            file_exists = os.path.exists(csv_file)
             
-            with open(FEEDBACK_CSV_FILE, 'a', newline='', encoding='utf-8') as f:
+            with open(csv_file, 'a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 
+                # Tulis header jika file baru
                 if not file_exists:
-                    writer.writerow(FEEDBACK_HEADERS)
+                    writer.writerow(headers)
                 
-                writer.writerow([
-                    get_timestamp(),
-                    original_text,
-                    predicted_label,
-                    "Ya" if is_correct else "Tidak",
-                    correct_label or "-",
-                    feedback_comment
-                ])
+                writer.writerows(rows)
             
             return True
         except Exception as e:
-            st.warning(f"Gagal menyimpan feedback: {e}")
+            # Juga dipanggil dari worker thread writer (tanpa konteks Streamlit);
+            # pemanggil di UI menampilkan pesan berdasarkan nilai kembalian
+            logger.warning("Gagal menyimpan ke CSV (%s): %s", table, e)
             return False
     
     @staticmethod
-    def get_history(limit: int = 100) -> List[Dict]:
+    def get_history(limit: int = 100, offset: int = 0) -> List[Dict]:
         """
-        Mengambil history prediksi
+        Mengambil history prediksi (dibaca dari akhir file, biaya tidak
+        bergantung pada ukuran file)
         
         Args:
             limit: Jumlah maksimal data yang diambil
+            offset: Jumlah data terbaru yang dilewati (halaman berikutnya
+                dimulai dari offset + limit)
             
         Returns:
-            List of dictionaries berisi history
+            List of dictionaries berisi history, terbaru di atas
         """
         try:
             if not os.path.exists(LOCAL_CSV_FILE):
                 return []
             
-            with open(LOCAL_CSV_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                history = list(reader)
-            
-            # Return data terbaru
-            return history[-limit:][::-1]  # Reverse untuk terbaru di atas
+            return read_csv_tail(LOCAL_CSV_FILE, limit, offset)
         except Exception as e:
             st.warning(f"Gagal membaca history: {e}")
             return []
@@ -162,32 +553,18 @@ class LocalCSVStorage:
     @staticmethod
     def get_feedback_stats() -> Dict[str, Any]:
         """
-        Mengambil statistik feedback
+        Mengambil statistik feedback dari counter inkremental (FeedbackStats),
+        CSV hanya dibaca sejak checkpoint terakhir
         
         Returns:
-            Dictionary berisi statistik feedback
+            Dictionary berisi statistik feedback beserta rincian per label
+            prediksi, per label sebenarnya dan confusion matrix
         """
         try:
-            if not os.path.exists(FEEDBACK_CSV_FILE):
-                return {"total": 0, "correct": 0, "incorrect": 0, "accuracy": 0}
-            
-            with open(FEEDBACK_CSV_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                feedbacks = list(reader)
-            
-            total = len(feedbacks)
-            correct = sum(1 for f in feedbacks if f.get('is_correct') == 'Ya')
-            incorrect = total - correct
-            accuracy = (correct / total * 100) if total > 0 else 0
-            
-            return {
-                "total": total,
-                "correct": correct,
-                "incorrect": incorrect,
-                "accuracy": round(accuracy, 2)
-            }
+            return _feedback_stats.get()
         except Exception as e:
-            return {"total": 0, "correct": 0, "incorrect": 0, "accuracy": 0}
+            logger.warning("Gagal membaca statistik feedback: %s", e)
+            return FeedbackStats.summary(FeedbackStats._empty_state())
 
 
 # ==================== GOOGLE SHEETS STORAGE (FOR DEPLOYMENT) ====================
@@ -202,12 +579,51 @@ class GoogleSheetsStorage:
     3. Buat Service Account dan download credentials JSON
     4. Share Google Sheet dengan email service account
     5. Simpan credentials di Streamlit Secrets
+    
+    Handle worksheet di-cache (satu request worksheet() per tabel), baris
+    ditulis dengan append_rows per batch, dan error kuota/transient dicoba
+    ulang dengan exponential backoff: 429 dan 5xx untuk request baca, hanya
+    429 untuk append_rows (tidak idempoten, 5xx bisa berarti baris sudah
+    tertulis sehingga retry menggandakan baris).
     """
     
-    def __init__(self):
+    # Kode HTTP yang layak dicoba ulang (kuota dan error sementara server)
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    # append_rows hanya dicoba ulang jika request pasti ditolak (kuota)
+    APPEND_RETRYABLE_STATUS = {429}
+    
+    def __init__(
+        self,
+        sheet=None,
+        max_retries: int = SHEETS_MAX_RETRIES,
+        backoff_base: float = SHEETS_BACKOFF_BASE,
+        backoff_max: float = SHEETS_BACKOFF_MAX,
+        max_rows_per_request: int = SHEETS_MAX_ROWS_PER_REQUEST
+    ):
+        """
+        Args:
+            sheet: Spreadsheet yang sudah dibuka (mis. tests.fake_gspread.FakeSpreadsheet
+                untuk pengujian offline); None untuk koneksi dari Streamlit Secrets
+            max_retries: Jumlah retry maksimal per request
+            backoff_base: Jeda retry pertama (detik), berlipat dua setiap retry
+            backoff_max: Jeda maksimal antar retry (detik)
+            max_rows_per_request: Jumlah baris maksimal per panggilan append_rows
+        """
         self.client = None
-        self.sheet = None
-        self._initialize()
+        self.sheet = sheet
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_rows_per_request = max_rows_per_request
+        
+        self._worksheets = {}
+        self._lock = threading.Lock()
+        self._api_calls = 0
+        self._retries = 0
+        self._rows_written = 0
+        
+        if sheet is None:
+            self._initialize()
     
     def _initialize(self):
         """Initialize Google Sheets connection"""
@@ -246,34 +662,288 @@ class GoogleSheetsStorage:
         """Check if Google Sheets is configured"""
         return self.sheet is not None
     
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        """Kode HTTP dari APIError gspread (atau error dengan atribut code)"""
+        code = getattr(error, "code", None)
+        if not isinstance(code, int):
+            code = getattr(getattr(error, "response", None), "status_code", None)
+        return code
+    
+    def _call(
+        self,
+        func: Callable,
+        *args,
+        retry_status: Optional[set] = None,
+        max_wait: Optional[float] = None,
+        **kwargs
+    ):
+        """
+        Menjalankan satu request API dengan exponential backoff (dengan jitter)
+        untuk error kuota/transient
+        
+        Args:
+            func: Fungsi API gspread
+            retry_status: Kode HTTP yang dicoba ulang (default RETRYABLE_STATUS)
+            max_wait: Total jeda retry maksimal (detik); None tanpa batas selain
+                max_retries. Error terakhir diteruskan jika jeda berikutnya
+                melewati batas ini.
+        """
+        if retry_status is None:
+            retry_status = self.RETRYABLE_STATUS
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._lock:
+                    self._api_calls += 1
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or self._status_code(e) not in retry_status:
+                    raise
+                delay = min(self.backoff_max, self.backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+                if max_wait is not None:
+                    if waited >= max_wait:
+                        raise
+                    delay = min(delay, max_wait - waited)
+                waited += delay
+                with self._lock:
+                    self._retries += 1
+                time.sleep(delay)
+    
+    def _worksheet(self, table: str):
+        """Handle worksheet dari cache (request worksheet() hanya sekali per tabel)"""
+        worksheet = self._worksheets.get(table)
+        if worksheet is None:
+            worksheet = self._call(self.sheet.worksheet, table)
+            self._worksheets[table] = worksheet
+        return worksheet
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Statistik penggunaan API
+        
+        Returns:
+            Dictionary berisi jumlah request API, retry dan baris yang tertulis
+        """
+        with self._lock:
+            return {
+                "api_calls": self._api_calls,
+                "retries": self._retries,
+                "rows_written": self._rows_written,
+                "cached_worksheets": sorted(self._worksheets)
+            }
+    
     def save_prediction(
         self,
         original_text: str,
         cleaned_text: str,
         result: Dict[str, Any]
     ) -> bool:
-        """Save prediction to Google Sheets"""
+        """Save prediction to Google Sheets (retry capped at SHEETS_INTERACTIVE_MAX_WAIT)"""
+        return self.append_rows(
+            "predictions", [prediction_row(original_text, cleaned_text, result)],
+            max_wait=SHEETS_INTERACTIVE_MAX_WAIT
+        )
+    
+    def save_feedback(
+        self,
+        original_text: str,
+        predicted_label: str,
+        is_correct: bool,
+        correct_label: Optional[str] = None,
+        feedback_comment: str = ""
+    ) -> bool:
+        """Save feedback to Google Sheets (retry capped at SHEETS_INTERACTIVE_MAX_WAIT)"""
+        return self.append_rows("feedback", [feedback_row(
+            original_text, predicted_label, is_correct, correct_label, feedback_comment
+        )], max_wait=SHEETS_INTERACTIVE_MAX_WAIT)
+    
+    def save_shadow_stats(self, stats: Dict[str, Any]) -> bool:
+        """Save shadow model statistics to Google Sheets"""
+        return self.append_rows("shadow", [shadow_stats_row(stats)])
+    
+    def append_rows(self, table: str, rows: List[list], max_wait: Optional[float] = None) -> bool:
+        """
+        Append several rows to a worksheet in one API call
+        
+        Only quota errors (429) are retried: append_rows is not idempotent and a
+        5xx response may come after the rows were already written.
+        
+        Args:
+            table: Worksheet name ('predictions', 'feedback', 'shadow')
+            rows: List of rows matching the worksheet headers
+            max_wait: Cap on the total retry backoff per request (seconds);
+                None for background writers (bounded by max_retries only)
+        """
         if not self.is_available():
             return False
         
         try:
-            worksheet = self.sheet.worksheet("predictions")
-            
-            worksheet.append_row([
-                get_timestamp(),
-                original_text,
-                cleaned_text,
-                result['label'],
-                f"{result['confidence']:.2f}",
-                f"{result['probabilities']['Negatif']:.2f}",
-                f"{result['probabilities']['Netral']:.2f}",
-                f"{result['probabilities']['Positif']:.2f}"
-            ])
-            
+            worksheet = self._worksheet(table)
+            for start in range(0, len(rows), self.max_rows_per_request):
+                chunk = rows[start:start + self.max_rows_per_request]
+                self._call(
+                    worksheet.append_rows, chunk,
+                    retry_status=self.APPEND_RETRYABLE_STATUS, max_wait=max_wait
+                )
+                with self._lock:
+                    self._rows_written += len(chunk)
             return True
         except Exception as e:
-            st.warning(f"Gagal menyimpan ke Google Sheets: {e}")
+            logger.warning("Gagal menyimpan ke Google Sheets (%s): %s", table, e)
             return False
+
+
+# ==================== SQLITE STORAGE ====================
+# Index per tabel: nama -> kolom. Index SQLite selalu menyertakan rowid,
+# sehingga filter label + urutan timestamp terbaru dilayani satu index scan
+SQLITE_INDEXES = {
+    "predictions": {
+        "idx_predictions_timestamp": "timestamp",
+        "idx_predictions_label": "predicted_label, timestamp",
+        "idx_predictions_text_hash": "text_hash"
+    },
+    "feedback": {
+        "idx_feedback_timestamp": "timestamp",
+        "idx_feedback_label": "predicted_label, is_correct, correct_label",
+        "idx_feedback_text_hash": "text_hash"
+    },
+    "shadow": {
+        "idx_shadow_timestamp": "timestamp"
+    }
+}
+
+
+def text_hash(text: str) -> str:
+    """Hash teks (16 karakter hex SHA-1) untuk pencarian teks yang sama lewat index"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class SQLiteStorage:
+    """
+    Penyimpanan lokal menggunakan SQLite (interface sama dengan LocalCSVStorage)
+    
+    Database dibuka dalam mode WAL: beberapa proses/worker bisa menulis
+    bersamaan tanpa baris yang saling menyisip (penulis antri lewat busy
+    timeout) dan pembaca tidak memblokir penulis. Setiap thread memakai
+    koneksi sendiri; baris ditulis per batch dengan satu prepared INSERT
+    (executemany) dalam satu transaksi. Query history memakai index
+    timestamp, label prediksi dan hash teks.
+    
+    Semua kolom disimpan sebagai TEXT persis seperti di CSV, sehingga
+    get_history/query_history mengembalikan dictionary string yang sama
+    dengan LocalCSVStorage. CSV lama tidak diimpor otomatis; jalankan
+    `python data_storage.py import-csv`.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = SQLITE_DB_PATH,
+        busy_timeout: float = SQLITE_BUSY_TIMEOUT
+    ):
+        """
+        Args:
+            db_path: Path file database
+            busy_timeout: Waktu tunggu (detik) jika database sedang dikunci penulis lain
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._insert_sql = {}
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._create_schema()
+    
+    @staticmethod
+    def _columns(table: str) -> List[str]:
+        """Kolom tabel: header CSV, ditambah text_hash jika tabel berisi teks"""
+        headers = STORAGE_TABLES[table][1]
+        return headers + ["text_hash"] if "original_text" in headers else list(headers)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Koneksi milik thread ini (dibuat saat pertama dipakai)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: transaksi diatur sendiri (BEGIN IMMEDIATE)
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.busy_timeout,
+                isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Transaksi tulis; BEGIN IMMEDIATE mengambil lock tulis di awal sehingga
+        penulis lain menunggu (busy timeout) alih-alih gagal di tengah transaksi
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def _create_schema(self):
+        """Membuat tabel, index dan tabel catatan impor CSV (idempoten)"""
+        with self._transaction() as conn:
+            for table in STORAGE_TABLES:
+                columns = self._columns(table)
+                definitions = ", ".join(f"{column} TEXT" for column in columns)
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, {definitions})")
+                for name, indexed in SQLITE_INDEXES[table].items():
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({indexed})")
+                self._insert_sql[table] = (
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})"
+                )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS csv_imports "
+                "(path TEXT PRIMARY KEY, rows INTEGER, imported_at TEXT)"
+            )
+    
+    def _insert(self, conn: sqlite3.Connection, table: str, rows) -> int:
+        """
+        Menjalankan prepared INSERT untuk semua baris (text_hash dihitung di sini)
+        
+        Nilai diubah ke string seperti csv.writer (None menjadi "")
+        """
+        rows = [["" if value is None else str(value) for value in row] for row in rows]
+        headers = STORAGE_TABLES[table][1]
+        if "original_text" in headers:
+            text_index = headers.index("original_text")
+            rows = [row + [text_hash(row[text_index])] for row in rows]
+        cursor = conn.executemany(self._insert_sql[table], rows)
+        return cursor.rowcount
+    
+    def is_available(self) -> bool:
+        """Database bisa dibuka"""
+        try:
+            self._connection()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def save_prediction(
+        self,
+        original_text: str,
+        cleaned_text: str,
+        result: Dict[str, Any]
+    ) -> bool:
+        """Menyimpan hasil prediksi ke tabel predictions"""
+        return self.append_rows("predictions", [prediction_row(original_text, cleaned_text, result)])
     
     def save_feedback(
         self,
@@ -283,26 +953,430 @@ class GoogleSheetsStorage:
         correct_label: Optional[str] = None,
         feedback_comment: str = ""
     ) -> bool:
-        """Save feedback to Google Sheets"""
-        if not self.is_available():
-            return False
+        """Menyimpan feedback user ke tabel feedback"""
+        return self.append_rows("feedback", [feedback_row(
+            original_text, predicted_label, is_correct, correct_label, feedback_comment
+        )])
+    
+    def save_shadow_stats(self, stats: Dict[str, Any]) -> bool:
+        """Menyimpan snapshot statistik shadow model ke tabel shadow"""
+        return self.append_rows("shadow", [shadow_stats_row(stats)])
+    
+    def append_rows(self, table: str, rows: List[list]) -> bool:
+        """
+        Menulis beberapa baris sekaligus dalam satu transaksi
         
-        try:
-            worksheet = self.sheet.worksheet("feedback")
-            
-            worksheet.append_row([
-                get_timestamp(),
-                original_text,
-                predicted_label,
-                "Ya" if is_correct else "Tidak",
-                correct_label or "-",
-                feedback_comment
-            ])
+        Args:
+            table: Nama tabel di STORAGE_TABLES ('predictions', 'feedback', 'shadow')
+            rows: List baris sesuai header tabel
             
+        Returns:
+            True jika berhasil, False jika gagal
+        """
+        try:
+            with self._transaction() as conn:
+                self._insert(conn, table, rows)
             return True
         except Exception as e:
-            st.warning(f"Gagal menyimpan feedback ke Google Sheets: {e}")
+            logger.warning("Gagal menyimpan ke SQLite (%s): %s", table, e)
             return False
+    
+    def query_history(
+        self,
+        label: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        text: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        Mengambil history prediksi dengan filter (memakai index)
+        
+        Args:
+            label: Hanya label prediksi ini
+            start: Timestamp minimal ("YYYY-MM-DD" atau "YYYY-MM-DD HH:MM:SS")
+            end: Timestamp batas atas (eksklusif)
+            text: Hanya prediksi untuk teks asli yang persis sama
+            min_confidence: Confidence minimal (persen)
+            limit: Jumlah maksimal data yang diambil
+            offset: Jumlah data terbaru yang dilewati
+            
+        Returns:
+            List of dictionaries berisi history, terbaru di atas
+        """
+        conditions, params = [], []
+        if label is not None:
+            conditions.append("predicted_label = ?")
+            params.append(label)
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("timestamp < ?")
+            params.append(end)
+        if text is not None:
+            conditions.append("text_hash = ? AND original_text = ?")
+            params.extend([text_hash(text), text])
+        if min_confidence is not None:
+            conditions.append("CAST(confidence AS REAL) >= ?")
+            params.append(min_confidence)
+        
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        sql = (
+            f"SELECT {', '.join(HISTORY_HEADERS)} FROM predictions {where}"
+            "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        )
+        rows = self._connection().execute(sql, params + [limit, offset]).fetchall()
+        return [dict(row) for row in rows]
+    
+    def get_history(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """
+        Mengambil history prediksi
+        
+        Args:
+            limit: Jumlah maksimal data yang diambil
+            offset: Jumlah data terbaru yang dilewati
+            
+        Returns:
+            List of dictionaries berisi history, terbaru di atas
+        """
+        try:
+            return self.query_history(limit=limit, offset=offset)
+        except Exception as e:
+            st.warning(f"Gagal membaca history: {e}")
+            return []
+    
+    def get_feedback_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik feedback (GROUP BY lewat index label)
+        
+        Returns:
+            Dictionary dengan format sama seperti LocalCSVStorage.get_feedback_stats
+        """
+        try:
+            state = FeedbackStats._empty_state()
+            rows = self._connection().execute(
+                "SELECT predicted_label, is_correct, correct_label, COUNT(*) FROM feedback "
+                "GROUP BY predicted_label, is_correct, correct_label"
+            )
+            for predicted_label, is_correct, correct_label, count in rows:
+                FeedbackStats._apply(state, {
+                    "predicted_label": predicted_label,
+                    "is_correct": is_correct,
+                    "correct_label": correct_label
+                }, count)
+            return FeedbackStats.summary(state)
+        except Exception as e:
+            logger.warning("Gagal membaca statistik feedback dari SQLite: %s", e)
+            return FeedbackStats.summary(FeedbackStats._empty_state())
+    
+    def _import_chunk(self, table: str, key: str, offset: int, batch: List[list], done: bool) -> bool:
+        """
+        Menulis satu chunk impor CSV beserta progresnya dalam satu transaksi
+        
+        Args:
+            table: Nama tabel
+            key: Path absolut CSV (kunci di csv_imports)
+            offset: Jumlah baris CSV yang sudah diimpor sebelum chunk ini
+            batch: Baris chunk ini
+            done: Chunk terakhir (impor ditandai selesai)
+            
+        Returns:
+            False jika progres di database tidak sama dengan offset (impor lain
+            sedang/sudah berjalan), chunk tidak ditulis
+        """
+        with self._transaction() as conn:
+            progress = conn.execute(
+                "SELECT rows, imported_at FROM csv_imports WHERE path = ?", (key,)
+            ).fetchone()
+            if (progress[0] if progress else 0) != offset or (progress and progress[1]):
+                return False
+            self._insert(conn, table, batch)
+            conn.execute(
+                "INSERT OR REPLACE INTO csv_imports (path, rows, imported_at) VALUES (?, ?, ?)",
+                (key, offset + len(batch), get_timestamp() if done else None)
+            )
+        return True
+    
+    def import_csv(self, table: str, csv_path: Optional[str] = None, batch_size: int = 10000) -> int:
+        """
+        Mengimpor CSV ke tabel satu kali (path yang sudah diimpor dilewati)
+        
+        Setiap chunk batch_size baris di-commit bersama progresnya di tabel
+        csv_imports, sehingga lock tulis hanya ditahan per chunk (penulis lain
+        tetap jalan) dan impor yang terputus dilanjutkan dari baris terakhir.
+        
+        Args:
+            table: Nama tabel di STORAGE_TABLES
+            csv_path: Path CSV (default file CSV tabel di data/)
+            batch_size: Jumlah baris per transaksi
+            
+        Returns:
+            Jumlah baris yang diimpor oleh panggilan ini
+        """
+        csv_path = csv_path or STORAGE_TABLES[table][0]
+        headers = STORAGE_TABLES[table][1]
+        if not os.path.exists(csv_path):
+            return 0
+        
+        key = os.path.abspath(csv_path)
+        progress = self._connection().execute(
+            "SELECT rows, imported_at FROM csv_imports WHERE path = ?", (key,)
+        ).fetchone()
+        if progress and progress[1]:
+            return 0
+        offset = start = progress[0] if progress else 0
+        
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or headers
+            # Kolom dicocokkan berdasarkan nama; kolom yang tidak ada diisi kosong
+            positions = [header.index(column) if column in header else None for column in headers]
+            # Baris yang sudah diimpor sebelumnya dilewati
+            for _ in range(start):
+                next(reader, None)
+            
+            batch = []
+            for row in reader:
+                batch.append([
+                    row[position] if position is not None and position < len(row) else ""
+                    for position in positions
+                ])
+                if len(batch) >= batch_size:
+                    if not self._import_chunk(table, key, offset, batch, done=False):
+                        return offset - start
+                    offset += len(batch)
+                    batch = []
+            if self._import_chunk(table, key, offset, batch, done=True):
+                offset += len(batch)
+        return offset - start
+    
+    def import_existing_csv(self) -> Dict[str, int]:
+        """
+        Mengimpor semua CSV lama di data/ (predictions, feedback, shadow)
+        
+        Returns:
+            Dictionary tabel -> jumlah baris yang diimpor (0 jika sudah pernah)
+        """
+        return {table: self.import_csv(table) for table in STORAGE_TABLES}
+    
+    def close(self):
+        """Menutup semua koneksi"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+def create_local_storage(backend: str = LOCAL_STORAGE_BACKEND):
+    """
+    Membuat storage lokal sesuai LOCAL_STORAGE_BACKEND
+    
+    Args:
+        backend: 'csv' (LocalCSVStorage) atau 'sqlite' (SQLiteStorage)
+        
+    Returns:
+        Instance storage lokal
+    """
+    if backend == "csv":
+        return LocalCSVStorage()
+    if backend == "sqlite":
+        return SQLiteStorage()
+    raise ValueError(f"Backend penyimpanan lokal tidak dikenal: {backend}")
+
+
+# ==================== WRITE-BEHIND WRITER ====================
+# Penanda untuk worker thread writer
+_STOP = object()
+# Jeda (detik) antar percobaan flush() memasukkan penanda ke antrian yang penuh
+_FLUSH_RETRY_INTERVAL = 0.01
+
+
+class WriteBehindWriter:
+    """
+    Antrian terbatas untuk menulis baris ke storage di background
+    
+    Baris dikumpulkan per tabel dan ditulis dalam satu batch ketika jumlahnya
+    mencapai batch_size atau flush_interval sudah lewat, sehingga penyimpanan
+    tidak menambah latency request. Jika antrian penuh, baris dibuang (dihitung
+    sebagai dropped) agar pemanggil tidak pernah menunggu.
+    """
+    
+    def __init__(
+        self,
+        write_rows: Callable[[str, List[list]], bool],
+        max_size: int = STORAGE_QUEUE_SIZE,
+        batch_size: int = STORAGE_BATCH_SIZE,
+        flush_interval: float = STORAGE_FLUSH_INTERVAL
+    ):
+        """
+        Inisialisasi writer dan menjalankan worker thread
+        
+        Args:
+            write_rows: Callable (tabel, list baris) -> bool yang menulis satu batch
+            max_size: Kapasitas antrian (baris)
+            batch_size: Jumlah baris yang memicu flush
+            flush_interval: Umur maksimal (detik) baris di buffer sebelum ditulis
+        """
+        self.write_rows = write_rows
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stats_lock = threading.Lock()
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        # Cek _closed dan enqueue dalam satu lock agar tidak ada item yang
+        # masuk antrian setelah penanda berhenti (tidak akan pernah diproses).
+        # Di dalam lock hanya ada put_nowait, sehingga put() tidak pernah
+        # menunggu flush()/close() yang sedang menunggu antrian penuh.
+        self._lifecycle_lock = threading.Lock()
+        self._closed = False
+        
+        self._worker = threading.Thread(target=self._run, name="storage-writer", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+    
+    def put(self, table: str, row: list) -> bool:
+        """
+        Memasukkan satu baris ke antrian (tidak pernah menunggu)
+        
+        Args:
+            table: Nama tabel di STORAGE_TABLES
+            row: Baris sesuai header tabel
+            
+        Returns:
+            True jika baris masuk antrian, False jika antrian penuh / writer ditutup
+        """
+        with self._lifecycle_lock:
+            if self._closed:
+                return False
+            try:
+                self._queue.put_nowait((table, row))
+                return True
+            except queue.Full:
+                pass
+        with self._stats_lock:
+            self._dropped += 1
+        return False
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Menulis semua baris yang sedang antre dan menunggu sampai selesai
+        
+        Args:
+            timeout: Waktu tunggu maksimal dalam detik (None: tanpa batas)
+            
+        Returns:
+            True jika flush selesai dalam timeout, False jika antrian tetap
+            penuh atau penulisan belum selesai saat timeout habis
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        while True:
+            with self._lifecycle_lock:
+                if self._closed:
+                    # close() sudah menulis (atau sedang menulis) sisa antrian
+                    return True
+                try:
+                    self._queue.put_nowait(done)
+                    break
+                except queue.Full:
+                    pass
+            # Antrian penuh: tunggu di luar lock agar put() tetap langsung kembali
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            time.sleep(_FLUSH_RETRY_INTERVAL if remaining is None else min(_FLUSH_RETRY_INTERVAL, remaining))
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return done.wait(remaining)
+    
+    def _write(self, buffers: Dict[str, List[list]]):
+        """Menulis semua buffer tabel (dipanggil dari worker thread)"""
+        for table, rows in buffers.items():
+            if not rows:
+                continue
+            try:
+                ok = self.write_rows(table, rows)
+            except Exception as e:
+                logger.warning("Gagal menulis %d baris ke %s: %s", len(rows), table, e)
+                ok = False
+            with self._stats_lock:
+                self._batches += 1
+                if ok:
+                    self._written += len(rows)
+                else:
+                    self._failed += len(rows)
+        buffers.clear()
+    
+    def _run(self):
+        """Loop utama worker thread"""
+        buffers: Dict[str, List[list]] = {}
+        pending = 0
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is None or item is _STOP or isinstance(item, threading.Event):
+                # Jendela waktu habis, flush manual atau shutdown
+                self._write(buffers)
+                pending, deadline = 0, None
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+                continue
+            
+            table, row = item
+            buffers.setdefault(table, []).append(row)
+            pending += 1
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if pending >= self.batch_size:
+                self._write(buffers)
+                pending, deadline = 0, None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik writer
+        
+        Returns:
+            Dictionary berisi kedalaman antrian, jumlah baris tertulis,
+            dibuang (antrian penuh), gagal ditulis dan jumlah batch
+        """
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches
+            }
+    
+    def close(self, timeout: Optional[float] = None):
+        """Menulis sisa antrian lalu menghentikan worker thread (dipanggil otomatis saat exit)"""
+        with self._lifecycle_lock:
+            if self._closed:
+                return
+            self._closed = True
+        # Setelah _closed tidak ada item baru, sehingga _STOP tetap item terakhir;
+        # menunggu antrian penuh dilakukan di luar lock
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
 
 
 # ==================== DATA MANAGER (UNIFIED INTERFACE) ====================
@@ -312,9 +1386,30 @@ class DataManager:
     Otomatis memilih storage yang tersedia
     """
     
-    def __init__(self):
-        self.local_storage = LocalCSVStorage()
-        self.cloud_storage = GoogleSheetsStorage()
+    def __init__(
+        self,
+        write_behind: bool = STORAGE_WRITE_BEHIND,
+        cloud_storage: Optional[GoogleSheetsStorage] = None,
+        local_storage=None
+    ):
+        """
+        Args:
+            write_behind: Tulis prediksi lewat WriteBehindWriter di background
+                (default STORAGE_WRITE_BEHIND) alih-alih langsung di request
+            cloud_storage: GoogleSheetsStorage (opsional, mis. dengan spreadsheet
+                dari tests.fake_gspread); None untuk koneksi dari Streamlit Secrets
+            local_storage: LocalCSVStorage atau SQLiteStorage; None untuk
+                backend sesuai LOCAL_STORAGE_BACKEND
+        """
+        self.local_storage = local_storage if local_storage is not None else create_local_storage()
+        self.cloud_storage = cloud_storage if cloud_storage is not None else GoogleSheetsStorage()
+        self.writer = WriteBehindWriter(self._write_rows) if write_behind else None
+    
+    def _write_rows(self, table: str, rows: List[list]) -> bool:
+        """Menulis satu batch baris ke storage yang tersedia (Google Sheets > lokal)"""
+        if self.cloud_storage.is_available():
+            return self.cloud_storage.append_rows(table, rows)
+        return self.local_storage.append_rows(table, rows)
     
     def save_prediction(
         self,
@@ -325,7 +1420,13 @@ class DataManager:
         """
         Menyimpan prediksi ke storage yang tersedia
         Prioritas: Google Sheets > Local CSV
+        
+        Jika write-behind aktif, baris hanya dimasukkan ke antrian writer
+        (True berarti baris diterima antrian, bukan sudah tertulis).
         """
+        if self.writer is not None:
+            return self.writer.put("predictions", prediction_row(original_text, cleaned_text, result))
+        
         # Try cloud storage first (for deployment)
         if self.cloud_storage.is_available():
             return self.cloud_storage.save_prediction(original_text, cleaned_text, result)
@@ -355,18 +1456,39 @@ class DataManager:
             original_text, predicted_label, is_correct, correct_label, feedback_comment
         )
     
-    def get_history(self, limit: int = 100) -> List[Dict]:
-        """Mengambil history prediksi"""
-        return self.local_storage.get_history(limit)
+    def save_shadow_stats(self, stats: Dict[str, Any]) -> bool:
+        """
+        Menyimpan statistik evaluasi shadow model ke storage yang tersedia
+        (dipanggil berkala dari worker thread ShadowEvaluator)
+        """
+        if self.cloud_storage.is_available():
+            return self.cloud_storage.save_shadow_stats(stats)
+        
+        return self.local_storage.save_shadow_stats(stats)
+    
+    def get_history(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """Mengambil history prediksi (prediksi di antrian write-behind ditulis dulu)"""
+        self.flush(timeout=STORAGE_FLUSH_INTERVAL)
+        return self.local_storage.get_history(limit, offset)
     
     def get_feedback_stats(self) -> Dict[str, Any]:
         """Mengambil statistik feedback"""
         return self.local_storage.get_feedback_stats()
     
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Statistik write-behind writer (kosong jika tidak aktif)"""
+        return self.writer.get_stats() if self.writer is not None else {}
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Menulis semua prediksi yang masih di antrian write-behind"""
+        return self.writer.flush(timeout) if self.writer is not None else True
+    
     def get_storage_type(self) -> str:
         """Mendapatkan jenis storage yang aktif"""
         if self.cloud_storage.is_available():
             return "Google Sheets (Cloud)"
+        if isinstance(self.local_storage, SQLiteStorage):
+            return "SQLite (Local)"
         return "Local CSV"
 
 
@@ -375,3 +1497,26 @@ class DataManager:
 def get_data_manager() -> DataManager:
     """Get singleton instance of DataManager"""
     return DataManager()
+
+
+# ==================== CLI ====================
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Penyimpanan data Analisis Sentimen MBG")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    p_import = subparsers.add_parser("import-csv", help="Impor CSV di data/ ke database SQLite (sekali)")
+    p_import.add_argument("--db", default=SQLITE_DB_PATH)
+    
+    args = parser.parse_args()
+    
+    if args.command == "import-csv":
+        storage = SQLiteStorage(args.db)
+        for table, count in storage.import_existing_csv().items():
+            print(f"{table:12s}: {count} baris diimpor")
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
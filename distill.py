@@ -0,0 +1,334 @@
+"""
+Distilasi model Bi-GRU ke student network yang lebih kecil
+
+Pipeline (reproducible dengan --seed):
+1. Baca korpus CSV, preprocessing + tokenisasi dengan pipeline TextPreprocessor
+   (melalui CompiledLexicon, hasilnya identik dengan preprocess + tokenize_and_pad)
+2. Soft label dari model produksi (teacher)
+3. Latih student di CPU pada soft label (opsional dicampur label asli)
+4. Laporan akurasi, agreement dengan teacher, latency dan ukuran model
+
+Student disimpan sebagai .keras dengan input (None, MAX_LEN) int32 dan output
+softmax NUM_CLASSES, sama seperti teacher, sehingga bisa langsung dipakai
+sebagai MODEL_PATH / SentimentAnalyzer(model=...) atau dievaluasi dulu sebagai
+SHADOW_MODEL_PATH. Arsitektur 'gru' dan 'mlp' juga bisa diekspor ke backend
+NumPy (--export-numpy).
+
+Penggunaan:
+    python distill.py --csv data/sentiment_history.csv [--text-column original_text]
+                      [--label-column LABEL] [--student cnn|gru|mlp]
+                      [--output models/student_model.keras] [--epochs 5] [--seed 42]
+"""
+import os
+import json
+import time
+import argparse
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+from config import (
+    VOCAB_SIZE,
+    MAX_LEN,
+    NUM_CLASSES,
+    PREDICT_BATCH_SIZE,
+    STUDENT_ARCHITECTURE,
+    STUDENT_MODEL_PATH
+)
+
+# Arsitektur student yang tersedia, beserta dukungan ekspor ke backend NumPy
+STUDENT_ARCHITECTURES = {
+    "cnn": False,   # Embedding -> Conv1D -> GlobalMaxPooling1D -> Dense
+    "gru": True,    # Embedding -> GRU kecil (satu arah) -> Dense
+    "mlp": True     # Embedding -> GlobalAveragePooling1D -> Dense -> Dense
+}
+
+
+def build_student(
+    architecture: str = STUDENT_ARCHITECTURE,
+    embedding_dim: int = 32,
+    units: int = 32,
+    compile: bool = True
+):
+    """
+    Membangun model student (belum dilatih)
+
+    Embedding tidak memakai mask_zero (sama seperti teacher) sehingga
+    komentar kosong tetap menghasilkan probabilitas yang valid.
+
+    Args:
+        architecture: 'cnn', 'gru' atau 'mlp'
+        embedding_dim: Dimensi embedding
+        units: Jumlah filter Conv1D / unit GRU / unit Dense tersembunyi
+        compile: Compile dengan optimizer untuk pelatihan (False: inferensi saja)
+
+    Returns:
+        Model Keras
+    """
+    import tensorflow as tf  # Lazy import: TensorFlow hanya dimuat saat dibutuhkan
+
+    layers = tf.keras.layers
+    body = {
+        "cnn": [
+            layers.Conv1D(units, 3, activation="relu"),
+            layers.GlobalMaxPooling1D()
+        ],
+        "gru": [
+            layers.GRU(units // 2)
+        ],
+        "mlp": [
+            layers.GlobalAveragePooling1D(),
+            layers.Dense(units, activation="relu"),
+            layers.Dropout(0.2)
+        ]
+    }
+    if architecture not in body:
+        raise ValueError(f"Arsitektur student tidak dikenal: {architecture}")
+
+    model = tf.keras.Sequential(
+        [tf.keras.Input(shape=(MAX_LEN,), dtype="int32"), layers.Embedding(VOCAB_SIZE, embedding_dim)]
+        + body[architecture]
+        + [layers.Dense(NUM_CLASSES, activation="softmax")],
+        name=f"student_{architecture}"
+    )
+    if compile:
+        model.compile(optimizer=tf.keras.optimizers.Adam(1e-3), loss="categorical_crossentropy")
+    return model
+
+
+def split_indices(n: int, val_fraction: float, seed: int) -> tuple:
+    """
+    Membagi indeks data latih/validasi secara deterministik
+
+    Returns:
+        Tuple (indeks latih, indeks validasi)
+    """
+    order = np.random.default_rng(seed).permutation(n)
+    n_val = int(round(n * val_fraction))
+    return order[n_val:], order[:n_val]
+
+
+def measure_latency(backend, padded: np.ndarray, samples: int = 200) -> Dict[str, float]:
+    """
+    Latency satu baris dan throughput batch sebuah InferenceBackend
+
+    Args:
+        backend: InferenceBackend
+        padded: Numpy array int32 (N, MAX_LEN)
+        samples: Jumlah panggilan satu baris yang diukur
+
+    Returns:
+        Dictionary berisi p50/p95 latency satu baris (ms) dan throughput batch (baris/s)
+    """
+    backend.warmup()
+    backend.predict(padded[:1])
+    latencies = []
+    for i in range(min(samples, len(padded))):
+        start = time.perf_counter()
+        backend.predict(padded[i:i + 1])
+        latencies.append(time.perf_counter() - start)
+    latencies = np.asarray(latencies) * 1000
+
+    start = time.perf_counter()
+    backend.predict(padded, PREDICT_BATCH_SIZE)
+    batch_time = time.perf_counter() - start
+
+    return {
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 3),
+        "batch_rows_per_s": round(len(padded) / batch_time, 1)
+    }
+
+
+def distill(
+    texts: list,
+    labels: Optional[np.ndarray] = None,
+    architecture: str = STUDENT_ARCHITECTURE,
+    output_path: str = STUDENT_MODEL_PATH,
+    epochs: int = 5,
+    batch_size: int = 128,
+    val_fraction: float = 0.1,
+    hard_label_weight: float = 0.0,
+    seed: int = 42,
+    export_numpy: bool = False
+) -> Dict[str, Any]:
+    """
+    Menjalankan pipeline distilasi dan menyimpan student
+
+    Args:
+        texts: List teks mentah (korpus)
+        labels: Label asli (indeks kelas) atau None; dipakai untuk akurasi dan,
+            jika hard_label_weight > 0, dicampur ke target latih
+        architecture: 'cnn', 'gru' atau 'mlp'
+        output_path: Path file .keras student
+        epochs: Jumlah epoch
+        batch_size: Ukuran batch latih
+        val_fraction: Fraksi korpus untuk evaluasi (tidak ikut dilatih)
+        hard_label_weight: Bobot label asli pada target (0: murni soft label teacher)
+        seed: Seed untuk split data dan inisialisasi bobot
+        export_numpy: Ekspor juga student ke .npz untuk backend NumPy
+
+    Returns:
+        Dictionary laporan (juga ditulis ke <output_path tanpa ekstensi>_report.json)
+
+    Raises:
+        RuntimeError: Model teacher/tokenizer gagal dimuat
+    """
+    import tensorflow as tf
+    from backends import KerasBackend, NumpyBackend
+    from model_utils import create_analyzer
+
+    analyzer, error = create_analyzer()
+    if error:
+        raise RuntimeError(f"Gagal memuat model/tokenizer: {error}")
+    analyzer.prediction_cache = None
+    analyzer.cascade = None
+
+    # 1. Preprocessing + tokenisasi, 2. soft label teacher
+    _, padded = analyzer.get_lexicon().process_batch(texts)
+    teacher = analyzer.backend
+    soft_labels = np.asarray(teacher.predict(padded, PREDICT_BATCH_SIZE), dtype=np.float32)
+
+    targets = soft_labels
+    if labels is not None and hard_label_weight > 0:
+        targets = (1 - hard_label_weight) * soft_labels + hard_label_weight * np.eye(NUM_CLASSES, dtype=np.float32)[labels]
+
+    train_idx, val_idx = split_indices(len(padded), val_fraction, seed)
+    if len(val_idx) == 0:
+        val_idx = train_idx
+
+    # 3. Latih student
+    tf.keras.utils.set_random_seed(seed)
+    student = build_student(architecture)
+    start = time.perf_counter()
+    student.fit(
+        padded[train_idx], targets[train_idx],
+        epochs=epochs, batch_size=batch_size, shuffle=True, verbose=2
+    )
+    train_time = time.perf_counter() - start
+
+    # Simpan tanpa state optimizer (inferensi saja) agar ukuran file sebanding dengan bobot
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    inference_model = build_student(architecture, compile=False)
+    inference_model.set_weights(student.get_weights())
+    inference_model.save(output_path)
+
+    # 4. Laporan pada data validasi
+    student_backend = KerasBackend(student)
+    val_padded = padded[val_idx]
+    teacher_classes = soft_labels[val_idx].argmax(axis=1)
+    student_prediction = student_backend.predict(val_padded, PREDICT_BATCH_SIZE)
+    student_classes = student_prediction.argmax(axis=1)
+
+    teacher_model = analyzer.model
+    report = {
+        "architecture": architecture,
+        "seed": seed,
+        "corpus_size": len(texts),
+        "train_size": len(train_idx),
+        "val_size": len(val_idx),
+        "epochs": epochs,
+        "train_time_s": round(train_time, 1),
+        "agreement": round(float((student_classes == teacher_classes).mean() * 100), 2),
+        "teacher": {
+            "params": int(teacher_model.count_params()) if hasattr(teacher_model, "count_params") else None,
+            "size_kb": round(os.path.getsize(_teacher_path()) / 1024, 1) if _teacher_path() else None,
+            "latency": measure_latency(teacher, val_padded)
+        },
+        "student": {
+            "path": output_path,
+            "params": int(student.count_params()),
+            "size_kb": round(os.path.getsize(output_path) / 1024, 1),
+            "latency": measure_latency(student_backend, val_padded)
+        }
+    }
+
+    if labels is not None:
+        val_labels = labels[val_idx]
+        report["teacher"]["accuracy"] = round(float((teacher_classes == val_labels).mean() * 100), 2)
+        report["student"]["accuracy"] = round(float((student_classes == val_labels).mean() * 100), 2)
+
+    if export_numpy:
+        if not STUDENT_ARCHITECTURES[architecture]:
+            raise ValueError(f"Student '{architecture}' tidak didukung backend NumPy")
+        from numpy_backend import export_keras_to_npz, NumpyBiGRUModel
+
+        npz_path = os.path.splitext(output_path)[0] + ".npz"
+        export_keras_to_npz(output_path, npz_path)
+        report["student"]["numpy"] = {
+            "path": npz_path,
+            "size_kb": round(os.path.getsize(npz_path) / 1024, 1),
+            "latency": measure_latency(NumpyBackend(NumpyBiGRUModel.load(npz_path)), val_padded)
+        }
+
+    report_path = os.path.splitext(output_path)[0] + "_report.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    report["report_path"] = report_path
+    return report
+
+
+def _teacher_path() -> Optional[str]:
+    """Path file model teacher yang dipakai load_assets"""
+    from config import MODEL_PATH, MODEL_PATH_FALLBACK
+
+    for path in (MODEL_PATH, MODEL_PATH_FALLBACK):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def print_report(report: Dict[str, Any]):
+    """Menampilkan laporan distilasi sebagai tabel"""
+    print(f"\nDistilasi student '{report['architecture']}' "
+          f"({report['train_size']} latih / {report['val_size']} validasi, {report['train_time_s']} s):")
+    print(f"  agreement dengan teacher: {report['agreement']:.2f}%")
+
+    rows = [("teacher", report["teacher"]), ("student", report["student"])]
+    if "numpy" in report["student"]:
+        rows.append(("student (numpy)", {**report["student"], **report["student"]["numpy"]}))
+
+    print(f"  {'model':16s} {'akurasi':>8s} {'params':>10s} {'ukuran KB':>10s} "
+          f"{'p50 ms':>8s} {'p95 ms':>8s} {'baris/s':>10s}")
+    for name, metrics in rows:
+        accuracy = metrics.get("accuracy")
+        latency = metrics["latency"]
+        print(
+            f"  {name:16s} {'-' if accuracy is None else f'{accuracy:.2f}%':>8s} "
+            f"{metrics['params'] or '-':>10} {metrics['size_kb'] or '-':>10} "
+            f"{latency['p50_ms']:8.2f} {latency['p95_ms']:8.2f} {latency['batch_rows_per_s']:10.1f}"
+        )
+    print(f"  laporan: {report['report_path']}")
+
+
+def main():
+    from labeled_data import read_labeled_csv
+
+    parser = argparse.ArgumentParser(description="Distilasi Bi-GRU ke student network")
+    parser.add_argument("--csv", required=True)
+    parser.add_argument("--text-column", default="original_text")
+    parser.add_argument("--label-column", default=None, help="Kolom label asli (opsional, untuk akurasi)")
+    parser.add_argument("--student", choices=sorted(STUDENT_ARCHITECTURES), default=STUDENT_ARCHITECTURE)
+    parser.add_argument("--output", default=STUDENT_MODEL_PATH)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--val-fraction", type=float, default=0.1)
+    parser.add_argument("--hard-label-weight", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--export-numpy", action="store_true", help="Ekspor student ke .npz (gru/mlp)")
+
+    args = parser.parse_args()
+
+    texts, labels = read_labeled_csv(args.csv, args.text_column, args.label_column)
+    try:
+        report = distill(
+            texts, labels, args.student, args.output, args.epochs, args.batch_size,
+            args.val_fraction, args.hard_label_weight, args.seed, args.export_numpy
+        )
+    except RuntimeError as e:
+        raise SystemExit(str(e)) from None
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
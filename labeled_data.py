@@ -0,0 +1,36 @@
+"""
+Pembacaan dataset berlabel dari CSV untuk tool offline (benchmark, cascade,
+distill)
+"""
+import csv
+from typing import Optional
+
+import numpy as np
+
+from config import LABEL_MAP
+
+
+def read_labeled_csv(path: str, text_column: str, label_column: Optional[str]) -> tuple:
+    """
+    Membaca CSV berlabel (label berupa nama kelas atau indeks 0/1/2)
+
+    Args:
+        path: Path file CSV
+        text_column: Nama kolom teks
+        label_column: Nama kolom label (None jika CSV tidak berlabel)
+
+    Returns:
+        Tuple (list teks, numpy array label atau None)
+    """
+    label_index = {name.lower(): index for index, name in LABEL_MAP.items()}
+    texts, labels = [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            texts.append(row[text_column])
+            if label_column and row.get(label_column, '') != '':
+                value = row[label_column].strip()
+                labels.append(int(value) if value.isdigit() else label_index[value.lower()])
+
+    if label_column and len(labels) != len(texts):
+        raise ValueError(f"Kolom '{label_column}' kosong pada sebagian baris")
+    return texts, (np.asarray(labels) if labels else None)
@@ -1,6 +1,9 @@
+import os
+import time
 import pickle
+import threading
 import numpy as np
-import tensorflow as tf
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Tuple, Optional, Dict, Any
 
 from config import (
@@ -8,9 +11,34 @@ from config import (
     TOKENIZER_PATH, 
     MODEL_PATH_FALLBACK, 
     TOKENIZER_PATH_FALLBACK,
-    LABEL_MAP
+    TOKENIZER_VOCAB_PATH,
+    TOKENIZER_VOCAB_PATH_FALLBACK,
+    LABEL_MAP,
+    LEXICON_CACHE_PATH,
+    PREDICT_BATCH_SIZE,
+    USE_GRAPH_INFERENCE,
+    INFERENCE_BACKEND,
+    NUMPY_MODEL_PATH,
+    TFLITE_MODEL_PATH,
+    PREDICTION_CACHE_ENABLED,
+    ASYNC_INFERENCE_WORKERS,
+    REPLICA_POOL_SIZE,
+    MAX_LEN,
+    SHADOW_MODEL_PATH
 )
-from preprocessing import TextPreprocessor, tokenize_and_pad
+from preprocessing import (
+    TextPreprocessor,
+    CompiledLexicon,
+    VocabularyEncoder,
+    load_vocabulary,
+    tokenize_and_pad
+)
+from numpy_backend import NumpyBiGRUModel, load_numpy_model
+from backends import InferenceBackend, TFLiteBackend, create_backend
+from prediction_cache import PredictionCache
+from replica_pool import create_replica_pool
+from cascade import load_cascade
+from shadow import ShadowEvaluator
 
 
 class SentimentAnalyzer:
@@ -18,50 +46,97 @@ class SentimentAnalyzer:
     Kelas untuk analisis sentimen menggunakan model Bi-GRU
     """
     
-    def __init__(self, model=None, tokenizer=None, preprocessor=None):
+    def __init__(
+        self,
+        model=None,
+        tokenizer=None,
+        preprocessor=None,
+        lexicon_cache_path=LEXICON_CACHE_PATH,
+        use_graph_inference=USE_GRAPH_INFERENCE,
+        prediction_cache=None,
+        async_workers=ASYNC_INFERENCE_WORKERS,
+        cascade=None,
+        shadow=None
+    ):
         """
         Inisialisasi SentimentAnalyzer
         
         Args:
-            model: Model Keras yang sudah diload (opsional)
-            tokenizer: Tokenizer Keras yang sudah diload (opsional)
+            model: Model Keras, NumpyBiGRUModel atau InferenceBackend yang sudah diload (opsional)
+            tokenizer: VocabularyEncoder atau Tokenizer Keras yang sudah diload (opsional)
             preprocessor: Instance TextPreprocessor (opsional)
+            lexicon_cache_path: Path cache CompiledLexicon (None untuk tanpa cache)
+            use_graph_inference: Gunakan tf.function alih-alih model.predict
+            prediction_cache: Instance PredictionCache (opsional). Jika None dan
+                PREDICTION_CACHE_ENABLED, dibuat cache baru
+            async_workers: Jumlah worker thread inferensi untuk predict_async
+            cascade: Instance CascadeClassifier (opsional). Jika None, dimuat dari
+                CASCADE_MODEL_PATH bila CASCADE_ENABLED
+            shadow: Instance ShadowEvaluator (opsional) yang menerima salinan
+                setiap request untuk dievaluasi model kandidat di background
         """
         self.model = model
         self.tokenizer = tokenizer
         self.preprocessor = preprocessor if preprocessor else TextPreprocessor()
         self.label_map = LABEL_MAP
+        self.lexicon_cache_path = lexicon_cache_path
+        self.use_graph_inference = use_graph_inference
+        self._lexicon = None
+        self._backend = None
+        self._backend_model = None
+        
+        if prediction_cache is None and PREDICTION_CACHE_ENABLED:
+            prediction_cache = PredictionCache()
+        self.prediction_cache = prediction_cache
+        self.cascade = cascade if cascade is not None else load_cascade()
+        self.shadow = shadow
+        
+        self.async_workers = async_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
     
     def load_model(self, model_path: str = MODEL_PATH) -> bool:
         """
         Memuat model dari file
         
         Args:
-            model_path: Path ke file model .keras
+            model_path: Path ke file model .keras, .npz (backend NumPy)
+                atau .tflite (backend TFLite)
             
         Returns:
             True jika berhasil, False jika gagal
         """
         try:
-            self.model = tf.keras.models.load_model(model_path)
+            self.model = load_model_file(model_path)
+            self.backend.warmup()
             return True
         except Exception as e:
             print(f"Error loading model: {e}")
             return False
     
-    def load_tokenizer(self, tokenizer_path: str = TOKENIZER_PATH) -> bool:
+    def load_tokenizer(self, tokenizer_path: Optional[str] = None) -> bool:
         """
-        Memuat tokenizer dari file pickle
+        Memuat tokenizer dari file vocabulary JSON atau pickle
         
         Args:
-            tokenizer_path: Path ke file tokenizer .pickle
+            tokenizer_path: Path ke file vocabulary .json atau tokenizer .pickle.
+                Default (None): TOKENIZER_VOCAB_PATH, dikonversi otomatis dari
+                TOKENIZER_PATH jika belum ada
             
         Returns:
             True jika berhasil, False jika gagal
         """
         try:
-            with open(tokenizer_path, 'rb') as handle:
-                self.tokenizer = pickle.load(handle)
+            if tokenizer_path is None:
+                self.tokenizer = load_vocabulary(TOKENIZER_VOCAB_PATH, TOKENIZER_PATH)
+            elif tokenizer_path.endswith('.json'):
+                self.tokenizer = VocabularyEncoder.load(tokenizer_path)
+            else:
+                with open(tokenizer_path, 'rb') as handle:
+                    self.tokenizer = pickle.load(handle)
+            self._lexicon = None
+            if self.prediction_cache is not None:
+                self.prediction_cache.clear()
             return True
         except Exception as e:
             print(f"Error loading tokenizer: {e}")
@@ -76,12 +151,43 @@ class SentimentAnalyzer:
         """
         return self.model is not None and self.tokenizer is not None
     
-    def predict(self, text: str) -> Dict[str, Any]:
+    @property
+    def backend(self) -> InferenceBackend:
+        """
+        Backend inferensi untuk model aktif (dibuat ulang jika model diganti)
+        
+        Returns:
+            Instance InferenceBackend
+        """
+        if self._backend is None or self._backend_model is not self.model:
+            # Hasil cache dari model sebelumnya tidak berlaku lagi
+            if self._backend is not None and self.prediction_cache is not None:
+                self.prediction_cache.clear()
+            self._backend = create_backend(self.model, self.use_graph_inference)
+            self._backend_model = self.model
+        return self._backend
+    
+    def get_lexicon(self) -> CompiledLexicon:
+        """
+        Mengambil CompiledLexicon untuk tokenizer aktif (dibangun sekali)
+        
+        Returns:
+            Instance CompiledLexicon
+        """
+        if self._lexicon is None:
+            self._lexicon = CompiledLexicon.load_or_build(
+                self.preprocessor, self.tokenizer, self.lexicon_cache_path
+            )
+        return self._lexicon
+    
+    def predict(self, text: str, trace: bool = False) -> Dict[str, Any]:
         """
         Melakukan prediksi sentimen untuk teks input
         
         Args:
             text: Teks input mentah
+            trace: Jika True, sertakan hasil setiap langkah preprocessing
+                (untuk visualisasi di UI). Default False agar hasil tetap ringan.
             
         Returns:
             Dictionary berisi:
@@ -90,52 +196,368 @@ class SentimentAnalyzer:
                 - probabilities: Dict probabilitas untuk setiap kelas
                 - cleaned_text: Teks setelah preprocessing
                 - preprocessing_steps: Detail setiap langkah preprocessing
+                  (hanya jika trace=True)
         """
         if not self.is_ready():
             raise RuntimeError("Model dan tokenizer belum dimuat!")
         
-        # Preprocessing
-        cleaned_text = self.preprocessor.preprocess(text)
-        preprocessing_steps = self.preprocessor.get_preprocessing_steps(text)
-        
-        # Tokenisasi dan padding
-        padded_sequence = tokenize_and_pad(cleaned_text, self.tokenizer)
+        cleaned_text, padded_sequence, preprocessing_steps = self.prepare(text, trace)
         
         # Prediksi
-        prediction = self.model.predict(padded_sequence, verbose=0)
-        
-        # Ambil probabilitas dan label
-        probabilities = prediction[0]
-        predicted_class = np.argmax(probabilities)
-        predicted_label = self.label_map[predicted_class]
-        confidence = float(probabilities[predicted_class]) * 100
-        
-        return {
-            'label': predicted_label,
-            'confidence': confidence,
-            'probabilities': {
-                'Negatif': float(probabilities[0]) * 100,
-                'Netral': float(probabilities[1]) * 100,
-                'Positif': float(probabilities[2]) * 100
-            },
-            'cleaned_text': cleaned_text,
-            'preprocessing_steps': preprocessing_steps
-        }
-    
-    def predict_batch(self, texts: list) -> list:
+        prediction = self.predict_proba(padded_sequence)
+        
+        result = self.build_results(prediction, [cleaned_text])[0]
+        
+        if preprocessing_steps is not None:
+            result['preprocessing_steps'] = preprocessing_steps
+        
+        return result
+
+    def explain(self, text: str, trace: bool = False) -> Dict[str, Any]:
+        """
+        Prediksi sentimen beserta kontribusi setiap kata (leave-one-token-out)
+
+        Label dan probabilitas diambil dari predict (cascade, prediction_cache
+        dan shadow sama seperti request biasa); kontribusi dihitung oleh
+        explain_words.
+
+        Args:
+            text: Teks input mentah
+            trace: Sertakan hasil setiap langkah preprocessing
+
+        Returns:
+            Dictionary hasil prediksi (skema sama dengan predict) ditambah
+            'explanation' (lihat explain_words)
+        """
+        result = self.predict(text, trace)
+        result['explanation'] = self.explain_words(result['cleaned_text'])
+        return result
+
+    def explain_words(self, cleaned_text: str) -> list:
+        """
+        Kontribusi setiap kata pada teks yang sudah dipreprocessing
+
+        Untuk setiap token dibuat satu varian sequence tanpa token tersebut.
+        Sequence asli dan semua varian dijalankan dalam satu forward pass batch
+        langsung ke backend model neural (tidak lewat prediction_cache, agar
+        varian tidak mendesak entri asli dari LRU, dan tidak dikirim ke shadow),
+        lalu kontribusi token = probabilitas asli - probabilitas tanpa token.
+
+        Args:
+            cleaned_text: Teks hasil preprocessing (result['cleaned_text'])
+
+        Returns:
+            List {'word', 'contributions'} untuk setiap kata pada cleaned_text;
+            contributions berisi selisih probabilitas (poin persen) per kelas,
+            atau None jika kata tidak masuk sequence model (di luar vocabulary /
+            terpotong MAX_LEN)
+        """
+        if not self.is_ready():
+            raise RuntimeError("Model dan tokenizer belum dimuat!")
+
+        encoder = self.get_lexicon().encoder
+        words = cleaned_text.split()
+        ids = encoder.words_to_ids(words)
+
+        # Posisi kolom sequence untuk setiap kata (None jika kata tidak menghasilkan id)
+        positions = []
+        column = 0
+        for word in words:
+            if encoder.words_to_ids([word]) and column < MAX_LEN:
+                positions.append(column)
+                column += 1
+            else:
+                positions.append(None)
+
+        batch = occlusion_batch(ids, MAX_LEN)
+        prediction = np.asarray(self.backend.predict(batch, None), dtype=np.float64)
+        contributions = (prediction[0] - prediction[1:]) * 100
+        labels = [self.label_map[index] for index in range(prediction.shape[1])]
+
+        return [
+            {
+                'word': word,
+                'contributions': None if position is None else dict(zip(labels, contributions[position].tolist()))
+            }
+            for word, position in zip(words, positions)
+        ]
+
+    def prepare(self, text: str, trace: bool = False) -> Tuple[str, np.ndarray, Optional[Dict[str, str]]]:
+        """
+        Preprocessing dan tokenisasi satu teks (pipeline hanya dijalankan sekali)
+        
+        Args:
+            text: Teks input mentah
+            trace: Jika True, kembalikan juga hasil setiap langkah preprocessing
+            
+        Returns:
+            Tuple (cleaned_text, padded_sequence (1, MAX_LEN), preprocessing_steps atau None)
+        """
+        if trace:
+            preprocessing_steps = self.preprocessor.get_preprocessing_steps(text)
+            cleaned_text = preprocessing_steps['final']
+            return cleaned_text, tokenize_and_pad(cleaned_text, self.tokenizer), preprocessing_steps
+        
+        cleaned_texts, padded_sequence = self.get_lexicon().process_batch([text])
+        return cleaned_texts[0], padded_sequence, None
+    
+    def predict_proba(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Menjalankan model pada matriks sequence yang sudah dipadding
+        
+        Jika cascade aktif, baris yang sudah yakin dijawab klasifier tahap
+        pertama tidak diteruskan ke model. Jika prediction_cache aktif, hanya
+        baris yang belum ada di cache yang dijalankan melalui backend. Jika
+        shadow aktif, salinan request dan hasilnya dikirim ke shadow model;
+        latency produksi yang dikirim hanya waktu forward pass backend, dan
+        hanya jika semua baris dijalankan backend (tidak ada yang dijawab
+        cache atau cascade) agar sebanding dengan latency shadow model.
+        
+        Args:
+            padded_sequences: Numpy array int32 (N, MAX_LEN)
+            batch_size: Jumlah baris per forward pass (default backend jika None)
+            
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES)
+        """
+        if self.shadow is None:
+            predict_neural = self._predict_neural
+        else:
+            # (jumlah baris, detik) setiap forward pass backend untuk request ini
+            timings = []
+            predict_neural = lambda padded, size=None: self._predict_neural(padded, size, timings)
+        
+        if self.cascade is not None:
+            prediction = self.cascade.predict(padded_sequences, predict_neural, batch_size)
+        else:
+            prediction = predict_neural(padded_sequences, batch_size)
+        
+        if self.shadow is not None:
+            rows = sum(count for count, _ in timings)
+            latency = sum(seconds for _, seconds in timings) if rows == len(padded_sequences) else None
+            self.shadow.submit(padded_sequences, prediction, latency)
+        return prediction
+    
+    def _predict_neural(
+        self,
+        padded_sequences: np.ndarray,
+        batch_size: Optional[int] = None,
+        timings: Optional[list] = None
+    ) -> np.ndarray:
+        """
+        Prediksi dengan model neural (melalui prediction_cache jika aktif)
+        
+        Jika timings diberikan, (jumlah baris, detik) setiap panggilan backend
+        ditambahkan ke list tersebut
+        """
+        backend_predict = self.backend.predict
+        if timings is not None:
+            def backend_predict(padded, size=None, predict=backend_predict):
+                start = time.perf_counter()
+                prediction = predict(padded, size)
+                timings.append((len(padded), time.perf_counter() - start))
+                return prediction
+        
+        if self.prediction_cache is None:
+            return backend_predict(padded_sequences, batch_size)
+        return self.prediction_cache.predict(padded_sequences, backend_predict, batch_size)
+    
+    def predict_batch(self, texts: list, batch_size: int = PREDICT_BATCH_SIZE) -> list:
         """
         Melakukan prediksi sentimen untuk batch teks
         
+        Semua teks dipreprocess dan ditokenisasi ke satu matriks (N, MAX_LEN),
+        lalu model dijalankan per chunk berukuran batch_size.
+        
+        Args:
+            texts: List teks input mentah
+            batch_size: Jumlah baris per forward pass model
+            
+        Returns:
+            List hasil prediksi (tanpa preprocessing_steps)
+        """
+        if not self.is_ready():
+            raise RuntimeError("Model dan tokenizer belum dimuat!")
+        
+        if len(texts) == 0:
+            return []
+        
+        cleaned_texts, padded_sequences = self.get_lexicon().process_batch(texts)
+        prediction = self.predict_proba(padded_sequences, batch_size)
+        
+        return self.build_results(prediction, cleaned_texts)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker thread inferensi (dibuat saat pertama kali dibutuhkan)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix="inference-worker"
+                )
+            return self._executor
+    
+    def predict_async(self, text: str, trace: bool = False) -> Future:
+        """
+        Prediksi sentimen tanpa menunggu forward pass selesai
+        
+        Preprocessing dijalankan di thread pemanggil, forward pass di worker
+        thread inferensi. Untuk asyncio gunakan ``asyncio.wrap_future(future)``.
+        
+        Args:
+            text: Teks input mentah
+            trace: Sertakan hasil setiap langkah preprocessing
+            
+        Returns:
+            Future yang berisi dictionary hasil prediksi (skema sama dengan predict)
+        """
+        if not self.is_ready():
+            raise RuntimeError("Model dan tokenizer belum dimuat!")
+        
+        cleaned_text, padded_sequence, preprocessing_steps = self.prepare(text, trace)
+        
+        def run():
+            result = self.build_results(self.predict_proba(padded_sequence), [cleaned_text])[0]
+            if preprocessing_steps is not None:
+                result['preprocessing_steps'] = preprocessing_steps
+            return result
+        
+        return self._get_executor().submit(run)
+    
+    def predict_many_async(self, texts: list, batch_size: int = PREDICT_BATCH_SIZE) -> Future:
+        """
+        Versi asynchronous dari predict_batch
+        
         Args:
             texts: List teks input mentah
+            batch_size: Jumlah baris per forward pass model
+            
+        Returns:
+            Future yang berisi list hasil prediksi (skema sama dengan predict_batch)
+        """
+        if not self.is_ready():
+            raise RuntimeError("Model dan tokenizer belum dimuat!")
+        
+        if len(texts) == 0:
+            future = Future()
+            future.set_result([])
+            return future
+        
+        cleaned_texts, padded_sequences = self.get_lexicon().process_batch(texts)
+        
+        def run():
+            return self.build_results(self.predict_proba(padded_sequences, batch_size), cleaned_texts)
+        
+        return self._get_executor().submit(run)
+    
+    def close(self, wait: bool = True):
+        """
+        Menghentikan worker thread inferensi dan shadow model (jika ada)
+        
+        Args:
+            wait: Tunggu sampai prediksi yang sedang antre selesai
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        if self.shadow is not None:
+            self.shadow.close(None if wait else 0)
+    
+    def build_results(self, prediction: np.ndarray, cleaned_texts: list) -> list:
+        """
+        Menyusun dictionary hasil dari matriks probabilitas (N, NUM_CLASSES)
+        
+        Args:
+            prediction: Output softmax model
+            cleaned_texts: List teks setelah preprocessing
             
         Returns:
-            List hasil prediksi
+            List dictionary hasil prediksi
         """
-        return [self.predict(text) for text in texts]
+        probabilities = np.asarray(prediction, dtype=np.float64)
+        predicted_classes = np.argmax(probabilities, axis=1)
+        confidences = probabilities[np.arange(len(probabilities)), predicted_classes] * 100
+        percentages = (probabilities * 100).tolist()
+        
+        results = []
+        for predicted_class, confidence, probs, cleaned_text in zip(
+            predicted_classes.tolist(), confidences.tolist(), percentages, cleaned_texts
+        ):
+            results.append({
+                'label': self.label_map[predicted_class],
+                'confidence': confidence,
+                'probabilities': {
+                    'Negatif': probs[0],
+                    'Netral': probs[1],
+                    'Positif': probs[2]
+                },
+                'cleaned_text': cleaned_text
+            })
+        
+        return results
+
+
+def occlusion_batch(ids: list, max_len: int = MAX_LEN) -> np.ndarray:
+    """
+    Menyusun sequence asli dan semua varian leave-one-token-out
+
+    Token dihapus (bukan diganti 0) lalu token sesudahnya digeser ke kiri,
+    sehingga varian sama dengan sequence dari teks tanpa kata tersebut,
+    termasuk token ke-(max_len + 1) yang masuk menggantikan token terhapus.
 
+    Args:
+        ids: List id hasil tokenisasi (belum dipotong)
+        max_len: Panjang maksimal sequence
 
-def load_assets() -> Tuple[Optional[tf.keras.Model], Optional[Any], Optional[str]]:
+    Returns:
+        Numpy array int32 (1 + n, max_len): baris 0 sequence asli, baris i + 1
+        sequence tanpa token ke-i, dengan n = min(len(ids), max_len)
+    """
+    n = min(len(ids), max_len)
+    extended = np.zeros(max_len + 1, dtype=np.int32)
+    extended[:min(len(ids), max_len + 1)] = ids[:max_len + 1]
+
+    columns = np.arange(max_len)
+    removed = np.arange(n)[:, None]
+    # Kolom ke-j varian i mengambil token j untuk j < i dan token j + 1 untuk j >= i
+    variants = extended[columns[None, :] + (columns[None, :] >= removed)]
+    return np.vstack([extended[None, :max_len], variants])
+
+
+def load_model_file(model_path: str):
+    """
+    Memuat satu file model sesuai ekstensinya
+    
+    Args:
+        model_path: Path ke file model .keras, .npz (backend NumPy)
+            atau .tflite (backend TFLite)
+        
+    Returns:
+        Model Keras, NumpyBiGRUModel atau TFLiteBackend
+    """
+    if model_path.endswith('.npz'):
+        return NumpyBiGRUModel.load(model_path)
+    if model_path.endswith('.tflite'):
+        return TFLiteBackend(model_path)
+    
+    import tensorflow as tf  # Lazy import: TensorFlow hanya dimuat saat dibutuhkan
+    return tf.keras.models.load_model(model_path)
+
+
+def _load_model(model_path: str, numpy_model_path: str):
+    """Memuat model sesuai INFERENCE_BACKEND (sebagai ReplicaPool jika REPLICA_POOL_SIZE > 1)"""
+    if REPLICA_POOL_SIZE > 1:
+        return create_replica_pool(model_path=model_path, numpy_model_path=numpy_model_path)
+    if INFERENCE_BACKEND == 'numpy':
+        return load_numpy_model(numpy_model_path, model_path)
+    if INFERENCE_BACKEND == 'tflite':
+        return TFLiteBackend(TFLITE_MODEL_PATH)
+    
+    import tensorflow as tf  # Lazy import: TensorFlow hanya dimuat saat dibutuhkan
+    return tf.keras.models.load_model(model_path)
+
+
+def load_assets() -> Tuple[Optional[Any], Optional[Any], Optional[str]]:
     """
     Memuat model dan tokenizer dengan fallback paths
     
@@ -143,6 +565,10 @@ def load_assets() -> Tuple[Optional[tf.keras.Model], Optional[Any], Optional[str
         Tuple (model, tokenizer, error_message)
         - Jika sukses: (model, tokenizer, None)
         - Jika gagal: (None, None, error_message)
+        Model berupa Keras model, NumpyBiGRUModel (INFERENCE_BACKEND='numpy')
+        atau TFLiteBackend (INFERENCE_BACKEND='tflite'), atau ReplicaPool
+        jika REPLICA_POOL_SIZE > 1; tokenizer berupa
+        VocabularyEncoder dari file vocabulary JSON
     """
     model = None
     tokenizer = None
@@ -150,14 +576,15 @@ def load_assets() -> Tuple[Optional[tf.keras.Model], Optional[Any], Optional[str
     try:
         # Coba muat dari folder models/ terlebih dahulu
         try:
-            model = tf.keras.models.load_model(MODEL_PATH)
-            with open(TOKENIZER_PATH, 'rb') as handle:
-                tokenizer = pickle.load(handle)
+            model = _load_model(MODEL_PATH, NUMPY_MODEL_PATH)
+            tokenizer = load_vocabulary(TOKENIZER_VOCAB_PATH, TOKENIZER_PATH)
         except:
             # Fallback: coba dari direktori utama
-            model = tf.keras.models.load_model(MODEL_PATH_FALLBACK)
-            with open(TOKENIZER_PATH_FALLBACK, 'rb') as handle:
-                tokenizer = pickle.load(handle)
+            model = _load_model(MODEL_PATH_FALLBACK, NUMPY_MODEL_PATH)
+            tokenizer = load_vocabulary(TOKENIZER_VOCAB_PATH_FALLBACK, TOKENIZER_PATH_FALLBACK)
+        
+        # Tracing/inisialisasi backend di awal agar request pertama tetap cepat
+        create_backend(model).warmup()
         
         return model, tokenizer, None
     
@@ -165,6 +592,40 @@ def load_assets() -> Tuple[Optional[tf.keras.Model], Optional[Any], Optional[str
         return None, None, str(e)
 
 
+def load_shadow(model_path: Optional[str] = SHADOW_MODEL_PATH, sink=None) -> Optional[ShadowEvaluator]:
+    """
+    Memuat shadow model (model kandidat) jika dikonfigurasi
+    
+    Path dicari seperti load_assets: path yang diberikan lalu nama file yang
+    sama di direktori utama.
+    
+    Args:
+        model_path: Path model kandidat (None untuk menonaktifkan)
+        sink: Callable penerima statistik (mis. DataManager.save_shadow_stats)
+        
+    Returns:
+        Instance ShadowEvaluator, atau None jika tidak dikonfigurasi / gagal dimuat
+    """
+    if not model_path:
+        return None
+    
+    for path in (model_path, os.path.basename(model_path)):
+        if os.path.exists(path):
+            break
+    else:
+        print(f"Shadow model tidak ditemukan: {model_path}")
+        return None
+    
+    try:
+        backend = create_backend(load_model_file(path))
+        backend.warmup()
+    except Exception as e:
+        print(f"Error loading shadow model: {e}")
+        return None
+    
+    return ShadowEvaluator(backend, model_path=path, sink=sink)
+
+
 def create_analyzer() -> Tuple[Optional[SentimentAnalyzer], Optional[str]]:
     """
     Factory function untuk membuat SentimentAnalyzer yang sudah siap digunakan
@@ -179,5 +640,5 @@ def create_analyzer() -> Tuple[Optional[SentimentAnalyzer], Optional[str]]:
     if error:
         return None, error
     
-    analyzer = SentimentAnalyzer(model=model, tokenizer=tokenizer)
+    analyzer = SentimentAnalyzer(model=model, tokenizer=tokenizer, shadow=load_shadow())
     return analyzer, None
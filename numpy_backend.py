@@ -0,0 +1,640 @@
+"""
+Backend inferensi Bi-GRU berbasis NumPy murni
+
+Bobot model diekstrak sekali dari arsip .keras (config.json + model.weights.h5)
+ke file .npz yang ringkas, lalu forward pass dijalankan dengan NumPy secara
+batch tanpa TensorFlow. Bobot dapat di-memory-map langsung dari file .npz
+sehingga beberapa proses worker berbagi halaman memori yang sama.
+
+Penggunaan:
+    python numpy_backend.py export [--model models/Best_Oversampled_Model.keras]
+                                   [--output models/model_weights.npz]
+"""
+import io
+import os
+import re
+import json
+import struct
+import zipfile
+import logging
+import argparse
+import threading
+from typing import Optional, Dict
+
+import numpy as np
+
+from config import MODEL_PATH, NUMPY_MODEL_PATH, NUMPY_MMAP_WEIGHTS, PREDICT_BATCH_SIZE, LENGTH_BUCKETING
+from preprocessing import file_sha256
+
+logger = logging.getLogger(__name__)
+
+# Header lokal zip (tanpa nama file dan extra field) dan id extra field padding
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_PADDING_ID = 0x6E70
+
+# Layer yang tidak berpengaruh saat inferensi
+IDENTITY_LAYERS = {"InputLayer", "Dropout", "SpatialDropout1D", "GaussianNoise", "GaussianDropout"}
+
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 1.0 / (1.0 + np.exp(-x)),
+    "relu": lambda x: np.maximum(x, 0.0),
+}
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    """Softmax yang stabil secara numerik pada axis terakhir"""
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def _activate(x: np.ndarray, name: str) -> np.ndarray:
+    """Menerapkan fungsi aktivasi Keras berdasarkan nama"""
+    if name == "softmax":
+        return _softmax(x)
+    if name not in ACTIVATIONS:
+        raise NotImplementedError(f"Aktivasi '{name}' belum didukung backend NumPy")
+    return ACTIVATIONS[name](x)
+
+
+# ==================== EKSPOR DARI .keras ====================
+def _read_vars(h5_file, path: str) -> list:
+    """Mengambil semua variabel di <path>/vars, terurut sesuai indeks"""
+    group = h5_file[path]["vars"]
+    return [np.asarray(group[key]) for key in sorted(group.keys(), key=int)]
+
+
+def _to_snake_case(name: str) -> str:
+    """Konversi nama kelas ke snake_case seperti keras naming.to_snake_case"""
+    name = re.sub(r"\W+", "", name)
+    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub("([a-z])([A-Z])", r"\1_\2", name).lower()
+
+
+def _layer_group(h5_file, names: tuple) -> str:
+    """
+    Mencari group h5 milik layer. File .keras menamai group berdasarkan
+    nama kelas + urutan (mis. dense, dense_1), dengan nama layer sebagai cadangan
+    """
+    for name in names:
+        for prefix in ("layers", "_layer_checkpoint_dependencies"):
+            path = f"{prefix}/{name}"
+            if path in h5_file:
+                return path
+    raise KeyError(f"Bobot layer '{names[-1]}' tidak ditemukan di model.weights.h5")
+
+
+def _gru_spec(config: dict, go_backwards: bool = None) -> dict:
+    """Mengambil konfigurasi GRU yang relevan untuk inferensi"""
+    return {
+        "units": config["units"],
+        "activation": config.get("activation", "tanh"),
+        "recurrent_activation": config.get("recurrent_activation", "sigmoid"),
+        "use_bias": config.get("use_bias", True),
+        "reset_after": config.get("reset_after", True),
+        "return_sequences": config.get("return_sequences", False),
+        "zero_output_for_mask": config.get("zero_output_for_mask", False),
+        "go_backwards": config.get("go_backwards", False) if go_backwards is None else go_backwards,
+    }
+
+
+def export_keras_to_npz(model_path: str = MODEL_PATH, output_path: str = NUMPY_MODEL_PATH) -> str:
+    """
+    Mengekstrak arsitektur dan bobot dari arsip .keras ke file .npz
+
+    Hanya membutuhkan h5py (tanpa TensorFlow). Layer yang didukung:
+    Embedding, GRU, Bidirectional(GRU), Dense, GlobalMax/AveragePooling1D,
+    dan layer identitas seperti Dropout.
+
+    Args:
+        model_path: Path ke file model .keras
+        output_path: Path file .npz tujuan
+
+    Returns:
+        Path file .npz yang ditulis
+    """
+    import h5py
+
+    with zipfile.ZipFile(model_path) as archive:
+        model_config = json.loads(archive.read("config.json"))
+        weights_bytes = archive.read("model.weights.h5")
+
+    layers = model_config["config"]["layers"]
+    spec = []
+    arrays = {}
+    used_names = {}
+
+    with h5py.File(io.BytesIO(weights_bytes), "r") as h5_file:
+        for layer in layers:
+            kind = layer["class_name"]
+            config = layer["config"]
+            index = len(spec)
+
+            saved_name = _to_snake_case(kind)
+            if saved_name in used_names:
+                used_names[saved_name] += 1
+                saved_name = f"{saved_name}_{used_names[saved_name]}"
+            else:
+                used_names[saved_name] = 0
+            name = (saved_name, config["name"])
+
+            if kind in IDENTITY_LAYERS:
+                continue
+
+            if kind == "Embedding":
+                (arrays[f"{index}/embeddings"],) = _read_vars(h5_file, _layer_group(h5_file, name))
+                spec.append({"type": "Embedding", "mask_zero": config.get("mask_zero", False)})
+
+            elif kind == "GRU":
+                group = _layer_group(h5_file, name)
+                cell_vars = _read_vars(h5_file, f"{group}/cell")
+                for key, value in zip(("kernel", "recurrent_kernel", "bias"), cell_vars):
+                    arrays[f"{index}/{key}"] = value
+                spec.append({"type": "GRU", **_gru_spec(config)})
+
+            elif kind == "Bidirectional":
+                inner = config["layer"]
+                if inner["class_name"] != "GRU":
+                    raise NotImplementedError(f"Bidirectional({inner['class_name']}) belum didukung")
+                group = _layer_group(h5_file, name)
+                backward_config = config.get("backward_layer", {}).get("config", inner["config"])
+                for direction in ("forward", "backward"):
+                    cell_vars = _read_vars(h5_file, f"{group}/{direction}_layer/cell")
+                    for key, value in zip(("kernel", "recurrent_kernel", "bias"), cell_vars):
+                        arrays[f"{index}/{direction}/{key}"] = value
+                forward_spec = _gru_spec(inner["config"])
+                spec.append({
+                    "type": "Bidirectional",
+                    "merge_mode": config.get("merge_mode", "concat"),
+                    "forward": forward_spec,
+                    "backward": _gru_spec(
+                        backward_config,
+                        go_backwards=not forward_spec["go_backwards"]
+                    ),
+                })
+
+            elif kind == "Dense":
+                dense_vars = _read_vars(h5_file, _layer_group(h5_file, name))
+                arrays[f"{index}/kernel"] = dense_vars[0]
+                if len(dense_vars) > 1:
+                    arrays[f"{index}/bias"] = dense_vars[1]
+                spec.append({"type": "Dense", "activation": config.get("activation", "linear")})
+
+            elif kind in ("GlobalMaxPooling1D", "GlobalAveragePooling1D"):
+                spec.append({"type": kind})
+
+            else:
+                raise NotImplementedError(f"Layer '{kind}' belum didukung backend NumPy")
+
+    arrays = {key: value.astype(np.float32) for key, value in arrays.items()}
+    arrays["__spec__"] = np.array(json.dumps(spec))
+    # Hash .keras sumber: load_numpy_model mengekspor ulang hanya jika berbeda
+    arrays["__source_sha256__"] = np.array(file_sha256(model_path))
+
+    # Tulis ke file sementara lalu rename: proses lain yang sedang memory-map
+    # file lama tetap membaca inode lama, bukan file yang sedang ditulis
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    _save_aligned_npz(temp_path, arrays)
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+def _save_aligned_npz(output_path: str, arrays: dict):
+    """
+    Menulis .npz tanpa kompresi (dapat dibaca np.load) dengan data setiap
+    array sejajar 64 byte di file, agar hasil mmap_npz langsung aligned
+    dan bisa dipakai BLAS tanpa salinan
+    """
+    with open(output_path, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as archive:
+        for key, value in arrays.items():
+            buffer = io.BytesIO()
+            np.lib.format.write_array(buffer, np.asarray(value), allow_pickle=False)
+
+            info = zipfile.ZipInfo(f"{key}.npy", date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_STORED
+            # Header .npy sudah kelipatan 64 byte; extra field zip mengisi
+            # sisa agar awal file .npy juga kelipatan 64 byte
+            data_start = f.tell() + _ZIP_LOCAL_HEADER.size + len(info.filename.encode()) + 4
+            padding = -data_start % 64
+            info.extra = struct.pack("<HH", _ZIP_PADDING_ID, padding) + b"\0" * padding
+            archive.writestr(info, buffer.getvalue())
+
+
+# ==================== MEMORY MAP .npz ====================
+
+
+def mmap_npz(npz_path: str) -> Dict[str, np.ndarray]:
+    """
+    Memory-map setiap array di file .npz tanpa menyalinnya ke memori proses
+
+    np.savez menyimpan setiap array sebagai file .npy tanpa kompresi di dalam
+    zip, sehingga data array bisa dipetakan langsung dari offset-nya di file.
+    Halaman memori berasal dari page cache OS dan dibagi oleh semua proses
+    yang memetakan file yang sama (read-only).
+
+    Args:
+        npz_path: Path file .npz (hasil np.savez, bukan savez_compressed)
+
+    Returns:
+        Dictionary nama -> np.memmap read-only (array string dibaca biasa)
+    """
+    arrays = {}
+    with zipfile.ZipFile(npz_path) as archive, open(npz_path, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Array '{name}' terkompresi, tidak bisa di-memory-map")
+
+            # Lewati header lokal zip untuk mencapai awal file .npy
+            f.seek(info.header_offset)
+            header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+            name_length, extra_length = header[-2], header[-1]
+            f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.kind in "OUS":
+                # Array kecil non-numerik (mis. __spec__) cukup dibaca biasa
+                arrays[name] = np.load(io.BytesIO(archive.read(info)), allow_pickle=False)
+                continue
+
+            arrays[name] = np.memmap(
+                npz_path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                order="F" if fortran_order else "C"
+            )
+    return arrays
+
+
+# ==================== PANJANG SEQUENCE ====================
+def sequence_lengths(padded_sequences: np.ndarray) -> np.ndarray:
+    """
+    Panjang sebenarnya setiap baris (padding 'post' dengan id 0)
+
+    Args:
+        padded_sequences: Array int (N, T)
+
+    Returns:
+        Array int (N,) posisi token bukan-nol terakhir + 1 (0 untuk baris kosong)
+    """
+    nonzero = np.asarray(padded_sequences) != 0
+    steps = nonzero.shape[1]
+    return np.where(nonzero.any(axis=1), steps - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+
+def effective_width(padded_sequences: np.ndarray) -> int:
+    """Jumlah kolom awal yang memuat token di minimal satu baris (minimal 1)"""
+    columns = np.flatnonzero(np.asarray(padded_sequences).any(axis=0))
+    return int(columns[-1]) + 1 if columns.size else 1
+
+
+def sort_by_length(padded_sequences: np.ndarray) -> np.ndarray:
+    """
+    Urutan baris dari yang terpendek, agar setiap chunk batch berisi
+    sequence dengan panjang mirip (bucket) dan padding yang dihitung minimal
+
+    Args:
+        padded_sequences: Array int (N, T)
+
+    Returns:
+        Array indeks (N,); hasil prediksi dikembalikan ke urutan asal dengan
+        ``result[order] = predictions``
+    """
+    return np.argsort(sequence_lengths(padded_sequences), kind="stable")
+
+
+# ==================== MODEL NUMPY ====================
+class NumpyBiGRUModel:
+    """
+    Forward pass Bi-GRU dengan NumPy, antarmuka predict() mengikuti model Keras
+    """
+
+    def __init__(self, spec: list, weights: dict, source_sha256: Optional[str] = None):
+        """
+        Inisialisasi model
+
+        Args:
+            spec: List konfigurasi layer hasil export_keras_to_npz
+            weights: Dictionary nama -> array bobot
+            source_sha256: Hash file .keras sumber (None untuk .npz lama)
+        """
+        self.spec = spec
+        self.weights = weights
+        self.source_sha256 = source_sha256
+
+        # State GRU setelah k timestep padding (sama untuk semua baris), per layer;
+        # diisi saat pertama dibutuhkan dari beberapa thread inferensi
+        self._pad_states = {}
+        self._pad_states_lock = threading.Lock()
+        # GlobalMaxPooling1D ikut menghitung output timestep yang di-mask,
+        # sehingga sequence ber-mask hanya boleh dipangkas jika layer ini tidak ada
+        self._can_trim_masked = not any(layer["type"] == "GlobalMaxPooling1D" for layer in spec)
+
+    @classmethod
+    def load(cls, npz_path: str = NUMPY_MODEL_PATH, mmap: bool = NUMPY_MMAP_WEIGHTS) -> "NumpyBiGRUModel":
+        """
+        Memuat model dari file .npz
+
+        Args:
+            npz_path: Path file .npz
+            mmap: Memory-map bobot dari file (dibagi antar proses) alih-alih
+                menyalinnya ke memori proses
+
+        Returns:
+            Instance NumpyBiGRUModel
+        """
+        if mmap:
+            weights = mmap_npz(npz_path)
+        else:
+            with np.load(npz_path, allow_pickle=False) as data:
+                weights = {key: data[key] for key in data.files}
+
+        spec = json.loads(str(weights.pop("__spec__")))
+        source = weights.pop("__source_sha256__", None)
+        return cls(spec, weights, None if source is None else str(source))
+
+    def _gru(self, x: np.ndarray, mask: Optional[np.ndarray], prefix: str, spec: dict,
+             force_zero_output: bool = False, initial_state: Optional[np.ndarray] = None) -> np.ndarray:
+        """Menjalankan satu layer GRU atas batch (B, T, D), opsional dari initial_state (units,)"""
+        kernel = self.weights[f"{prefix}/kernel"]
+        recurrent_kernel = self.weights[f"{prefix}/recurrent_kernel"]
+        bias = self.weights.get(f"{prefix}/bias") if spec["use_bias"] else None
+        units = spec["units"]
+        act = spec["activation"]
+        rec_act = spec["recurrent_activation"]
+        reset_after = spec["reset_after"]
+        zero_output = force_zero_output or spec["zero_output_for_mask"]
+
+        batch, steps, _ = x.shape
+
+        if bias is None:
+            input_bias = recurrent_bias = 0.0
+        elif reset_after:
+            input_bias, recurrent_bias = bias[0], bias[1]
+        else:
+            input_bias, recurrent_bias = bias, 0.0
+
+        # Proyeksi input untuk semua timestep sekaligus
+        x_proj = x @ kernel + input_bias
+
+        order = range(steps - 1, -1, -1) if spec["go_backwards"] else range(steps)
+        if initial_state is None:
+            h = np.zeros((batch, units), dtype=np.float32)
+        else:
+            h = np.broadcast_to(initial_state, (batch, units))
+        outputs = np.zeros((batch, steps, units), dtype=np.float32) if spec["return_sequences"] else None
+
+        for out_index, t in enumerate(order):
+            x_z = x_proj[:, t, :units]
+            x_r = x_proj[:, t, units:2 * units]
+            x_h = x_proj[:, t, 2 * units:]
+
+            if reset_after:
+                inner = h @ recurrent_kernel + recurrent_bias
+                z = _activate(x_z + inner[:, :units], rec_act)
+                r = _activate(x_r + inner[:, units:2 * units], rec_act)
+                hh = _activate(x_h + r * inner[:, 2 * units:], act)
+            else:
+                inner = h @ recurrent_kernel[:, :2 * units]
+                z = _activate(x_z + inner[:, :units], rec_act)
+                r = _activate(x_r + inner[:, units:], rec_act)
+                hh = _activate(x_h + (r * h) @ recurrent_kernel[:, 2 * units:], act)
+
+            h_new = z * h + (1.0 - z) * hh
+
+            if mask is not None:
+                step_mask = mask[:, t:t + 1]
+                output = np.where(step_mask, h_new, 0.0 if zero_output else h)
+                h = np.where(step_mask, h_new, h)
+            else:
+                output = h = h_new
+
+            if outputs is not None:
+                # Keras menyimpan output go_backwards dalam urutan terbalik
+                outputs[:, out_index] = output
+
+        return outputs if outputs is not None else h
+
+    def _pad_state(self, prefix: str, spec: dict, pad_vector: np.ndarray, steps: int) -> np.ndarray:
+        """
+        State GRU setelah membaca `steps` timestep padding dari state nol.
+        Input padding selalu sama (embedding id 0), sehingga cukup dihitung sekali.
+        """
+        key = (prefix, steps)
+        state = self._pad_states.get(key)
+        if state is None:
+            with self._pad_states_lock:
+                state = self._pad_states.get(key)
+                if state is None:
+                    x_pad = np.broadcast_to(pad_vector, (1, steps, len(pad_vector)))
+                    state = self._gru(x_pad, None, prefix, {**spec, "return_sequences": False})[0]
+                    self._pad_states[key] = state
+        return state
+
+    def _gru_skip_padding(self, x: np.ndarray, prefix: str, spec: dict,
+                          pad_vector: np.ndarray, width: int) -> np.ndarray:
+        """
+        GRU tanpa mask atas input langsung dari Embedding, di mana timestep
+        >= width adalah padding untuk semua baris. Untuk go_backwards, padding
+        dibaca lebih dulu sehingga bagian itu diganti state padding yang sudah
+        dihitung dan hanya `width` timestep pertama yang dijalankan.
+        """
+        steps = x.shape[1]
+        if not spec["go_backwards"] or spec["return_sequences"] or width >= steps:
+            return self._gru(x, None, prefix, spec)
+        initial_state = self._pad_state(prefix, spec, pad_vector, steps - width)
+        return self._gru(x[:, :width], None, prefix, spec, initial_state=initial_state)
+
+    def forward(self, padded_sequences: np.ndarray, trim: bool = True) -> np.ndarray:
+        """
+        Forward pass untuk satu batch
+
+        Timestep padding di akhir batch (kolom yang nol di semua baris) tidak
+        dihitung ulang: dipangkas jika Embedding memakai mask_zero, atau diganti
+        state padding yang sudah dihitung untuk arah GRU go_backwards. Hasilnya
+        sama dengan forward pass penuh; batch dengan sequence sepanjang mirip
+        (lihat sort_by_length) paling diuntungkan.
+
+        Args:
+            padded_sequences: Array int (N, MAX_LEN)
+            trim: Lewati timestep padding (False: selalu hitung MAX_LEN timestep)
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES) float32
+        """
+        x = padded_sequences
+        mask = None
+        # Lebar efektif batch jika input recurrent berikutnya masih embedding mentah
+        pad_width = None
+        pad_vector = None
+
+        for index, layer in enumerate(self.spec):
+            kind = layer["type"]
+
+            if kind == "Embedding":
+                ids = np.asarray(x, dtype=np.int64)
+                embeddings = self.weights[f"{index}/embeddings"]
+                width = effective_width(ids) if trim else ids.shape[1]
+                if layer["mask_zero"]:
+                    if self._can_trim_masked:
+                        ids = ids[:, :width]
+                    mask = ids != 0
+                else:
+                    mask = None
+                    pad_width, pad_vector = width, np.asarray(embeddings[0])
+                x = embeddings[ids]
+                continue
+
+            elif kind == "GRU":
+                if pad_width is not None:
+                    x = self._gru_skip_padding(x, str(index), layer, pad_vector, pad_width)
+                else:
+                    x = self._gru(x, mask, str(index), layer)
+                if not layer["return_sequences"]:
+                    mask = None
+
+            elif kind == "Bidirectional":
+                forward_spec, backward_spec = layer["forward"], layer["backward"]
+                return_sequences = forward_spec["return_sequences"]
+                y = self._gru(x, mask, f"{index}/forward", forward_spec, return_sequences)
+                if pad_width is not None:
+                    y_rev = self._gru_skip_padding(x, f"{index}/backward", backward_spec, pad_vector, pad_width)
+                else:
+                    y_rev = self._gru(x, mask, f"{index}/backward", backward_spec, return_sequences)
+                if return_sequences:
+                    y_rev = y_rev[:, ::-1]
+                else:
+                    mask = None
+
+                merge_mode = layer["merge_mode"]
+                if merge_mode == "concat":
+                    x = np.concatenate([y, y_rev], axis=-1)
+                elif merge_mode == "sum":
+                    x = y + y_rev
+                elif merge_mode == "mul":
+                    x = y * y_rev
+                elif merge_mode == "ave":
+                    x = (y + y_rev) / 2
+                else:
+                    raise NotImplementedError(f"merge_mode '{merge_mode}' belum didukung")
+
+            elif kind == "Dense":
+                x = x @ self.weights[f"{index}/kernel"]
+                bias = self.weights.get(f"{index}/bias")
+                if bias is not None:
+                    x = x + bias
+                x = _activate(x, layer["activation"])
+
+            elif kind == "GlobalMaxPooling1D":
+                x = x.max(axis=1)
+                mask = None
+
+            elif kind == "GlobalAveragePooling1D":
+                if mask is None:
+                    x = x.mean(axis=1)
+                else:
+                    weights = mask[:, :, None].astype(np.float32)
+                    # Baris tanpa token menghasilkan NaN, sama seperti Keras
+                    with np.errstate(invalid="ignore"):
+                        x = (x * weights).sum(axis=1) / weights.sum(axis=1)
+                mask = None
+
+            pad_width = None
+
+        return x.astype(np.float32, copy=False)
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None, verbose: int = 0,
+                bucketing: bool = LENGTH_BUCKETING) -> np.ndarray:
+        """
+        Prediksi probabilitas, kompatibel dengan Keras model.predict
+
+        Args:
+            padded_sequences: Array int (N, MAX_LEN)
+            batch_size: Jumlah baris per forward pass (default PREDICT_BATCH_SIZE)
+            verbose: Diabaikan (kompatibilitas Keras)
+            bucketing: Kelompokkan baris berdasarkan panjang sebelum dipecah per
+                batch_size, sehingga setiap chunk berjalan dengan lebar padding-nya
+                sendiri. Hasil tetap dalam urutan input.
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES)
+        """
+        padded_sequences = np.asarray(padded_sequences)
+        batch_size = batch_size or PREDICT_BATCH_SIZE
+        n = len(padded_sequences)
+        if n <= batch_size:
+            return self.forward(padded_sequences, trim=bucketing)
+
+        order = sort_by_length(padded_sequences) if bucketing else np.arange(n)
+        outputs = np.concatenate([
+            self.forward(padded_sequences[order[start:start + batch_size]], trim=bucketing)
+            for start in range(0, n, batch_size)
+        ])
+        if not bucketing:
+            return outputs
+
+        result = np.empty_like(outputs)
+        result[order] = outputs
+        return result
+
+    __call__ = predict
+
+
+def load_numpy_model(
+    npz_path: str = NUMPY_MODEL_PATH,
+    keras_path: str = MODEL_PATH,
+    mmap: bool = NUMPY_MMAP_WEIGHTS
+) -> NumpyBiGRUModel:
+    """
+    Memuat model NumPy dari .npz hasil build (`python numpy_backend.py export`).
+    Ekspor ulang dari .keras (butuh h5py) hanya jika .npz belum ada atau dibuat
+    dari file .keras yang berbeda (hash SHA-256, bukan mtime yang tidak
+    bermakna setelah git checkout); .npz tetap dipakai jika .keras tidak ada.
+
+    Args:
+        npz_path: Path file .npz
+        keras_path: Path file .keras sumber
+        mmap: Memory-map bobot (lihat NumpyBiGRUModel.load)
+
+    Returns:
+        Instance NumpyBiGRUModel
+    """
+    model = None
+    if os.path.exists(npz_path):
+        model = NumpyBiGRUModel.load(npz_path, mmap)
+        if (
+            model.source_sha256 is None
+            or not os.path.exists(keras_path)
+            or model.source_sha256 == file_sha256(keras_path)
+        ):
+            return model
+
+    logger.warning(
+        "%s %s, mengekspor ulang bobot dari %s (butuh h5py). "
+        "Jalankan `python numpy_backend.py export` saat build dan sertakan hasilnya.",
+        npz_path, "tidak sesuai dengan model" if model is not None else "tidak ditemukan", keras_path
+    )
+    export_keras_to_npz(keras_path, npz_path)
+    return NumpyBiGRUModel.load(npz_path, mmap)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend inferensi NumPy untuk model Bi-GRU")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_export = subparsers.add_parser("export", help="Ekstrak bobot .keras ke .npz")
+    p_export.add_argument("--model", default=MODEL_PATH)
+    p_export.add_argument("--output", default=NUMPY_MODEL_PATH)
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        path = export_keras_to_npz(args.model, args.output)
+        print(f"Bobot disimpan ke {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from config import PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL
+
+
+def row_key(row: np.ndarray) -> bytes:
+    """
+    Hash dari satu baris sequence int32 yang sudah dipadding
+
+    Args:
+        row: Numpy array int32 (MAX_LEN,)
+
+    Returns:
+        Digest 16 byte
+    """
+    return hashlib.blake2b(np.ascontiguousarray(row, dtype=np.int32).tobytes(), digest_size=16).digest()
+
+
+class PredictionCache:
+    """
+    Cache LRU probabilitas prediksi, dengan key hash dari baris id hasil
+    tokenisasi. Banyak komentar berbeda (huruf besar, tanda baca, URL,
+    singkatan) menghasilkan sequence yang sama sehingga forward pass bisa
+    dilewati.
+
+    File model/tokenizer tidak dipantau: penggantian model berlaku setelah
+    aplikasi di-restart (analyzer di-cache dengan st.cache_resource), saat
+    cache juga mulai kosong. Pemuatan ulang eksplisit lewat
+    SentimentAnalyzer.load_model/load_tokenizer mengosongkan cache (clear).
+    """
+
+    def __init__(
+        self,
+        capacity: int = PREDICTION_CACHE_SIZE,
+        ttl: Optional[float] = PREDICTION_CACHE_TTL
+    ):
+        """
+        Inisialisasi cache
+
+        Args:
+            capacity: Jumlah maksimal entri
+            ttl: Umur maksimal entri dalam detik (None: tanpa batas)
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """
+        Mengambil probabilitas dari cache
+
+        Args:
+            key: Hash baris (lihat row_key)
+
+        Returns:
+            Array probabilitas (NUM_CLASSES,) atau None jika tidak ada/kedaluwarsa
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                probabilities, stored_at = entry
+                if self.ttl is None or time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return probabilities
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: bytes, probabilities: np.ndarray):
+        """
+        Menyimpan probabilitas ke cache (entri terlama dibuang jika penuh)
+
+        Yang disimpan adalah salinan: baris hasil predict_fn adalah view dari
+        array batch milik pemanggil, yang tidak boleh ikut tertahan di memori
+        atau terubah dari luar cache.
+
+        Args:
+            key: Hash baris (lihat row_key)
+            probabilities: Array probabilitas (NUM_CLASSES,)
+        """
+        if self.capacity <= 0:
+            return
+        probabilities = np.array(probabilities, copy=True)
+        with self._lock:
+            self._entries[key] = (probabilities, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Mengosongkan cache (mis. saat model atau tokenizer diganti)"""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def predict(self, padded_sequences: np.ndarray, predict_fn, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Prediksi dengan cache: hanya baris yang belum ada di cache (dan unik)
+        yang dijalankan melalui predict_fn
+
+        Args:
+            padded_sequences: Numpy array int32 (N, MAX_LEN)
+            predict_fn: Callable (padded_sequences, batch_size) -> probabilitas
+            batch_size: Diteruskan ke predict_fn
+
+        Returns:
+            Matriks probabilitas (N, NUM_CLASSES)
+        """
+        keys = [row_key(row) for row in padded_sequences]
+        cached = [self.get(key) for key in keys]
+
+        # Baris yang belum ada di cache, duplikat dalam satu batch dihitung sekali
+        pending = {}
+        for index, (key, probabilities) in enumerate(zip(keys, cached)):
+            if probabilities is None and key not in pending:
+                pending[key] = index
+
+        if pending:
+            miss_indices = list(pending.values())
+            computed = np.asarray(predict_fn(padded_sequences[miss_indices], batch_size))
+            computed_by_key = {}
+            for key, probabilities in zip(pending, computed):
+                self.put(key, probabilities)
+                computed_by_key[key] = probabilities
+            cached = [
+                computed_by_key[key] if probabilities is None else probabilities
+                for key, probabilities in zip(keys, cached)
+            ]
+
+        return np.stack(cached)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik cache
+
+        Returns:
+            Dictionary berisi hits, misses, hit rate, ukuran dan jumlah invalidasi
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0,
+                "size": len(self._entries),
+                "capacity": self.capacity,
+                "invalidations": self._invalidations
+            }
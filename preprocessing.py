@@ -1,6 +1,19 @@
+import os
 import re
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from config import MAX_LEN
+import json
+import pickle
+import hashlib
+import logging
+import weakref
+import argparse
+import numpy as np
+from config import MAX_LEN, VOCAB_SIZE, LEXICON_CACHE_PATH, TOKENIZER_PATH, TOKENIZER_VOCAB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Penanda format file vocabulary (pengganti tokenizer.pickle)
+VOCAB_FORMAT = "mbg-vocabulary"
+VOCAB_FORMAT_VERSION = 1
 
 # ==================== KAMUS NORMALISASI ====================
 NORM_DICT = {
@@ -84,6 +97,14 @@ STOP_WORDS = set([
     "secara", "dalam", "luar", "atas", "bawah", "depan", "belakang", "sana", "sini"
 ])
 
+# ==================== POLA REGEX (PRECOMPILED) ====================
+URL_PATTERN = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+MENTION_HASHTAG_PATTERN = re.compile(r'@\w+|#\w+')
+NON_ALPHA_PATTERN = re.compile(r'[^a-z\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Token akhir setelah langkah 3 & 4 adalah deretan huruf a-z yang dipisah karakter lain
+ALPHA_TOKEN_PATTERN = re.compile(r'[a-z]+')
+
 
 class TextPreprocessor:
     """
@@ -123,7 +144,7 @@ class TextPreprocessor:
         Returns:
             Teks tanpa URL
         """
-        return re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        return URL_PATTERN.sub('', text)
     
     def remove_mentions_hashtags(self, text: str) -> str:
         """
@@ -135,7 +156,7 @@ class TextPreprocessor:
         Returns:
             Teks tanpa mention dan hashtag
         """
-        return re.sub(r'@\w+|#\w+', '', text)
+        return MENTION_HASHTAG_PATTERN.sub('', text)
     
     def remove_non_alpha(self, text: str) -> str:
         """
@@ -147,7 +168,7 @@ class TextPreprocessor:
         Returns:
             Teks hanya berisi huruf dan spasi
         """
-        return re.sub(r'[^a-z\s]', ' ', text)
+        return NON_ALPHA_PATTERN.sub(' ', text)
     
     def remove_extra_whitespace(self, text: str) -> str:
         """
@@ -159,7 +180,7 @@ class TextPreprocessor:
         Returns:
             Teks dengan spasi yang dinormalisasi
         """
-        return re.sub(r'\s+', ' ', text).strip()
+        return WHITESPACE_PATTERN.sub(' ', text).strip()
     
     def normalize_slang(self, text: str) -> str:
         """
@@ -204,39 +225,69 @@ class TextPreprocessor:
         filtered_words = [word for word in words if len(word) >= min_length]
         return " ".join(filtered_words)
     
-    def preprocess(self, text: str) -> str:
+    def tokenize(self, text: str) -> list:
         """
-        Menjalankan seluruh pipeline preprocessing
+        Langkah 1-4 sekaligus: case folding, hapus URL/mention/hashtag,
+        lalu ambil token huruf a-z. Hasilnya sama dengan
+        ``remove_extra_whitespace(...).split()`` pada pipeline bertahap.
         
         Args:
             text: Teks input mentah
             
         Returns:
-            Teks yang sudah diproses
+            List token
         """
-        # Langkah 1: Case Folding
-        text = self.case_folding(text)
-        
-        # Langkah 2: Hapus URL, Username, Hashtag
-        text = self.remove_urls(text)
-        text = self.remove_mentions_hashtags(text)
-        
-        # Langkah 3: Hapus Angka dan Tanda Baca
-        text = self.remove_non_alpha(text)
+        text = URL_PATTERN.sub('', str(text).lower())
+        text = MENTION_HASHTAG_PATTERN.sub('', text)
+        return ALPHA_TOKEN_PATTERN.findall(text)
+    
+    def filter_tokens(self, tokens: list, min_length: int = 2) -> list:
+        """
+        Langkah 5-7 dalam satu loop: normalisasi singkatan, hapus stopwords,
+        dan hapus kata pendek
         
-        # Langkah 4: Hapus spasi berlebih
-        text = self.remove_extra_whitespace(text)
+        Args:
+            tokens: List token hasil tokenize()
+            min_length: Panjang minimum kata (default: 2)
+            
+        Returns:
+            List token akhir
+        """
+        norm_get = self.norm_dict.get
+        stop_words = self.stop_words
+        result = []
+        append = result.append
         
-        # Langkah 5: Normalisasi Singkatan
-        text = self.normalize_slang(text)
+        for token in tokens:
+            normalized = norm_get(token)
+            if normalized is None:
+                if token not in stop_words and len(token) >= min_length:
+                    append(token)
+                continue
+            
+            # Normalisasi bisa menghasilkan beberapa kata (mis. "gpp" -> "tidak apa apa")
+            for word in normalized.split():
+                if word not in stop_words and len(word) >= min_length:
+                    append(word)
         
-        # Langkah 6: Hapus Stopwords
-        text = self.remove_stopwords(text)
+        return result
+    
+    def preprocess(self, text: str) -> str:
+        """
+        Menjalankan seluruh pipeline preprocessing
         
-        # Langkah 7: Hapus Kata Pendek
-        text = self.remove_short_words(text)
+        Pipeline dijalankan dalam satu lintasan (regex precompiled, tokenisasi
+        sekali, normalisasi/stopword/panjang kata dalam satu loop). Hasilnya
+        identik dengan menjalankan langkah 1-7 satu per satu seperti pada
+        get_preprocessing_steps().
         
-        return text
+        Args:
+            text: Teks input mentah
+            
+        Returns:
+            Teks yang sudah diproses
+        """
+        return " ".join(self.filter_tokens(self.tokenize(text)))
     
     def get_preprocessing_steps(self, text: str) -> dict:
         """
@@ -288,21 +339,525 @@ class TextPreprocessor:
         return steps
 
 
+# Filter default Keras Tokenizer
+KERAS_TOKENIZER_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+
+class VocabularyEncoder:
+    """
+    Tokenizer ringan berbasis NumPy, pengganti Keras Tokenizer + pad_sequences
+    
+    Dibangun dari ``word_index`` tokenizer hasil training dan dibatasi
+    ``num_words`` (VOCAB_SIZE). Hasilnya identik dengan
+    ``pad_sequences(tokenizer.texts_to_sequences(texts), padding='post',
+    truncating='post')`` tanpa perlu mengimpor TensorFlow.
+    """
+    
+    def __init__(
+        self,
+        word_index: dict,
+        num_words: int = VOCAB_SIZE,
+        oov_token: str = None,
+        filters: str = KERAS_TOKENIZER_FILTERS,
+        lower: bool = True,
+        split: str = " ",
+        char_level: bool = False
+    ):
+        """
+        Inisialisasi encoder
+        
+        Args:
+            word_index: Dictionary kata -> id dari tokenizer
+            num_words: Batas vocabulary (id >= num_words dianggap OOV)
+            oov_token: Token OOV (None jika tokenizer tidak memakai OOV)
+            filters: Karakter yang diganti dengan pemisah kata
+            lower: Ubah teks menjadi huruf kecil
+            split: Karakter pemisah kata
+            char_level: Tokenisasi per karakter
+        """
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.filters = filters
+        self.lower = lower
+        self.split = split
+        self.char_level = char_level
+        self.oov_index = word_index.get(oov_token) if oov_token is not None else None
+        self._translate_map = str.maketrans({c: split for c in filters})
+        
+        # Lookup kata -> id final (id di luar vocabulary langsung dipetakan ke OOV)
+        self.lookup = {}
+        for word, index in word_index.items():
+            if num_words and index >= num_words:
+                if self.oov_index is not None:
+                    self.lookup[word] = self.oov_index
+            else:
+                self.lookup[word] = index
+    
+    @classmethod
+    def from_tokenizer(cls, tokenizer, num_words: int = None) -> "VocabularyEncoder":
+        """
+        Membuat encoder dari Keras Tokenizer (hasil unpickle)
+        
+        Args:
+            tokenizer: Keras Tokenizer object
+            num_words: Batas vocabulary (default: tokenizer.num_words atau VOCAB_SIZE)
+            
+        Returns:
+            Instance VocabularyEncoder
+        """
+        if num_words is None:
+            num_words = getattr(tokenizer, 'num_words', None) or VOCAB_SIZE
+        return cls(
+            word_index=tokenizer.word_index,
+            num_words=num_words,
+            oov_token=getattr(tokenizer, 'oov_token', None),
+            filters=getattr(tokenizer, 'filters', KERAS_TOKENIZER_FILTERS),
+            lower=getattr(tokenizer, 'lower', True),
+            split=getattr(tokenizer, 'split', " "),
+            char_level=getattr(tokenizer, 'char_level', False)
+        )
+    
+    def to_dict(self, source_sha256: str = None) -> dict:
+        """
+        Representasi ringkas encoder untuk disimpan sebagai JSON
+        
+        Hanya kata dengan id < num_words yang disimpan (kata lain tetap
+        menjadi OOV/dibuang), sebagai list terurut id: words[i] memiliki id i + 1.
+        
+        Args:
+            source_sha256: Hash SHA-256 tokenizer.pickle sumber (untuk
+                mendeteksi vocabulary yang sudah tidak sesuai)
+        
+        Returns:
+            Dictionary siap di-serialisasi JSON
+        """
+        in_vocab = {word: index for word, index in self.lookup.items() if index != self.oov_index}
+        if self.oov_index is not None:
+            in_vocab[self.oov_token] = self.oov_index
+        
+        words = [None] * max(in_vocab.values(), default=0)
+        for word, index in in_vocab.items():
+            words[index - 1] = word
+        if None in words:
+            raise ValueError("Id vocabulary tidak berurutan, tidak bisa disimpan sebagai list")
+        
+        return {
+            'format': VOCAB_FORMAT,
+            'version': VOCAB_FORMAT_VERSION,
+            'num_words': self.num_words,
+            'oov_token': self.oov_token,
+            'filters': self.filters,
+            'lower': self.lower,
+            'split': self.split,
+            'char_level': self.char_level,
+            'source_sha256': source_sha256,
+            'words': words
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "VocabularyEncoder":
+        """
+        Membuat encoder dari hasil to_dict()
+        
+        Args:
+            data: Dictionary hasil to_dict() / isi file vocabulary JSON
+            
+        Returns:
+            Instance VocabularyEncoder
+        """
+        if data.get('format') != VOCAB_FORMAT or data.get('version') != VOCAB_FORMAT_VERSION:
+            raise ValueError("Format file vocabulary tidak dikenal")
+        return cls(
+            word_index={word: index for index, word in enumerate(data['words'], start=1)},
+            num_words=data['num_words'],
+            oov_token=data['oov_token'],
+            filters=data['filters'],
+            lower=data['lower'],
+            split=data['split'],
+            char_level=data['char_level']
+        )
+    
+    def save(self, path: str = TOKENIZER_VOCAB_PATH, source_sha256: str = None) -> str:
+        """
+        Menyimpan encoder ke file vocabulary JSON
+        
+        Args:
+            path: Path file tujuan
+            source_sha256: Hash SHA-256 tokenizer.pickle sumber
+            
+        Returns:
+            Path file yang ditulis
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(source_sha256), f, ensure_ascii=False, separators=(',', ':'))
+        return path
+    
+    @classmethod
+    def load(cls, path: str = TOKENIZER_VOCAB_PATH) -> "VocabularyEncoder":
+        """
+        Memuat encoder dari file vocabulary JSON (tanpa pickle/TensorFlow)
+        
+        Args:
+            path: Path file vocabulary JSON
+            
+        Returns:
+            Instance VocabularyEncoder
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    def text_to_words(self, text: str) -> list:
+        """
+        Memecah teks menjadi kata dengan aturan yang sama seperti Keras
+        
+        Args:
+            text: Teks input
+            
+        Returns:
+            List kata
+        """
+        if self.lower:
+            text = text.lower()
+        if self.char_level:
+            return list(text)
+        return [w for w in text.translate(self._translate_map).split(self.split) if w]
+    
+    def words_to_ids(self, words: list) -> list:
+        """
+        Mengubah list kata menjadi list id
+        
+        Args:
+            words: List kata
+            
+        Returns:
+            List id (kata tidak dikenal menjadi OOV atau dibuang)
+        """
+        lookup = self.lookup
+        if self.oov_index is None:
+            return [lookup[w] for w in words if w in lookup]
+        oov_index = self.oov_index
+        return [lookup.get(w, oov_index) for w in words]
+    
+    def pad_batch(self, sequences: list, max_len: int = MAX_LEN) -> np.ndarray:
+        """
+        Menulis sequence id ke array int32 (N, max_len) dengan padding dan
+        truncating 'post'
+        
+        Args:
+            sequences: List of list id
+            max_len: Panjang maksimal sequence
+            
+        Returns:
+            Numpy array int32 dengan shape (N, max_len)
+        """
+        n = len(sequences)
+        padded = np.zeros((n, max_len), dtype=np.int32)
+        if n == 0 or max_len == 0:
+            return padded
+        
+        lengths = np.fromiter((min(len(seq), max_len) for seq in sequences), dtype=np.intp, count=n)
+        total = int(lengths.sum())
+        if total == 0:
+            return padded
+        
+        flat = np.fromiter(
+            (i for seq in sequences for i in seq[:max_len]), dtype=np.int32, count=total
+        )
+        rows = np.repeat(np.arange(n), lengths)
+        # Posisi kolom = indeks elemen dikurangi offset awal baris
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        cols = np.arange(total) - starts
+        padded[rows, cols] = flat
+        return padded
+    
+    def encode_batch(self, texts: list, max_len: int = MAX_LEN) -> np.ndarray:
+        """
+        Tokenisasi dan padding batch teks
+        
+        Args:
+            texts: List teks yang sudah dipreprocess
+            max_len: Panjang maksimal sequence
+            
+        Returns:
+            Numpy array int32 dengan shape (N, max_len)
+        """
+        return self.pad_batch(
+            [self.words_to_ids(self.text_to_words(text)) for text in texts], max_len
+        )
+
+
+# Cache encoder per objek tokenizer agar word_index tidak dibangun ulang
+_encoder_cache = weakref.WeakKeyDictionary()
+
+
+def get_encoder(tokenizer) -> VocabularyEncoder:
+    """
+    Mengambil VocabularyEncoder untuk tokenizer (dibuat sekali lalu di-cache)
+    
+    Args:
+        tokenizer: Keras Tokenizer object atau VocabularyEncoder
+        
+    Returns:
+        Instance VocabularyEncoder
+    """
+    if isinstance(tokenizer, VocabularyEncoder):
+        return tokenizer
+    
+    encoder = _encoder_cache.get(tokenizer)
+    if encoder is None:
+        encoder = VocabularyEncoder.from_tokenizer(tokenizer)
+        _encoder_cache[tokenizer] = encoder
+    return encoder
+
+
+def file_sha256(path: str) -> str:
+    """Hash SHA-256 isi file"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def export_tokenizer_vocab(tokenizer_path: str = TOKENIZER_PATH, output_path: str = TOKENIZER_VOCAB_PATH) -> str:
+    """
+    Mengonversi tokenizer.pickle (Keras Tokenizer) ke file vocabulary JSON
+    
+    Args:
+        tokenizer_path: Path file tokenizer .pickle
+        output_path: Path file vocabulary JSON tujuan
+        
+    Returns:
+        Path file yang ditulis
+    """
+    with open(tokenizer_path, 'rb') as handle:
+        tokenizer = pickle.load(handle)
+    return VocabularyEncoder.from_tokenizer(tokenizer).save(output_path, file_sha256(tokenizer_path))
+
+
+def load_vocabulary(vocab_path: str = TOKENIZER_VOCAB_PATH, tokenizer_path: str = TOKENIZER_PATH) -> VocabularyEncoder:
+    """
+    Memuat VocabularyEncoder dari file vocabulary JSON (ikut di-commit di
+    repository), mengonversi ulang dari tokenizer.pickle hanya jika file JSON
+    belum ada atau dibuat dari tokenizer.pickle yang berbeda (hash SHA-256,
+    bukan mtime yang tidak bermakna setelah git checkout)
+    
+    Args:
+        vocab_path: Path file vocabulary JSON
+        tokenizer_path: Path file tokenizer .pickle sumber
+        
+    Returns:
+        Instance VocabularyEncoder
+    """
+    data = None
+    if os.path.exists(vocab_path):
+        with open(vocab_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        recorded = data.get('source_sha256')
+        if recorded is None or not os.path.exists(tokenizer_path) or recorded == file_sha256(tokenizer_path):
+            return VocabularyEncoder.from_dict(data)
+    
+    # Fallback lambat: unpickle Keras Tokenizer (mengimpor TensorFlow)
+    logger.warning(
+        "%s %s, membaca %s dengan pickle (lambat, mengimpor TensorFlow). "
+        "Jalankan `python preprocessing.py export-vocab` dan commit hasilnya.",
+        vocab_path, "tidak sesuai dengan tokenizer" if data is not None else "tidak ditemukan", tokenizer_path
+    )
+    with open(tokenizer_path, 'rb') as handle:
+        encoder = VocabularyEncoder.from_tokenizer(pickle.load(handle))
+    try:
+        encoder.save(vocab_path, file_sha256(tokenizer_path))
+    except OSError:
+        pass  # Direktori read-only: tetap pakai encoder di memori
+    return encoder
+
+
 def tokenize_and_pad(text: str, tokenizer, max_len: int = MAX_LEN):
     """
     Tokenisasi dan padding sequence
     
     Args:
         text: Teks yang sudah dipreprocess
-        tokenizer: Keras Tokenizer object
+        tokenizer: Keras Tokenizer object atau VocabularyEncoder
         max_len: Panjang maksimal sequence
         
     Returns:
-        Numpy array dengan shape (1, max_len)
+        Numpy array int32 dengan shape (1, max_len)
+    """
+    return get_encoder(tokenizer).encode_batch([text], max_len)
+
+
+def tokenize_and_pad_batch(texts: list, tokenizer, max_len: int = MAX_LEN):
+    """
+    Tokenisasi dan padding batch teks ke satu array
+    
+    Args:
+        texts: List teks yang sudah dipreprocess
+        tokenizer: Keras Tokenizer object atau VocabularyEncoder
+        max_len: Panjang maksimal sequence
+        
+    Returns:
+        Numpy array int32 dengan shape (N, max_len)
+    """
+    return get_encoder(tokenizer).encode_batch(texts, max_len)
+
+
+class CompiledLexicon:
+    """
+    Lexicon hasil kompilasi: token mentah -> (kata akhir, id akhir)
+    
+    Menggabungkan NORM_DICT, STOP_WORDS, filter panjang kata dan vocabulary
+    tokenizer sehingga setiap token mentah cukup satu kali lookup dictionary.
+    Normalisasi multi-kata (mis. "gpp" -> "tidak apa apa") menghasilkan
+    beberapa id, sedangkan stopword dan kata pendek tidak menghasilkan apa-apa.
+    Hasilnya identik dengan ``tokenize_and_pad(preprocessor.preprocess(text))``.
     """
-    sequences = tokenizer.texts_to_sequences([text])
-    padded = pad_sequences(sequences, maxlen=max_len, padding='post', truncating='post')
-    return padded
+    
+    def __init__(self, preprocessor: TextPreprocessor, encoder: VocabularyEncoder, entries: dict = None):
+        """
+        Inisialisasi lexicon
+        
+        Args:
+            preprocessor: Instance TextPreprocessor
+            encoder: Instance VocabularyEncoder
+            entries: Dictionary token -> (tuple kata, tuple id); dibangun jika None
+        """
+        if encoder.char_level or encoder.split != " ":
+            raise ValueError("CompiledLexicon hanya mendukung tokenizer word-level dengan split spasi")
+        
+        self.preprocessor = preprocessor
+        self.encoder = encoder
+        self.entries = entries if entries is not None else self._build_entries()
+    
+    def resolve(self, token: str) -> tuple:
+        """
+        Menghitung (kata akhir, id akhir) untuk satu token mentah
+        
+        Args:
+            token: Token hasil TextPreprocessor.tokenize()
+            
+        Returns:
+            Tuple (tuple kata, tuple id)
+        """
+        words = self.preprocessor.filter_tokens([token])
+        ids = self.encoder.words_to_ids(self.encoder.text_to_words(" ".join(words)))
+        return tuple(words), tuple(ids)
+    
+    def _build_entries(self) -> dict:
+        """Mengompilasi semua token yang dikenal (normalisasi, stopword, vocabulary)"""
+        candidates = set(self.preprocessor.norm_dict)
+        candidates.update(self.preprocessor.stop_words)
+        candidates.update(self.encoder.lookup)
+        return {
+            token: self.resolve(token)
+            for token in candidates
+            if ALPHA_TOKEN_PATTERN.fullmatch(token)
+        }
+    
+    @staticmethod
+    def fingerprint(preprocessor: TextPreprocessor, encoder: VocabularyEncoder) -> str:
+        """
+        Hash dari semua sumber lexicon, dipakai untuk validasi cache di disk
+        
+        Args:
+            preprocessor: Instance TextPreprocessor
+            encoder: Instance VocabularyEncoder
+            
+        Returns:
+            String hex SHA-256
+        """
+        payload = json.dumps([
+            sorted(preprocessor.norm_dict.items()),
+            sorted(preprocessor.stop_words),
+            sorted(encoder.lookup.items()),
+            encoder.oov_index,
+            sorted(encoder._translate_map.items()),
+            encoder.lower
+        ])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def load_or_build(
+        cls,
+        preprocessor: TextPreprocessor,
+        tokenizer,
+        cache_path: str = LEXICON_CACHE_PATH
+    ) -> "CompiledLexicon":
+        """
+        Memuat lexicon dari cache di disk, atau membangun dan menyimpannya
+        jika cache tidak ada / sudah tidak sesuai
+        
+        Args:
+            preprocessor: Instance TextPreprocessor
+            tokenizer: Keras Tokenizer object atau VocabularyEncoder
+            cache_path: Path file cache JSON (None untuk menonaktifkan cache)
+            
+        Returns:
+            Instance CompiledLexicon
+        """
+        encoder = get_encoder(tokenizer)
+        fingerprint = cls.fingerprint(preprocessor, encoder)
+        
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('fingerprint') == fingerprint:
+                    entries = {
+                        token: (tuple(words), tuple(ids))
+                        for token, (words, ids) in cached['entries'].items()
+                    }
+                    return cls(preprocessor, encoder, entries)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Cache rusak, bangun ulang
+        
+        lexicon = cls(preprocessor, encoder)
+        
+        if cache_path:
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({'fingerprint': fingerprint, 'entries': lexicon.entries}, f)
+            except OSError:
+                pass  # Cache bersifat opsional
+        
+        return lexicon
+    
+    def process(self, text: str) -> tuple:
+        """
+        Preprocessing dan tokenisasi satu teks mentah sekaligus
+        
+        Args:
+            text: Teks input mentah
+            
+        Returns:
+            Tuple (teks bersih, list id)
+        """
+        entries_get = self.entries.get
+        words = []
+        ids = []
+        for token in self.preprocessor.tokenize(text):
+            entry = entries_get(token)
+            if entry is None:
+                entry = self.resolve(token)
+            words.extend(entry[0])
+            ids.extend(entry[1])
+        return " ".join(words), ids
+    
+    def process_batch(self, texts: list, max_len: int = MAX_LEN) -> tuple:
+        """
+        Preprocessing, tokenisasi dan padding batch teks mentah
+        
+        Args:
+            texts: List teks input mentah
+            max_len: Panjang maksimal sequence
+            
+        Returns:
+            Tuple (list teks bersih, numpy array int32 (N, max_len))
+        """
+        cleaned_texts = []
+        sequences = []
+        for text in texts:
+            cleaned_text, ids = self.process(text)
+            cleaned_texts.append(cleaned_text)
+            sequences.append(ids)
+        return cleaned_texts, self.encoder.pad_batch(sequences, max_len)
 
 
 # Instance default preprocessor
@@ -320,3 +875,22 @@ def clean_text(text: str) -> str:
         Teks yang sudah diproses
     """
     return default_preprocessor.preprocess(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Utilitas tokenizer Analisis Sentimen MBG")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_export = subparsers.add_parser("export-vocab", help="Konversi tokenizer.pickle ke vocabulary JSON")
+    p_export.add_argument("--tokenizer", default=TOKENIZER_PATH)
+    p_export.add_argument("--output", default=TOKENIZER_VOCAB_PATH)
+
+    args = parser.parse_args()
+
+    if args.command == "export-vocab":
+        path = export_tokenizer_vocab(args.tokenizer, args.output)
+        print(f"Vocabulary disimpan ke {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Pool replika model dengan pembagian thread CPU
+
+Setiap replika adalah InferenceBackend tersendiri yang dipinjam (checkout)
+oleh satu request dan dikembalikan (checkin) setelah forward pass, sehingga
+N request paralel berjalan di N replika tanpa saling berebut lock/thread pool.
+
+Pembagian thread per backend:
+- keras : thread pool TensorFlow bersifat global per proses (bukan per
+          replika): intra-op diatur ke jumlah thread per replika dan inter-op
+          ke jumlah replika, hanya jika TensorFlow belum diinisialisasi; jika
+          sudah, pembagian thread dilewati dengan log warning
+- tflite: setiap interpreter memiliki num_threads sendiri
+- numpy : replika berbagi satu NumpyBiGRUModel (bobot read-only); jumlah
+          thread BLAS diatur lewat environment (mis. OMP_NUM_THREADS)
+"""
+import os
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Callable, List
+
+import numpy as np
+
+from config import (
+    MODEL_PATH,
+    NUMPY_MODEL_PATH,
+    TFLITE_MODEL_PATH,
+    INFERENCE_BACKEND,
+    USE_GRAPH_INFERENCE,
+    REPLICA_POOL_SIZE,
+    REPLICA_THREADS
+)
+from backends import InferenceBackend, KerasBackend, NumpyBackend, TFLiteBackend
+
+logger = logging.getLogger(__name__)
+
+
+def default_threads_per_replica(size: int) -> int:
+    """Membagi core CPU rata ke setiap replika (minimal 1 thread)"""
+    return max(1, (os.cpu_count() or 1) // size)
+
+
+def configure_tf_threads(intra_op: int, inter_op: int) -> bool:
+    """
+    Mengatur ukuran thread pool TensorFlow
+
+    Args:
+        intra_op: Thread per operasi (per replika)
+        inter_op: Operasi yang boleh berjalan bersamaan (jumlah replika)
+
+    Returns:
+        True jika berhasil, False jika TensorFlow sudah terlanjur diinisialisasi
+    """
+    import tensorflow as tf
+
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op)
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op)
+        return True
+    except RuntimeError:
+        return False
+
+
+class ReplicaPool(InferenceBackend):
+    """
+    Pool replika InferenceBackend dengan antarmuka checkout/checkin
+
+    ReplicaPool sendiri adalah InferenceBackend, sehingga dapat dipakai
+    langsung sebagai model SentimentAnalyzer: setiap panggilan predict
+    meminjam satu replika yang sedang kosong.
+    """
+
+    name = "pool"
+
+    def __init__(self, replicas: List[InferenceBackend], threads_per_replica: Optional[int] = None):
+        """
+        Args:
+            replicas: List backend yang sudah diload
+            threads_per_replica: Jumlah thread per replika (informasi untuk statistik)
+        """
+        if not replicas:
+            raise ValueError("ReplicaPool membutuhkan minimal satu replika")
+
+        self.replicas = list(replicas)
+        self.size = len(self.replicas)
+        self.threads_per_replica = threads_per_replica
+        self.name = f"pool[{self.size}x{self.replicas[0].name}]"
+
+        self._idle = queue.LifoQueue()
+        for replica in self.replicas:
+            self._idle.put(replica)
+
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+
+    def checkout(self, timeout: Optional[float] = None) -> InferenceBackend:
+        """
+        Meminjam satu replika, menunggu jika semua sedang dipakai
+
+        Args:
+            timeout: Waktu tunggu maksimal dalam detik (None: tanpa batas)
+
+        Returns:
+            Instance InferenceBackend
+        """
+        try:
+            replica = self._idle.get_nowait()
+            waited = False
+        except queue.Empty:
+            replica = self._idle.get(timeout=timeout)
+            waited = True
+
+        with self._stats_lock:
+            self._checkouts += 1
+            self._waits += waited
+        return replica
+
+    def checkin(self, replica: InferenceBackend):
+        """
+        Mengembalikan replika ke pool
+
+        Args:
+            replica: Replika hasil checkout
+        """
+        self._idle.put(replica)
+
+    @contextmanager
+    def replica(self, timeout: Optional[float] = None):
+        """Context manager checkout/checkin"""
+        replica = self.checkout(timeout)
+        try:
+            yield replica
+        finally:
+            self.checkin(replica)
+
+    def predict(self, padded_sequences: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        with self.replica() as replica:
+            return replica.predict(padded_sequences, batch_size)
+
+    def warmup(self):
+        for replica in self.replicas:
+            replica.warmup()
+
+    def get_stats(self) -> dict:
+        """
+        Mengambil statistik pool
+
+        Returns:
+            Dictionary berisi ukuran pool, replika kosong, jumlah checkout
+            dan berapa kali request harus menunggu replika
+        """
+        with self._stats_lock:
+            return {
+                "size": self.size,
+                "threads_per_replica": self.threads_per_replica,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "waits": self._waits
+            }
+
+
+def create_replica_pool(
+    size: int = REPLICA_POOL_SIZE,
+    threads_per_replica: Optional[int] = REPLICA_THREADS,
+    backend: str = INFERENCE_BACKEND,
+    model_path: str = MODEL_PATH,
+    numpy_model_path: str = NUMPY_MODEL_PATH,
+    tflite_model_path: str = TFLITE_MODEL_PATH,
+    use_graph_inference: bool = USE_GRAPH_INFERENCE
+) -> ReplicaPool:
+    """
+    Memuat N replika model untuk backend yang dipilih
+
+    Args:
+        size: Jumlah replika
+        threads_per_replica: Thread CPU per replika (None: core dibagi rata)
+        backend: 'keras', 'numpy' atau 'tflite'
+        model_path: Path model .keras
+        numpy_model_path: Path bobot .npz (backend numpy)
+        tflite_model_path: Path model .tflite (backend tflite)
+        use_graph_inference: Untuk backend keras, gunakan tf.function
+
+    Returns:
+        Instance ReplicaPool
+    """
+    threads = threads_per_replica or default_threads_per_replica(size)
+
+    if backend == 'tflite':
+        factory: Callable[[], InferenceBackend] = lambda: TFLiteBackend(tflite_model_path, threads)
+    elif backend == 'numpy':
+        from numpy_backend import load_numpy_model
+        shared_model = load_numpy_model(numpy_model_path, model_path)
+        factory = lambda: NumpyBackend(shared_model)
+    else:
+        import tensorflow as tf  # Lazy import: TensorFlow hanya dimuat saat dibutuhkan
+
+        if not configure_tf_threads(threads, size):
+            logger.warning(
+                "TensorFlow sudah diinisialisasi, pembagian thread (%d intra-op x %d inter-op) "
+                "tidak diterapkan; thread pool TensorFlow tetap global untuk seluruh proses",
+                threads, size
+            )
+        factory = lambda: KerasBackend(tf.keras.models.load_model(model_path), use_graph_inference)
+
+    return ReplicaPool([factory() for _ in range(size)], threads)
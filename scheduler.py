@@ -0,0 +1,224 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from config import MICRO_BATCH_MAX_SIZE, MICRO_BATCH_WAIT_MS
+
+# Penanda untuk menghentikan worker thread
+_STOP = object()
+
+
+class _PendingRequest:
+    """Satu request prediksi yang menunggu di antrian"""
+
+    __slots__ = ('cleaned_text', 'padded_sequence', 'preprocessing_steps', 'future')
+
+    def __init__(self, cleaned_text, padded_sequence, preprocessing_steps):
+        self.cleaned_text = cleaned_text
+        self.padded_sequence = padded_sequence
+        self.preprocessing_steps = preprocessing_steps
+        self.future = Future()
+
+
+class MicroBatchScheduler:
+    """
+    Scheduler micro-batching di depan SentimentAnalyzer
+
+    Request tunggal dari banyak thread (mis. sesi Streamlit) dikumpulkan di
+    antrian, digabung menjadi satu batch dalam jendela waktu max_wait_ms atau
+    sampai max_batch_size, lalu dijalankan dengan satu forward pass.
+    Preprocessing tetap dilakukan di thread pemanggil.
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        max_batch_size: int = MICRO_BATCH_MAX_SIZE,
+        max_wait_ms: float = MICRO_BATCH_WAIT_MS,
+        num_workers: int = 1
+    ):
+        """
+        Inisialisasi scheduler dan menjalankan worker thread
+
+        Args:
+            analyzer: Instance SentimentAnalyzer yang sudah siap
+            max_batch_size: Jumlah maksimal request per forward pass
+            max_wait_ms: Waktu tunggu maksimal (ms) untuk mengumpulkan batch
+            num_workers: Jumlah worker thread (sesuaikan dengan jumlah replika
+                model agar setiap replika memproses batch-nya sendiri)
+        """
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._max_queue_depth = 0
+        self._total_requests = 0
+        # Cek _closed dan enqueue dalam satu lock agar tidak ada request di
+        # belakang penanda berhenti (Future-nya tidak akan pernah selesai)
+        self._lifecycle_lock = threading.Lock()
+        self._closed = False
+
+        self._workers = [
+            threading.Thread(target=self._run, name=f"micro-batch-worker-{index}", daemon=True)
+            for index in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def is_ready(self) -> bool:
+        """Mengecek apakah analyzer di belakang scheduler siap digunakan"""
+        return not self._closed and self.analyzer.is_ready() and any(worker.is_alive() for worker in self._workers)
+
+    def submit(self, text: str, trace: bool = False) -> Future:
+        """
+        Memasukkan satu teks ke antrian
+
+        Args:
+            text: Teks input mentah
+            trace: Sertakan hasil setiap langkah preprocessing
+
+        Returns:
+            Future yang berisi dictionary hasil prediksi
+
+        Raises:
+            RuntimeError: Model belum dimuat atau scheduler sudah ditutup
+        """
+        if not self.analyzer.is_ready():
+            raise RuntimeError("Model dan tokenizer belum dimuat!")
+
+        request = _PendingRequest(*self.analyzer.prepare(text, trace))
+        with self._lifecycle_lock:
+            if self._closed:
+                raise RuntimeError("MicroBatchScheduler sudah ditutup")
+            self._queue.put(request)
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._total_requests += 1
+            self._max_queue_depth = max(self._max_queue_depth, depth)
+
+        return request.future
+
+    def predict(self, text: str, trace: bool = False) -> Dict[str, Any]:
+        """
+        Prediksi sentimen satu teks melalui antrian micro-batch
+
+        Args:
+            text: Teks input mentah
+            trace: Sertakan hasil setiap langkah preprocessing
+
+        Returns:
+            Dictionary hasil prediksi (skema sama dengan SentimentAnalyzer.predict)
+        """
+        return self.submit(text, trace).result()
+
+    def predict_batch(self, texts: list, **kwargs) -> list:
+        """Batch besar langsung diteruskan ke SentimentAnalyzer.predict_batch"""
+        return self.analyzer.predict_batch(texts, **kwargs)
+
+    def explain(self, text: str, trace: bool = False) -> Dict[str, Any]:
+        """
+        Prediksi melalui antrian micro-batch (label sama dengan predict),
+        ditambah kontribusi kata dari SentimentAnalyzer.explain_words
+        """
+        result = self.predict(text, trace)
+        result['explanation'] = self.analyzer.explain_words(result['cleaned_text'])
+        return result
+
+    def predict_async(self, text: str, trace: bool = False) -> Future:
+        """Alias submit, antarmuka sama dengan SentimentAnalyzer.predict_async"""
+        return self.submit(text, trace)
+
+    def predict_many_async(self, texts: list, **kwargs) -> Future:
+        """Batch besar langsung diteruskan ke SentimentAnalyzer.predict_many_async"""
+        return self.analyzer.predict_many_async(texts, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik scheduler
+
+        Returns:
+            Dictionary berisi kedalaman antrian, jumlah request/batch,
+            dan histogram ukuran batch
+        """
+        with self._stats_lock:
+            batches = sum(self._batch_sizes.values())
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "total_requests": self._total_requests,
+                "total_batches": batches,
+                "avg_batch_size": round(self._total_requests / batches, 2) if batches else 0,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items()))
+            }
+
+    def close(self, timeout: Optional[float] = None):
+        """Menghentikan worker thread setelah antrian yang ada selesai diproses"""
+        with self._lifecycle_lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._workers:
+                self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join(timeout)
+
+    def _collect_batch(self, first: _PendingRequest) -> tuple:
+        """Mengumpulkan request sampai batch penuh atau jendela waktu habis"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+
+        return batch, False
+
+    def _process(self, batch: list):
+        """Menjalankan satu forward pass dan mengirim hasil ke setiap pemanggil"""
+        try:
+            padded_sequences = np.vstack([request.padded_sequence for request in batch])
+            prediction = self.analyzer.predict_proba(padded_sequences, batch_size=len(batch))
+            results = self.analyzer.build_results(
+                prediction, [request.cleaned_text for request in batch]
+            )
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        for request, result in zip(batch, results):
+            if request.preprocessing_steps is not None:
+                result['preprocessing_steps'] = request.preprocessing_steps
+            request.future.set_result(result)
+
+    def _run(self):
+        """Loop utama worker thread"""
+        while True:
+            request = self._queue.get()
+            if request is _STOP:
+                return
+
+            batch, stop = self._collect_batch(request)
+            with self._stats_lock:
+                self._batch_sizes[len(batch)] += 1
+            self._process(batch)
+
+            if stop:
+                return
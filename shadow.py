@@ -0,0 +1,241 @@
+"""
+Evaluasi shadow model di luar jalur request
+
+Salinan request yang sudah dijawab model produksi dimasukkan ke antrian
+terbatas (dengan sampling) dan dijalankan ulang oleh model kandidat di worker
+thread terpisah. Jika antrian penuh, sampel dibuang sehingga shadow model
+tidak pernah menambah latency yang dirasakan user. Agreement rate, confusion
+matrix (produksi x shadow) dan latency setiap model dikirim berkala ke
+data layer (DataManager.save_shadow_stats).
+"""
+import queue
+import random
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, Optional
+
+import numpy as np
+
+from config import (
+    LABEL_MAP,
+    SHADOW_SAMPLE_RATE,
+    SHADOW_QUEUE_SIZE,
+    SHADOW_LOG_INTERVAL
+)
+from backends import InferenceBackend
+
+logger = logging.getLogger(__name__)
+
+# Penanda untuk menghentikan worker thread
+_STOP = object()
+
+# Jumlah sampel latency terakhir yang disimpan untuk menghitung persentil
+_LATENCY_WINDOW = 1000
+
+
+class ShadowEvaluator:
+    """
+    Menjalankan shadow model pada salinan request produksi di background
+    """
+
+    def __init__(
+        self,
+        backend: InferenceBackend,
+        model_path: str = "",
+        sample_rate: float = SHADOW_SAMPLE_RATE,
+        queue_size: int = SHADOW_QUEUE_SIZE,
+        log_interval: float = SHADOW_LOG_INTERVAL,
+        sink: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ):
+        """
+        Inisialisasi evaluator dan menjalankan worker thread
+
+        Args:
+            backend: InferenceBackend untuk model kandidat
+            model_path: Path model kandidat (dicatat di statistik)
+            sample_rate: Fraksi request yang disalin ke shadow model (0-1)
+            queue_size: Kapasitas antrian; sampel dibuang jika antrian penuh
+            log_interval: Jeda minimal (detik) antar pengiriman statistik ke sink
+            sink: Callable yang menerima dictionary statistik (mis.
+                DataManager.save_shadow_stats); None untuk tanpa logging
+        """
+        self.backend = backend
+        self.model_path = model_path
+        self.sample_rate = sample_rate
+        self.log_interval = log_interval
+        self.sink = sink
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._num_classes = len(LABEL_MAP)
+        self._confusion = np.zeros((self._num_classes, self._num_classes), dtype=np.int64)
+        self._primary_latency = []
+        self._shadow_latency = []
+        self._submitted = 0
+        self._sampled = 0
+        self._dropped = 0
+        self._failed = 0
+        self._last_log = time.monotonic()
+        # Cek _closed dan enqueue dalam satu lock agar tidak ada sampel setelah _STOP
+        self._lifecycle_lock = threading.Lock()
+        self._closed = False
+
+        self._worker = threading.Thread(target=self._run, name="shadow-worker", daemon=True)
+        self._worker.start()
+
+    def submit(
+        self,
+        padded_sequences: np.ndarray,
+        primary_prediction: np.ndarray,
+        primary_latency: Optional[float] = None
+    ) -> bool:
+        """
+        Menyalin satu request produksi ke antrian shadow (tidak pernah menunggu)
+
+        Args:
+            padded_sequences: Numpy array int32 (N, MAX_LEN) yang dijawab model produksi
+            primary_prediction: Probabilitas model produksi (N, NUM_CLASSES)
+            primary_latency: Waktu forward pass backend model produksi dalam
+                detik (None jika tidak sebanding, mis. sebagian baris dijawab
+                cache prediksi atau cascade)
+
+        Returns:
+            True jika request masuk antrian (False jika tidak disampel,
+            antrian penuh atau evaluator sudah ditutup)
+        """
+        with self._stats_lock:
+            self._submitted += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+
+        item = (np.array(padded_sequences, copy=True), np.array(primary_prediction, copy=True), primary_latency)
+        with self._lifecycle_lock:
+            if self._closed:
+                return False
+            try:
+                self._queue.put_nowait(item)
+                queued = True
+            except queue.Full:
+                queued = False
+        if not queued:
+            with self._stats_lock:
+                self._dropped += 1
+            return False
+
+        with self._stats_lock:
+            self._sampled += 1
+        return True
+
+    def _evaluate(self, padded_sequences: np.ndarray, primary_prediction: np.ndarray,
+                  primary_latency: Optional[float]):
+        """Menjalankan shadow model pada satu request dan memperbarui statistik"""
+        start = time.perf_counter()
+        try:
+            shadow_prediction = np.asarray(self.backend.predict(padded_sequences))
+        except Exception:
+            with self._stats_lock:
+                self._failed += 1
+            return
+        shadow_latency = time.perf_counter() - start
+
+        primary_classes = np.argmax(primary_prediction, axis=1)
+        shadow_classes = np.argmax(shadow_prediction, axis=1)
+
+        with self._stats_lock:
+            np.add.at(self._confusion, (primary_classes, shadow_classes), 1)
+            self._shadow_latency.append(shadow_latency)
+            del self._shadow_latency[:-_LATENCY_WINDOW]
+            if primary_latency is not None:
+                self._primary_latency.append(primary_latency)
+                del self._primary_latency[:-_LATENCY_WINDOW]
+
+    def _log(self, force: bool = False):
+        """Mengirim statistik ke sink jika log_interval sudah lewat"""
+        now = time.monotonic()
+        if self.sink is None or (not force and now - self._last_log < self.log_interval):
+            return
+        self._last_log = now
+        try:
+            self.sink(self.get_stats())
+        except Exception as e:
+            logger.warning("Gagal menyimpan statistik shadow model: %s", e)
+
+    def _run(self):
+        """Loop utama worker thread"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._log(force=True)
+                return
+            self._evaluate(*item)
+            self._log()
+
+    @staticmethod
+    def _latency_summary(latencies: list) -> Dict[str, float]:
+        """Rata-rata, p50 dan p95 latency dalam milidetik"""
+        if not latencies:
+            return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+        values = np.asarray(latencies) * 1000
+        return {
+            "mean_ms": round(float(values.mean()), 3),
+            "p50_ms": round(float(np.percentile(values, 50)), 3),
+            "p95_ms": round(float(np.percentile(values, 95)), 3)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Mengambil statistik evaluasi shadow model
+
+        Returns:
+            Dictionary berisi jumlah request (disalin, disampel, dibuang, gagal),
+            jumlah baris yang dievaluasi, agreement rate (%), confusion matrix
+            {label produksi: {label shadow: jumlah}} dan latency setiap model
+        """
+        with self._stats_lock:
+            confusion = self._confusion.copy()
+            evaluated = int(confusion.sum())
+            agreement = int(np.trace(confusion))
+            labels = [LABEL_MAP[index] for index in range(self._num_classes)]
+            return {
+                "shadow_model": self.model_path,
+                "submitted": self._submitted,
+                "sampled": self._sampled,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "queue_depth": self._queue.qsize(),
+                "evaluated": evaluated,
+                "agreement_rate": round(agreement / evaluated * 100, 2) if evaluated else 0,
+                "confusion": {
+                    primary: {shadow: int(confusion[i, j]) for j, shadow in enumerate(labels)}
+                    for i, primary in enumerate(labels)
+                },
+                "primary_latency": self._latency_summary(self._primary_latency),
+                "shadow_latency": self._latency_summary(self._shadow_latency)
+            }
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Menghentikan worker thread setelah antrian selesai dan mengirim statistik terakhir
+
+        Tidak pernah menunggu antrian penuh: jika tidak ada tempat untuk penanda
+        berhenti, sampel terlama dibuang (dihitung sebagai dropped), sama
+        seperti submit saat antrian penuh.
+        """
+        with self._lifecycle_lock:
+            if self._closed:
+                return
+            self._closed = True
+            while True:
+                try:
+                    self._queue.put_nowait(_STOP)
+                    break
+                except queue.Full:
+                    pass
+                try:
+                    self._queue.get_nowait()
+                    with self._stats_lock:
+                        self._dropped += 1
+                except queue.Empty:
+                    pass
+        self._worker.join(timeout)
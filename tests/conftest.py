@@ -0,0 +1,12 @@
+"""
+Fixture bersama untuk test yang membutuhkan vocabulary tokenizer
+"""
+import pytest
+
+from preprocessing import load_vocabulary
+
+
+@pytest.fixture(scope="session")
+def vocabulary():
+    """VocabularyEncoder dari models/tokenizer_vocab.json (tanpa TensorFlow)"""
+    return load_vocabulary()
@@ -0,0 +1,140 @@
+"""
+Pengganti gspread lokal (tanpa jaringan) untuk menguji GoogleSheetsStorage
+
+Meniru bagian API gspread yang dipakai aplikasi (Client.open_by_url,
+Spreadsheet.worksheet, Worksheet.append_row/append_rows/get_all_values),
+lengkap dengan latency per request, kuota request per jendela waktu (error
+429 seperti Sheets API) dan injeksi error, sehingga batching dan retry/backoff
+bisa diuji offline:
+
+    from tests.fake_gspread import FakeSpreadsheet
+
+    sheet = FakeSpreadsheet(latency=0.05, quota=60, quota_window=60)
+    storage = GoogleSheetsStorage(sheet=sheet)
+"""
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Optional, List
+
+
+class FakeAPIError(Exception):
+    """Setara gspread.exceptions.APIError (kode HTTP di .code dan .response.status_code)"""
+
+    def __init__(self, code: int, message: str = ""):
+        super().__init__(f"APIError [{code}]: {message}")
+        self.code = code
+        self.response = SimpleNamespace(status_code=code)
+
+
+class FakeWorksheetNotFound(Exception):
+    """Setara gspread.exceptions.WorksheetNotFound"""
+
+
+class FakeWorksheet:
+    """Satu worksheet berisi list baris"""
+
+    def __init__(self, spreadsheet: "FakeSpreadsheet", title: str):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows: List[list] = []
+
+    def append_row(self, values: list, value_input_option: str = "RAW", **kwargs):
+        self.spreadsheet._request("append_row")
+        self.rows.append(list(values))
+
+    def append_rows(self, values: List[list], value_input_option: str = "RAW", **kwargs):
+        self.spreadsheet._request("append_rows")
+        self.rows.extend(list(row) for row in values)
+
+    def get_all_values(self) -> List[list]:
+        self.spreadsheet._request("get_all_values")
+        return [list(row) for row in self.rows]
+
+
+class FakeSpreadsheet:
+    """
+    Spreadsheet palsu dengan latency, kuota dan injeksi error
+    """
+
+    def __init__(
+        self,
+        worksheets: tuple = ("predictions", "feedback", "shadow"),
+        latency: float = 0.0,
+        quota: Optional[int] = None,
+        quota_window: float = 60.0
+    ):
+        """
+        Args:
+            worksheets: Nama worksheet yang sudah ada
+            latency: Waktu (detik) setiap request API
+            quota: Jumlah request maksimal per quota_window (None: tanpa batas);
+                request di atas kuota gagal dengan FakeAPIError 429
+            quota_window: Panjang jendela kuota dalam detik
+        """
+        self.latency = latency
+        self.quota = quota
+        self.quota_window = quota_window
+        self._worksheets = {title: FakeWorksheet(self, title) for title in worksheets}
+        self._lock = threading.Lock()
+        self._request_times = deque()
+        self._injected_errors = deque()
+        self.requests = 0
+        self.throttled = 0
+        self.calls = {}
+
+    def fail_next(self, count: int = 1, code: int = 429):
+        """Membuat `count` request berikutnya gagal dengan kode HTTP `code`"""
+        with self._lock:
+            self._injected_errors.extend([code] * count)
+
+    def _request(self, method: str):
+        """Mensimulasikan satu round trip API (latency, kuota, error)"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.requests += 1
+            self.calls[method] = self.calls.get(method, 0) + 1
+
+            if self._injected_errors:
+                raise FakeAPIError(self._injected_errors.popleft(), "injected error")
+
+            if self.quota is not None:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= self.quota_window:
+                    self._request_times.popleft()
+                if len(self._request_times) >= self.quota:
+                    self.throttled += 1
+                    raise FakeAPIError(429, "Quota exceeded for quota metric 'Write requests'")
+                self._request_times.append(now)
+
+    def values(self, title: str) -> List[list]:
+        """Isi worksheet untuk pemeriksaan di pengujian (tidak dihitung sebagai request)"""
+        return [list(row) for row in self._worksheets[title].rows]
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self._request("worksheet")
+        try:
+            return self._worksheets[title]
+        except KeyError:
+            raise FakeWorksheetNotFound(title) from None
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26) -> FakeWorksheet:
+        self._request("add_worksheet")
+        worksheet = self._worksheets.setdefault(title, FakeWorksheet(self, title))
+        return worksheet
+
+
+class FakeClient:
+    """Setara gspread.Client: setiap URL dipetakan ke satu FakeSpreadsheet"""
+
+    def __init__(self, **spreadsheet_kwargs):
+        self.spreadsheet_kwargs = spreadsheet_kwargs
+        self._spreadsheets = {}
+
+    def open_by_url(self, url: str) -> FakeSpreadsheet:
+        if url not in self._spreadsheets:
+            self._spreadsheets[url] = FakeSpreadsheet(**self.spreadsheet_kwargs)
+        return self._spreadsheets[url]
@@ -0,0 +1,95 @@
+"""
+Cascade: simpan/muat klasifier tahap pertama dan pembagian baris berdasarkan
+threshold confidence
+"""
+import numpy as np
+import pytest
+
+from cascade import CascadeClassifier, HashedLinearClassifier
+from config import MAX_LEN, NUM_CLASSES
+
+CONFIDENT_ID = 5
+
+
+def sequences(ids_per_row):
+    padded = np.zeros((len(ids_per_row), MAX_LEN), dtype=np.int32)
+    for row, ids in enumerate(ids_per_row):
+        padded[row, :len(ids)] = ids
+    return padded
+
+
+def separable_data(n: int = 300, seed: int = 0):
+    """Kelas ditentukan oleh id kata penanda (10, 20, 30) di posisi acak"""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, NUM_CLASSES, size=n)
+    rows = []
+    for label in labels:
+        ids = list(rng.integers(100, 200, size=rng.integers(3, 12)))
+        ids.insert(int(rng.integers(0, len(ids) + 1)), 10 * (label + 1))
+        rows.append(ids)
+    return sequences(rows), labels
+
+
+@pytest.fixture(scope="module")
+def trained():
+    padded, labels = separable_data()
+    return HashedLinearClassifier().fit(padded, labels, epochs=5, learning_rate=0.5), padded, labels
+
+
+def test_fit_learns_separable_data(trained):
+    classifier, padded, labels = trained
+    assert (classifier.predict_proba(padded).argmax(axis=1) == labels).mean() > 0.95
+
+
+def test_save_load_round_trip(trained, tmp_path):
+    classifier, padded, _ = trained
+    path = classifier.save(str(tmp_path / "cascade.npz"))
+    loaded = HashedLinearClassifier.load(path)
+
+    assert (loaded.vocab_size, loaded.hash_buckets) == (classifier.vocab_size, classifier.hash_buckets)
+    np.testing.assert_array_equal(loaded.weights, classifier.weights)
+    np.testing.assert_array_equal(loaded.bias, classifier.bias)
+    np.testing.assert_array_equal(loaded.predict_proba(padded), classifier.predict_proba(padded))
+
+
+def confident_classifier() -> HashedLinearClassifier:
+    """Yakin (kelas Negatif) hanya untuk baris yang berisi CONFIDENT_ID"""
+    classifier = HashedLinearClassifier()
+    classifier.weights[CONFIDENT_ID, 0] = 10.0
+    return classifier
+
+
+class RecordingNeural:
+    """Fungsi prediksi neural yang mencatat baris yang diteruskan"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, padded_sequences, batch_size=None):
+        self.calls.append(np.array(padded_sequences))
+        prediction = np.zeros((len(padded_sequences), NUM_CLASSES), dtype=np.float32)
+        prediction[:, 2] = 1.0
+        return prediction
+
+
+def test_threshold_routes_uncertain_rows_to_neural():
+    padded = sequences([[CONFIDENT_ID, 7], [7, 8], [CONFIDENT_ID], [9]])
+    neural = RecordingNeural()
+    cascade = CascadeClassifier(confident_classifier(), threshold=0.9)
+
+    prediction = cascade.predict(padded, neural)
+
+    assert len(neural.calls) == 1
+    np.testing.assert_array_equal(neural.calls[0], padded[[1, 3]])
+    assert prediction[[0, 2]].argmax(axis=1).tolist() == [0, 0]
+    np.testing.assert_array_equal(prediction[[1, 3]], neural(padded[[1, 3]]))
+    stats = cascade.get_stats()
+    assert (stats["first_stage"], stats["neural"], stats["first_stage_pct"]) == (2, 2, 50.0)
+
+
+@pytest.mark.parametrize("threshold, neural_rows", [(0.0, 0), (1.01, 3)])
+def test_threshold_extremes(threshold, neural_rows):
+    padded = sequences([[CONFIDENT_ID], [7], [8, 9]])
+    neural = RecordingNeural()
+    CascadeClassifier(confident_classifier(), threshold=threshold).predict(padded, neural)
+    assert sum(len(call) for call in neural.calls) == neural_rows
@@ -0,0 +1,271 @@
+"""
+Perilaku penyimpanan: write-behind writer, retry Google Sheets dan SQLite
+"""
+import csv
+import logging
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import data_storage
+from data_storage import (
+    HISTORY_HEADERS, FeedbackStats, GoogleSheetsStorage, LocalCSVStorage, SQLiteStorage,
+    WriteBehindWriter, prediction_row
+)
+from tests.fake_gspread import FakeAPIError, FakeSpreadsheet
+
+
+def blocking_writer():
+    """write_rows yang tertahan sampai `release` di-set, mencatat semua baris"""
+    release = threading.Event()
+    written = []
+
+    def write_rows(table, rows):
+        release.wait()
+        written.extend(rows)
+        return True
+
+    return write_rows, release, written
+
+
+def test_flush_returns_false_when_queue_stays_full():
+    write_rows, release, written = blocking_writer()
+    writer = WriteBehindWriter(write_rows, max_size=2, batch_size=1, flush_interval=60)
+    try:
+        assert writer.put("predictions", [0])
+        time.sleep(0.05)  # worker mengambil baris pertama lalu tertahan di write_rows
+        assert writer.put("predictions", [1]) and writer.put("predictions", [2])
+        assert not writer.put("predictions", [3])
+
+        start = time.monotonic()
+        assert writer.flush(timeout=0.2) is False
+        assert time.monotonic() - start < 1.0
+    finally:
+        release.set()
+        writer.close(timeout=5)
+    assert written == [[0], [1], [2]]
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_put_does_not_wait_for_flush_on_full_queue():
+    write_rows, release, written = blocking_writer()
+    writer = WriteBehindWriter(write_rows, max_size=2, batch_size=1, flush_interval=60)
+    try:
+        assert writer.put("predictions", [0])
+        time.sleep(0.05)  # worker tertahan di write_rows, antrian lalu dibuat penuh
+        assert writer.put("predictions", [1]) and writer.put("predictions", [2])
+
+        flushing = threading.Thread(target=writer.flush, kwargs={"timeout": 2.0})
+        flushing.start()
+        time.sleep(0.05)  # flush() sedang menunggu antrian penuh
+        start = time.monotonic()
+        assert writer.put("predictions", [3]) is False
+        assert time.monotonic() - start < 0.1
+        assert flushing.is_alive()
+    finally:
+        release.set()
+        flushing.join(timeout=5)
+        writer.close(timeout=5)
+    assert written == [[0], [1], [2]]
+
+
+def test_flush_writes_pending_rows():
+    written = []
+    writer = WriteBehindWriter(lambda table, rows: written.extend(rows) or True, batch_size=100, flush_interval=60)
+    for index in range(10):
+        writer.put("predictions", [index])
+    assert writer.flush(timeout=5)
+    assert len(written) == 10
+    writer.close(timeout=5)
+
+
+def test_flush_racing_close_never_hangs():
+    for _ in range(20):
+        writer = WriteBehindWriter(lambda table, rows: True, flush_interval=60)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(writer.flush(timeout=5)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        writer.close(timeout=5)
+        for thread in threads:
+            thread.join(timeout=6)
+        assert not any(thread.is_alive() for thread in threads)
+        assert results == [True] * 4
+    assert writer.flush() is True
+    assert writer.put("predictions", [0]) is False
+
+
+def sheets_storage(sheet, **kwargs):
+    """GoogleSheetsStorage dengan backoff kecil agar test cepat"""
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.05)
+    return GoogleSheetsStorage(sheet=sheet, **kwargs)
+
+
+def test_sheets_append_retries_quota_errors():
+    sheet = FakeSpreadsheet()
+    storage = sheets_storage(sheet)
+    storage._worksheet("predictions")
+    sheet.fail_next(2, code=429)
+
+    assert storage.append_rows("predictions", [["a"], ["b"]])
+    assert sheet.values("predictions") == [["a"], ["b"]]
+    assert storage.get_stats()["retries"] == 2
+
+
+@pytest.mark.parametrize("code", [500, 503])
+def test_sheets_append_does_not_retry_server_errors(code):
+    sheet = FakeSpreadsheet()
+    storage = sheets_storage(sheet)
+    storage._worksheet("predictions")
+    sheet.fail_next(1, code=code)
+
+    assert storage.append_rows("predictions", [["a"]]) is False
+    assert sheet.calls["append_rows"] == 1
+    assert storage.get_stats()["retries"] == 0
+
+
+def test_sheets_worksheet_lookup_retries_server_errors():
+    sheet = FakeSpreadsheet()
+    storage = sheets_storage(sheet)
+    sheet.fail_next(1, code=503)
+
+    assert storage.append_rows("feedback", [["a"]])
+    assert sheet.calls["worksheet"] == 2
+    assert sheet.values("feedback") == [["a"]]
+
+
+def test_sheets_max_wait_caps_total_backoff():
+    sheet = FakeSpreadsheet()
+    storage = sheets_storage(sheet, max_retries=10, backoff_base=0.2, backoff_max=1.0)
+    storage._worksheet("predictions")
+    sheet.fail_next(10, code=429)
+
+    start = time.monotonic()
+    assert storage.append_rows("predictions", [["a"]], max_wait=0.3) is False
+    assert time.monotonic() - start < 0.6
+    assert sheet.values("predictions") == []
+
+
+def test_sheets_call_raises_original_error_after_retries():
+    sheet = FakeSpreadsheet()
+    storage = sheets_storage(sheet, max_retries=2)
+    sheet.fail_next(3, code=429)
+
+    with pytest.raises(FakeAPIError):
+        storage._call(sheet.worksheet, "predictions")
+    assert sheet.calls["worksheet"] == 3
+
+
+def sqlite_storage(tmp_path):
+    return SQLiteStorage(str(tmp_path / "sentiment.db"))
+
+
+def write_history_csv(path, count):
+    """CSV history berisi `count` baris (teks "baris i", confidence naik)"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HISTORY_HEADERS)
+        for i in range(count):
+            writer.writerow([f"2025-01-01 00:00:{i % 60:02d}", f"baris {i}", f"baris {i}", "Netral",
+                             f"{i:.2f}", "0.00", "100.00", "0.00"])
+
+
+def test_sqlite_history_matches_csv_row_schema(tmp_path):
+    storage = sqlite_storage(tmp_path)
+    result = {'label': "Positif", 'confidence': 90.0,
+              'probabilities': {'Negatif': 5.0, 'Netral': 5.0, 'Positif': 90.0}}
+    row = prediction_row("Makanannya enak", "makanannya enak", result)
+    try:
+        assert storage.save_prediction("Makanannya enak", "makanannya enak", result)
+        history = storage.get_history()
+        assert len(history) == 1
+        assert set(history[0]) == set(HISTORY_HEADERS)
+        assert all(isinstance(value, str) for value in history[0].values())
+        expected = dict(zip(HISTORY_HEADERS, row))
+        del expected['timestamp'], history[0]['timestamp']
+        assert history[0] == expected
+        assert history[0]['confidence'] == "90.00"
+    finally:
+        storage.close()
+
+
+def test_sqlite_min_confidence_compares_numerically(tmp_path):
+    storage = sqlite_storage(tmp_path)
+    csv_path = tmp_path / "history.csv"
+    write_history_csv(csv_path, 120)
+    try:
+        storage.import_csv("predictions", str(csv_path))
+        rows = storage.query_history(min_confidence=100, limit=1000)
+        # Perbandingan string akan menganggap "9.00" >= "100"
+        assert sorted(float(row['confidence']) for row in rows) == [float(i) for i in range(100, 120)]
+    finally:
+        storage.close()
+
+
+def test_sqlite_import_is_chunked_and_resumable(tmp_path):
+    storage = sqlite_storage(tmp_path)
+    csv_path = tmp_path / "history.csv"
+    write_history_csv(csv_path, 25)
+    key = str(csv_path.resolve())
+    try:
+        # Impor yang terputus setelah chunk pertama (10 baris)
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            first_chunk = list(csv.reader(f))[1:11]
+        assert storage._import_chunk("predictions", key, 0, first_chunk, done=False)
+
+        assert storage.import_csv("predictions", str(csv_path), batch_size=10) == 15
+        assert storage.import_csv("predictions", str(csv_path), batch_size=10) == 0
+        texts = sorted(row['original_text'] for row in storage.query_history(limit=100))
+        assert texts == sorted(f"baris {i}" for i in range(25))
+    finally:
+        storage.close()
+
+
+def test_sqlite_import_stops_when_progress_moved(tmp_path):
+    storage = sqlite_storage(tmp_path)
+    csv_path = tmp_path / "history.csv"
+    write_history_csv(csv_path, 5)
+    key = str(csv_path.resolve())
+    try:
+        assert storage._import_chunk("predictions", key, 0, [[""] * len(HISTORY_HEADERS)], done=False)
+        # Offset lama (0) tidak lagi sama dengan progres (1): chunk tidak ditulis
+        assert not storage._import_chunk("predictions", key, 0, [[""] * len(HISTORY_HEADERS)], done=False)
+        assert len(storage.query_history(limit=100)) == 1
+    finally:
+        storage.close()
+
+
+def test_csv_feedback_stats_error_is_logged_with_full_shape(monkeypatch, caplog):
+    def broken_get():
+        raise OSError("file terkunci")
+
+    monkeypatch.setattr(data_storage._feedback_stats, "get", broken_get)
+    with caplog.at_level(logging.WARNING, logger="data_storage"):
+        stats = LocalCSVStorage.get_feedback_stats()
+    assert stats == FeedbackStats.summary(FeedbackStats._empty_state())
+    assert "file terkunci" in caplog.text
+
+
+def test_sqlite_feedback_stats_error_is_logged_with_full_shape(tmp_path, monkeypatch, caplog):
+    storage = sqlite_storage(tmp_path)
+    try:
+        assert storage.save_feedback("enak", "Positif", True)
+        assert storage.get_feedback_stats()["total"] == 1
+
+        def broken_connection():
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(storage, "_connection", broken_connection)
+        with caplog.at_level(logging.WARNING, logger="data_storage"):
+            stats = storage.get_feedback_stats()
+        assert stats == FeedbackStats.summary(FeedbackStats._empty_state())
+        assert "database is locked" in caplog.text
+    finally:
+        monkeypatch.undo()
+        storage.close()
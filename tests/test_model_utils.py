@@ -0,0 +1,98 @@
+"""
+SentimentAnalyzer.explain: label sama dengan predict, kontribusi per kata,
+dan varian oklusi tidak masuk cache prediksi
+"""
+import numpy as np
+import pytest
+
+from backends import InferenceBackend
+from config import MAX_LEN, NUM_CLASSES, VOCAB_SIZE
+from model_utils import SentimentAnalyzer, occlusion_batch
+from prediction_cache import PredictionCache
+
+TEXTS = [
+    "Program makan bergizi gratis sangat membantu anak-anak sekolah!",
+    "makanannya basi dan tidak layak, kecewa banget",
+    "MBG biasa saja sih",
+]
+
+
+class FakeBackend(InferenceBackend):
+    """Backend deterministik: softmax dari jumlah bobot acak per token"""
+
+    name = "fake"
+
+    def __init__(self, seed: int = 0):
+        self.weights = np.random.default_rng(seed).normal(size=(VOCAB_SIZE, NUM_CLASSES))
+        self.weights[0] = 0
+        self.rows = 0
+
+    def predict(self, padded_sequences, batch_size=None):
+        self.rows += len(padded_sequences)
+        logits = self.weights[np.asarray(padded_sequences)].sum(axis=1)
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return (exp / exp.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+class ConstantCascade:
+    """Cascade yang selalu menjawab Negatif di tahap pertama"""
+
+    def predict(self, padded_sequences, predict_neural, batch_size=None):
+        prediction = np.zeros((len(padded_sequences), NUM_CLASSES), dtype=np.float32)
+        prediction[:, 0] = 1.0
+        return prediction
+
+
+def make_analyzer(vocabulary, **kwargs) -> SentimentAnalyzer:
+    """SentimentAnalyzer dengan FakeBackend, tanpa cache prediksi kecuali diberikan"""
+    prediction_cache = kwargs.pop("prediction_cache", None)
+    analyzer = SentimentAnalyzer(model=FakeBackend(), tokenizer=vocabulary, lexicon_cache_path=None, **kwargs)
+    analyzer.prediction_cache = prediction_cache
+    return analyzer
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_explain_matches_predict_and_contribution_shape(vocabulary, text):
+    analyzer = make_analyzer(vocabulary)
+    expected = analyzer.predict(text)
+    result = analyzer.explain(text)
+
+    assert result['label'] == expected['label']
+    assert result['probabilities'] == expected['probabilities']
+    words = result['cleaned_text'].split()
+    assert [item['word'] for item in result['explanation']] == words
+
+    ids = analyzer.get_lexicon().encoder.words_to_ids(words)
+    contributions = [item['contributions'] for item in result['explanation'] if item['contributions']]
+    assert len(contributions) == min(len(ids), MAX_LEN)
+    for item in contributions:
+        assert set(item) == set(expected['probabilities'])
+
+    # Kontribusi = probabilitas asli - probabilitas tanpa token
+    probabilities = FakeBackend().predict(occlusion_batch(ids)).astype(np.float64)
+    np.testing.assert_allclose(
+        [list(item.values()) for item in contributions],
+        (probabilities[0] - probabilities[1:]) * 100, atol=1e-4
+    )
+
+
+def test_explain_label_follows_cascade(vocabulary):
+    analyzer = make_analyzer(vocabulary, cascade=ConstantCascade())
+    for text in TEXTS:
+        assert analyzer.explain(text)['label'] == analyzer.predict(text)['label'] == "Negatif"
+
+
+def test_explain_trace_matches_predict_trace(vocabulary):
+    analyzer = make_analyzer(vocabulary)
+    result = analyzer.explain(TEXTS[0], trace=True)
+    expected = analyzer.predict(TEXTS[0], trace=True)
+    assert result['preprocessing_steps'] == expected['preprocessing_steps']
+    assert result['label'] == expected['label']
+
+
+def test_explain_does_not_fill_prediction_cache(vocabulary):
+    cache = PredictionCache(capacity=100, ttl=None)
+    analyzer = make_analyzer(vocabulary, prediction_cache=cache)
+    analyzer.explain(TEXTS[0])
+    # Hanya sequence asli (lewat predict) yang masuk cache, bukan varian oklusi
+    assert cache.get_stats()["size"] == 1
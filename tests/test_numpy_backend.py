@@ -0,0 +1,128 @@
+"""
+Paritas backend NumPy (NumpyBiGRUModel) dengan model Keras, dan paritas
+prediksi dengan/tanpa bucketing panjang
+"""
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from config import MAX_LEN, MODEL_PATH
+
+keras = pytest.importorskip("keras")
+pytest.importorskip("h5py")
+
+from numpy_backend import NumpyBiGRUModel, export_keras_to_npz, load_numpy_model  # noqa: E402
+from preprocessing import file_sha256  # noqa: E402
+
+VOCAB = 500
+TOLERANCE = 1e-5
+
+
+def random_sequences(n: int, vocab: int = VOCAB, seed: int = 0) -> np.ndarray:
+    """Sequence ber-padding di akhir dengan panjang acak 0..MAX_LEN"""
+    rng = np.random.default_rng(seed)
+    padded = np.zeros((n, MAX_LEN), dtype=np.int32)
+    for row, length in enumerate(rng.integers(0, MAX_LEN + 1, size=n)):
+        padded[row, :length] = rng.integers(1, vocab, size=length)
+    return padded
+
+
+def build_model(variant: str):
+    """Model kecil dengan arsitektur seperti model produksi (dan varian ber-mask)"""
+    from keras import layers
+
+    keras.utils.set_random_seed(0)
+    if variant == "bigru":
+        body = [
+            layers.Embedding(VOCAB, 16),
+            layers.Bidirectional(layers.GRU(8)),
+            layers.Dropout(0.2),
+            layers.Dense(8, activation="relu"),
+        ]
+    else:
+        body = [
+            layers.Embedding(VOCAB, 16, mask_zero=True),
+            layers.Bidirectional(layers.GRU(8, return_sequences=True)),
+            layers.GlobalMaxPooling1D(),
+        ]
+    model = keras.Sequential([layers.Input((MAX_LEN,), dtype="int32"), *body, layers.Dense(3, activation="softmax")])
+    model.build((None, MAX_LEN))
+    return model
+
+
+@pytest.fixture(scope="module", params=["bigru", "masked-maxpool"])
+def models(request, tmp_path_factory):
+    """(model Keras, path .npz hasil export, NumpyBiGRUModel) untuk setiap varian"""
+    tmp = tmp_path_factory.mktemp(request.param)
+    model = build_model(request.param)
+    keras_path = str(tmp / "model.keras")
+    model.save(keras_path)
+    npz_path = export_keras_to_npz(keras_path, str(tmp / "weights.npz"))
+    return model, npz_path, NumpyBiGRUModel.load(npz_path, mmap=False)
+
+
+def test_numpy_matches_keras(models):
+    model, _, numpy_model = models
+    padded = random_sequences(200)
+    expected = model.predict(padded, verbose=0)
+    np.testing.assert_allclose(numpy_model.predict(padded, batch_size=64), expected, atol=TOLERANCE)
+
+
+def test_mmap_weights_match_copied_weights(models):
+    _, npz_path, numpy_model = models
+    padded = random_sequences(50, seed=1)
+    mapped = NumpyBiGRUModel.load(npz_path, mmap=True)
+    np.testing.assert_array_equal(mapped.predict(padded), numpy_model.predict(padded))
+
+
+def test_bucketing_matches_full_width(models):
+    _, _, numpy_model = models
+    padded = random_sequences(300, seed=2)
+    full = numpy_model.predict(padded, batch_size=32, bucketing=False)
+    bucketed = numpy_model.predict(padded, batch_size=32, bucketing=True)
+    np.testing.assert_array_equal(bucketed, full)
+
+
+def test_concurrent_predict_matches_sequential(models):
+    _, _, numpy_model = models
+    batches = [random_sequences(40, seed=seed) for seed in range(8)]
+    expected = [numpy_model.predict(batch) for batch in batches]
+    fresh = NumpyBiGRUModel(numpy_model.spec, numpy_model.weights)
+    results = [None] * len(batches)
+
+    def run(index):
+        results[index] = fresh.predict(batches[index])
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(len(batches))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for result, reference in zip(results, expected):
+        np.testing.assert_array_equal(result, reference)
+
+
+def test_load_numpy_model_reexports_only_for_a_different_source(models, tmp_path):
+    model, npz_path, _ = models
+    keras_path = str(tmp_path / "model.keras")
+    model.save(keras_path)
+
+    # .npz dengan hash sumber berbeda diekspor ulang dari .keras
+    stale = load_numpy_model(npz_path, keras_path, mmap=False)
+    assert stale.source_sha256 == file_sha256(keras_path)
+
+    # .npz yang sesuai dipakai apa adanya, juga jika .keras tidak ada
+    mtime = os.path.getmtime(npz_path)
+    assert load_numpy_model(npz_path, keras_path, mmap=False).source_sha256 == file_sha256(keras_path)
+    assert os.path.getmtime(npz_path) == mtime
+    assert load_numpy_model(npz_path, str(tmp_path / "missing.keras"), mmap=False).spec == stale.spec
+
+
+@pytest.mark.skipif(not os.path.exists(MODEL_PATH), reason=f"{MODEL_PATH} tidak tersedia")
+def test_numpy_matches_production_model(tmp_path):
+    model = keras.models.load_model(MODEL_PATH, compile=False)
+    numpy_model = NumpyBiGRUModel.load(export_keras_to_npz(MODEL_PATH, str(tmp_path / "weights.npz")), mmap=False)
+    padded = random_sequences(100, vocab=1000, seed=3)
+    np.testing.assert_allclose(numpy_model.predict(padded), model.predict(padded, verbose=0), atol=TOLERANCE)
@@ -0,0 +1,55 @@
+"""
+PredictionCache: salinan entri, lookup tanpa akses file, dan clear
+"""
+import numpy as np
+
+from prediction_cache import PredictionCache, row_key
+
+
+def test_put_stores_a_copy_of_the_row():
+    cache = PredictionCache(capacity=10, ttl=None)
+    batch = np.array([[0.1, 0.2, 0.7], [0.3, 0.3, 0.4]], dtype=np.float32)
+    cache.put(b"a", batch[0])
+
+    batch[0] = 0
+    stored = cache.get(b"a")
+    np.testing.assert_array_equal(stored, np.float32([0.1, 0.2, 0.7]))
+    assert stored.base is None
+
+
+def test_predict_entries_do_not_keep_the_batch_alive():
+    cache = PredictionCache(capacity=10, ttl=None)
+    padded = np.array([[1, 2, 0], [3, 4, 0], [1, 2, 0]], dtype=np.int32)
+    computed = []
+
+    def predict_fn(rows, batch_size):
+        output = np.tile(np.array([0.2, 0.3, 0.5], dtype=np.float32), (len(rows), 1))
+        computed.append(output)
+        return output
+
+    result = cache.predict(padded, predict_fn)
+    assert len(computed[0]) == 2  # baris duplikat dihitung sekali
+    computed[0][:] = -1
+
+    np.testing.assert_array_equal(result, np.tile(np.float32([0.2, 0.3, 0.5]), (3, 1)))
+    np.testing.assert_array_equal(cache.get(row_key(padded[1])), np.float32([0.2, 0.3, 0.5]))
+
+
+def test_lookup_does_not_touch_the_filesystem(monkeypatch):
+    cache = PredictionCache(capacity=10, ttl=None)
+    cache.put(b"a", np.float32([0.2, 0.3, 0.5]))
+
+    def no_stat(*args, **kwargs):
+        raise AssertionError("os.stat dipanggil di jalur lookup")
+
+    monkeypatch.setattr("os.stat", no_stat)
+    assert cache.get(b"a") is not None
+    assert cache.get(b"b") is None
+
+
+def test_clear_empties_cache_and_counts_invalidation():
+    cache = PredictionCache(capacity=10, ttl=None)
+    cache.put(b"a", np.float32([0.2, 0.3, 0.5]))
+    cache.clear()
+    assert cache.get(b"a") is None
+    assert cache.get_stats()["invalidations"] == 1
@@ -0,0 +1,68 @@
+"""
+Paritas TextPreprocessor.preprocess (satu lintasan) dengan pipeline bertahap
+get_preprocessing_steps()
+"""
+import random
+
+import pytest
+
+from config import EXAMPLE_COMMENTS
+from preprocessing import TextPreprocessor, default_preprocessor
+
+TRICKY_TEXTS = [
+    "",
+    "   ",
+    "!!! ??? ... 😊👍",
+    "Program MBG sangat membantu anak-anak Indonesia",
+    "PROGRAM mbg BAGUS bgt!!! https://t.co/abc123 @prabowo #MBG",
+    "cek www.detik.com/mbg/berita?id=12 dan http://x.co",
+    "@user1@user2 #tag#tag2 email@contoh.com",
+    "yg gak gpp udh krn tdk dgn",
+    "gpp kok, ndakjadi makan",
+    "2025 tahun ke-2 makan3x sehari 100%",
+    "kata_kata it's rock'n'roll a-b-c",
+    "tab\tbaris\nbaru\r\nspasi    banyak",
+    "café naïve résumé ñandú",
+    "a b c d e f g ab cd",
+    "httpsbukan url tapi kata",
+    "#",
+    "@",
+    "Yg MBG Gak JELAS",
+]
+
+
+def make_texts(n: int, seed: int = 7) -> list:
+    """Komentar sintetis: contoh komentar disisipi URL, mention, angka dan singkatan"""
+    rng = random.Random(seed)
+    noise = [
+        "https://t.co/x1", "www.mbg.id/a", "@pejabat", "#MBG", "yg", "gak", "gpp",
+        "bgt", "udh", "2025", "!!!", "...", "😊", "Ke-2", "a", "OK"
+    ]
+    texts = []
+    for _ in range(n):
+        words = rng.choice(EXAMPLE_COMMENTS).split()
+        for _ in range(rng.randint(0, 6)):
+            words.insert(rng.randint(0, len(words)), rng.choice(noise))
+        texts.append(" ".join(w.upper() if rng.random() < 0.1 else w for w in words))
+    return texts
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS + make_texts(200))
+def test_preprocess_matches_stepwise_pipeline(text):
+    expected = default_preprocessor.get_preprocessing_steps(text)['final']
+    assert default_preprocessor.preprocess(text) == expected
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+def test_tokenize_matches_first_four_steps(text):
+    expected = default_preprocessor.get_preprocessing_steps(text)['4_remove_extra_whitespace'].split()
+    assert default_preprocessor.tokenize(text) == expected
+
+
+def test_custom_dictionaries_match_stepwise_pipeline():
+    preprocessor = TextPreprocessor(
+        norm_dict={"mkn": "makan siang", "gpp": "tidak apa apa", "x": "dan"},
+        stop_words={"dan", "apa"}
+    )
+    for text in ["mkn gpp x minum", "GPP mkn", "x x x", "mkn2 gpp!"]:
+        assert preprocessor.preprocess(text) == preprocessor.get_preprocessing_steps(text)['final']
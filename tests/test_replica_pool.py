@@ -0,0 +1,84 @@
+"""
+ReplicaPool: setiap request paralel meminjam replika sendiri
+"""
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from backends import InferenceBackend
+from config import MAX_LEN, NUM_CLASSES
+from replica_pool import ReplicaPool
+
+
+class TrackingBackend(InferenceBackend):
+    """Replika yang mencatat jumlah pemakaian bersamaan"""
+
+    name = "tracking"
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def __init__(self, index: int, barrier: threading.Barrier = None):
+        self.index = index
+        self.barrier = barrier
+        self.in_use = False
+
+    def predict(self, padded_sequences, batch_size=None):
+        assert not self.in_use, "replika dipakai dua request sekaligus"
+        self.in_use = True
+        with TrackingBackend.lock:
+            TrackingBackend.active += 1
+            TrackingBackend.max_active = max(TrackingBackend.max_active, TrackingBackend.active)
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        with TrackingBackend.lock:
+            TrackingBackend.active -= 1
+        self.in_use = False
+        return np.full((len(padded_sequences), NUM_CLASSES), self.index, dtype=np.float32)
+
+
+def test_parallel_requests_use_separate_replicas():
+    size = 3
+    barrier = threading.Barrier(size)
+    pool = ReplicaPool([TrackingBackend(index, barrier) for index in range(size)])
+    TrackingBackend.max_active = 0
+    results = [None] * size
+
+    def run(slot):
+        results[slot] = pool.predict(np.zeros((1, MAX_LEN), dtype=np.int32))[0, 0]
+
+    threads = [threading.Thread(target=run, args=(slot,)) for slot in range(size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert TrackingBackend.max_active == size
+    assert sorted(results) == list(range(size))
+    stats = pool.get_stats()
+    assert (stats["idle"], stats["checkouts"]) == (size, size)
+
+
+def test_checkout_waits_for_checkin():
+    pool = ReplicaPool([TrackingBackend(0)])
+    replica = pool.checkout()
+    with pytest.raises(queue.Empty):
+        pool.checkout(timeout=0.05)
+
+    borrowed = []
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.checkout(timeout=5)))
+    waiter.start()
+    time.sleep(0.05)
+    pool.checkin(replica)
+    waiter.join(timeout=5)
+
+    assert borrowed == [replica]
+    assert pool.get_stats()["waits"] == 1
+
+
+def test_empty_pool_is_rejected():
+    with pytest.raises(ValueError):
+        ReplicaPool([])
@@ -0,0 +1,92 @@
+"""
+MicroBatchScheduler: penggabungan request menjadi batch, pengiriman hasil ke
+Future yang benar, dan penolakan request setelah close
+"""
+import numpy as np
+import pytest
+
+from scheduler import MicroBatchScheduler
+from tests.test_model_utils import TEXTS, make_analyzer
+
+MANY_TEXTS = [f"{text} {index}" for index in range(4) for text in TEXTS]
+
+
+def test_requests_are_batched_and_routed(vocabulary):
+    analyzer = make_analyzer(vocabulary)
+    scheduler = MicroBatchScheduler(analyzer, max_batch_size=len(MANY_TEXTS), max_wait_ms=500)
+    try:
+        futures = [scheduler.submit(text) for text in MANY_TEXTS]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        scheduler.close(timeout=5)
+
+    for text, result in zip(MANY_TEXTS, results):
+        expected = analyzer.predict(text)
+        assert result['cleaned_text'] == expected['cleaned_text']
+        assert result['label'] == expected['label']
+        for label, value in expected['probabilities'].items():
+            assert result['probabilities'][label] == pytest.approx(value, abs=1e-3)
+
+    stats = scheduler.get_stats()
+    assert stats["total_requests"] == len(MANY_TEXTS)
+    assert stats["total_batches"] < len(MANY_TEXTS)
+    assert max(stats["batch_size_histogram"]) > 1
+
+
+def test_batch_respects_max_batch_size(vocabulary):
+    scheduler = MicroBatchScheduler(make_analyzer(vocabulary), max_batch_size=3, max_wait_ms=200)
+    try:
+        futures = [scheduler.submit(text) for text in MANY_TEXTS]
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        scheduler.close(timeout=5)
+    assert max(scheduler.get_stats()["batch_size_histogram"]) <= 3
+
+
+def test_trace_steps_are_returned_per_request(vocabulary):
+    analyzer = make_analyzer(vocabulary)
+    scheduler = MicroBatchScheduler(analyzer, max_wait_ms=50)
+    try:
+        result = scheduler.predict(TEXTS[0], trace=True)
+    finally:
+        scheduler.close(timeout=5)
+    assert result['preprocessing_steps'] == analyzer.predict(TEXTS[0], trace=True)['preprocessing_steps']
+
+
+def test_backend_error_fails_every_future_in_batch(vocabulary):
+    analyzer = make_analyzer(vocabulary)
+
+    def broken_predict(padded_sequences, batch_size=None):
+        raise ValueError("backend rusak")
+
+    analyzer.backend.predict = broken_predict
+    scheduler = MicroBatchScheduler(analyzer, max_wait_ms=100)
+    try:
+        futures = [scheduler.submit(text) for text in TEXTS]
+        for future in futures:
+            with pytest.raises(ValueError, match="backend rusak"):
+                future.result(timeout=5)
+    finally:
+        scheduler.close(timeout=5)
+
+
+def test_submit_after_close_raises(vocabulary):
+    scheduler = MicroBatchScheduler(make_analyzer(vocabulary), num_workers=2)
+    scheduler.close(timeout=5)
+    scheduler.close(timeout=5)
+    assert not scheduler.is_ready()
+    with pytest.raises(RuntimeError, match="ditutup"):
+        scheduler.submit(TEXTS[0])
+
+
+def test_explain_label_matches_scheduler_predict(vocabulary):
+    scheduler = MicroBatchScheduler(make_analyzer(vocabulary), max_wait_ms=10)
+    try:
+        for text in TEXTS:
+            result = scheduler.explain(text)
+            assert result['label'] == scheduler.predict(text)['label']
+            assert len(result['explanation']) == len(result['cleaned_text'].split())
+    finally:
+        scheduler.close(timeout=5)
+    assert np.isclose(sum(result['probabilities'].values()), 100, atol=0.1)
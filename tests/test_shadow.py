@@ -0,0 +1,123 @@
+"""
+ShadowEvaluator: sampling, drop-on-full, close tanpa menunggu, dan latency
+produksi yang dikirim dari SentimentAnalyzer.predict_proba
+"""
+import logging
+import threading
+import time
+
+import numpy as np
+
+from backends import InferenceBackend
+from config import MAX_LEN, NUM_CLASSES
+from prediction_cache import PredictionCache
+from shadow import ShadowEvaluator
+from tests.test_model_utils import FakeBackend, make_analyzer
+
+
+class BlockingBackend(InferenceBackend):
+    """Backend yang tertahan sampai `release` di-set"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def predict(self, padded_sequences, batch_size=None):
+        self.started.set()
+        self.release.wait()
+        return np.full((len(padded_sequences), NUM_CLASSES), 1 / NUM_CLASSES, dtype=np.float32)
+
+
+def request(rows: int = 1):
+    padded = np.ones((rows, MAX_LEN), dtype=np.int32)
+    prediction = np.tile(np.float32([0.1, 0.2, 0.7]), (rows, 1))
+    return padded, prediction
+
+
+def test_full_queue_drops_without_waiting():
+    backend = BlockingBackend()
+    shadow = ShadowEvaluator(backend, queue_size=2, sample_rate=1.0)
+    try:
+        assert shadow.submit(*request())
+        assert backend.started.wait(5)  # worker tertahan, antrian lalu diisi penuh
+        assert shadow.submit(*request()) and shadow.submit(*request())
+
+        start = time.monotonic()
+        assert shadow.submit(*request()) is False
+        assert time.monotonic() - start < 0.1
+        stats = shadow.get_stats()
+        assert (stats["submitted"], stats["sampled"], stats["dropped"]) == (4, 3, 1)
+    finally:
+        backend.release.set()
+        shadow.close(timeout=5)
+
+
+def test_sampling_rate_controls_queued_requests():
+    shadow = ShadowEvaluator(FakeBackend(), sample_rate=0.0)
+    assert not any(shadow.submit(*request()) for _ in range(50))
+    shadow.close(timeout=5)
+    stats = shadow.get_stats()
+    assert (stats["submitted"], stats["sampled"], stats["evaluated"]) == (50, 0, 0)
+
+    shadow = ShadowEvaluator(FakeBackend(), sample_rate=1.0)
+    assert all(shadow.submit(*request(2)) for _ in range(10))
+    shadow.close(timeout=5)
+    assert shadow.get_stats()["evaluated"] == 20
+
+
+def test_close_on_full_queue_does_not_hang():
+    backend = BlockingBackend()
+    shadow = ShadowEvaluator(backend, queue_size=2, sample_rate=1.0)
+    shadow.submit(*request())
+    assert backend.started.wait(5)
+    shadow.submit(*request())
+    shadow.submit(*request())
+
+    start = time.monotonic()
+    shadow.close(timeout=0)
+    assert time.monotonic() - start < 0.5
+    assert shadow.submit(*request()) is False
+
+    backend.release.set()
+    shadow._worker.join(timeout=5)
+    assert not shadow._worker.is_alive()
+    assert shadow.get_stats()["dropped"] == 1
+
+
+def test_sink_failure_is_logged(caplog):
+    def failing_sink(stats):
+        raise OSError("disk penuh")
+
+    shadow = ShadowEvaluator(FakeBackend(), sample_rate=1.0, sink=failing_sink)
+    shadow.submit(*request())
+    with caplog.at_level(logging.WARNING, logger="shadow"):
+        shadow.close(timeout=5)
+    assert "disk penuh" in caplog.text
+
+
+class RecordingShadow:
+    """Pengganti ShadowEvaluator yang mencatat latency produksi"""
+
+    def __init__(self):
+        self.latencies = []
+
+    def submit(self, padded_sequences, primary_prediction, primary_latency=None):
+        self.latencies.append(primary_latency)
+        return True
+
+
+def test_primary_latency_only_for_full_backend_passes(vocabulary):
+    shadow = RecordingShadow()
+    analyzer = make_analyzer(vocabulary, shadow=shadow, prediction_cache=PredictionCache(ttl=None))
+    analyzer.predict("makanannya enak sekali")
+    analyzer.predict("makanannya enak sekali")  # dijawab cache
+
+    assert shadow.latencies[0] is not None and shadow.latencies[0] > 0
+    assert shadow.latencies[1] is None
+
+
+def test_explain_submits_only_the_original_request(vocabulary):
+    shadow = RecordingShadow()
+    analyzer = make_analyzer(vocabulary, shadow=shadow)
+    analyzer.explain("makanannya enak tapi porsinya kecil")
+    assert len(shadow.latencies) == 1
@@ -0,0 +1,64 @@
+"""
+Paritas tokenisasi NumPy (VocabularyEncoder, CompiledLexicon, vocabulary JSON)
+dengan Keras Tokenizer.texts_to_sequences + pad_sequences
+"""
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from config import MAX_LEN, TOKENIZER_PATH
+from preprocessing import CompiledLexicon, VocabularyEncoder, default_preprocessor, get_encoder
+from tests.test_preprocessing import TRICKY_TEXTS, make_texts
+
+RAW_TEXTS = TRICKY_TEXTS + make_texts(300) + [
+    # Lebih panjang dari MAX_LEN: pemotongan harus sama (truncating='post')
+    " ".join(["program makan bergizi gratis sangat membantu"] * 20)
+]
+
+
+@pytest.fixture(scope="module")
+def tokenizer():
+    pytest.importorskip("tensorflow")
+    if not os.path.exists(TOKENIZER_PATH):
+        pytest.skip(f"{TOKENIZER_PATH} tidak tersedia")
+    with open(TOKENIZER_PATH, 'rb') as handle:
+        return pickle.load(handle)
+
+
+@pytest.fixture(scope="module")
+def texts(tokenizer):
+    """Teks bersih, ditambah kata di luar VOCAB_SIZE agar pemetaan OOV ikut diuji"""
+    cleaned = [default_preprocessor.preprocess(text) for text in RAW_TEXTS]
+    num_words = get_encoder(tokenizer).num_words
+    rare = [word for word, index in tokenizer.word_index.items() if index >= num_words][:50]
+    return cleaned + [" ".join(rare), "kata_tidak_dikenal sama sekali xyzabc"]
+
+
+def keras_encode(tokenizer, texts):
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+    return pad_sequences(
+        tokenizer.texts_to_sequences(texts), maxlen=MAX_LEN, padding='post', truncating='post'
+    )
+
+
+def test_encoder_matches_keras(tokenizer, texts):
+    encoded = get_encoder(tokenizer).encode_batch(texts)
+    assert encoded.dtype == np.int32
+    assert encoded.shape == (len(texts), MAX_LEN)
+    np.testing.assert_array_equal(encoded, keras_encode(tokenizer, texts))
+
+
+def test_vocabulary_json_roundtrip_matches_keras(tokenizer, texts, tmp_path):
+    path = get_encoder(tokenizer).save(str(tmp_path / "tokenizer_vocab.json"))
+    np.testing.assert_array_equal(
+        VocabularyEncoder.load(path).encode_batch(texts), keras_encode(tokenizer, texts)
+    )
+
+
+def test_compiled_lexicon_matches_preprocess_then_keras(tokenizer):
+    lexicon = CompiledLexicon.load_or_build(default_preprocessor, tokenizer, cache_path=None)
+    cleaned, padded = lexicon.process_batch(RAW_TEXTS)
+    assert cleaned == [default_preprocessor.preprocess(text) for text in RAW_TEXTS]
+    np.testing.assert_array_equal(padded, keras_encode(tokenizer, cleaned))
@@ -1,6 +1,5 @@
+import html
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 from typing import Dict, Any
 
 from config import LABEL_EMOJI, LABEL_COLORS, EXAMPLE_COMMENTS
@@ -161,6 +160,20 @@ def apply_custom_css():
         font-size: clamp(0.8rem, 2vw, 1rem) !important;
     }
     
+    /* ==================== EXPLANATION ==================== */
+    .explain-box {
+        line-height: 2.2;
+        font-size: clamp(0.95rem, 2.5vw, 1.1rem);
+    }
+    .explain-word {
+        padding: 0.15rem 0.35rem;
+        border-radius: 6px;
+        margin-right: 0.15rem;
+    }
+    .explain-oov {
+        opacity: 0.5;
+    }
+    
     /* ==================== RESPONSIVE COLUMNS ==================== */
     @media (max-width: 768px) {
         [data-testid="column"] {
@@ -419,6 +432,10 @@ def render_preprocessing_details(original_text: str, result: Dict[str, Any]):
 
 def render_probability_chart(result: Dict[str, Any]):
     """Menampilkan bar chart probabilitas"""
+    # Lazy import: pandas & plotly hanya dimuat saat hasil ditampilkan
+    import pandas as pd
+    import plotly.express as px
+    
     st.markdown("#### 📊 Distribusi Probabilitas")
     
     prob_data = pd.DataFrame({
@@ -489,6 +506,48 @@ def render_probability_metrics(result: Dict[str, Any]):
         )
 
 
+def render_explanation(result: Dict[str, Any]):
+    """
+    Menampilkan teks dengan highlight kontribusi setiap kata
+    
+    Warna mengikuti kelas yang paling dinaikkan oleh kata tersebut, intensitas
+    sebanding dengan besar kontribusinya. Detail per kelas tampil sebagai tooltip.
+    """
+    explanation = result.get('explanation')
+    if not explanation:
+        return
+    
+    strongest = max(
+        (max(item['contributions'].values()) for item in explanation if item['contributions']),
+        default=0.0
+    )
+    
+    spans = []
+    for item in explanation:
+        word = html.escape(item['word'])
+        contributions = item['contributions']
+        if contributions is None:
+            spans.append(f'<span class="explain-word explain-oov" title="Tidak dikenali model">{word}</span>')
+            continue
+        
+        label = max(contributions, key=contributions.get)
+        value = contributions[label]
+        alpha = int(min(1.0, value / strongest) * 200) if strongest > 0 and value > 0 else 0
+        tooltip = " | ".join(f"{name}: {delta:+.2f}%" for name, delta in contributions.items())
+        spans.append(
+            f'<span class="explain-word" style="background-color: {LABEL_COLORS[label]}{alpha:02x};" '
+            f'title="{tooltip}">{word}</span>'
+        )
+    
+    st.markdown("#### 🔍 Kata yang Mempengaruhi Prediksi")
+    st.markdown(f'<div class="explain-box">{" ".join(spans)}</div>', unsafe_allow_html=True)
+    st.caption(
+        "Warna menunjukkan kelas yang paling dinaikkan oleh kata tersebut "
+        "(🔴 Negatif, ⚪ Netral, 🟢 Positif); semakin pekat semakin besar pengaruhnya. "
+        "Arahkan kursor ke kata untuk melihat perubahan probabilitas jika kata dihapus."
+    )
+
+
 def render_wordcloud(cleaned_text: str):
     """Menampilkan word cloud"""
     try:
@@ -629,4 +688,5 @@ def render_results(input_text: str, result: Dict[str, Any]):
         render_probability_chart(result)
     
     render_probability_metrics(result)
+    render_explanation(result)
     render_wordcloud(result['cleaned_text'])